@@ -0,0 +1,18 @@
+from django.urls import path
+from . import async_views
+
+# Async routes for the JSON API, matched ahead of api.urls when running under
+# ASGI so that the same URLs are served without a thread hop
+urlpatterns = [
+    path('api/profile/', async_views.profile, name='profile'),
+    path('api/profile', async_views.profile, name='profile'),
+
+    path('api/hobbies/', async_views.user_hobbies, name="userhobbies"),
+    path('api/hobbies/<int:hobby_id>/', async_views.delete_hobby, name="delete_hobby"),
+    path('api/hobbies/add/', async_views.add_hobby, name="add_hobby"),
+    path('api/all-hobbies/', async_views.all_hobbies, name="all_hobbies"),
+    path('api/similar-users/', async_views.similar_users, name="similar_users"),
+    # Only served under ASGI, a WSGI worker would be tied up per connection
+    path('api/events', async_views.events, name="events"),
+    path('api/events/', async_views.events, name="events"),
+]
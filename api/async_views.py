@@ -0,0 +1,158 @@
+"""
+Async versions of the JSON API views, served when running under ASGI.
+
+They use the async ORM and ``request.auser()`` so that a request never has
+to be handed to a worker thread, and are routed by ``api.async_urls``.
+"""
+from asgiref.sync import sync_to_async
+from django.contrib.auth.decorators import login_required
+from django.db import connections
+from django.http import HttpRequest, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.views.decorators.cache import cache_control
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from . import events as event_stream
+from .cache import acatalogue_version, aget_or_compute, auser_hobby_rows
+from .filters import age_filter
+from .matching import asimilar_users
+from .models import Hobby
+from .pagination import InvalidCursor, apaginate, decode_cursor, encode_cursor, get_limit, paginate_rows, paginated_response
+from .views import HOBBY_PAGE_SIZE, hobby_page_key
+import json
+from datetime import datetime
+from typing import Optional
+
+
+@login_required
+async def profile(request: HttpRequest) -> JsonResponse:
+    user = await request.auser()
+    if request.method == 'GET':
+        profile_data = {
+            'username': user.username,
+            'name': user.name,
+            'email': user.email,
+            'date_of_birth': user.date_of_birth.strftime('%Y-%m-%d') if user.date_of_birth else ''
+        }
+        return JsonResponse(profile_data)
+
+    elif request.method == 'POST':
+        try:
+            data = json.loads(request.body)
+            user.name = data.get('name', user.name)
+            user.email = data.get('email', user.email)
+            date_of_birth = data.get('date_of_birth')
+            user.date_of_birth = datetime.strptime(date_of_birth, '%Y-%m-%d').date()
+            # Only what was edited, ``user`` may come from the cache and be stale otherwise
+            await user.asave(update_fields=['name', 'email', 'date_of_birth'])
+            return JsonResponse({'message': 'Profile updated successfully'})
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=400)
+
+
+@login_required
+async def user_hobbies(request: HttpRequest) -> JsonResponse:
+    if request.method == 'GET':
+        user = await request.auser()
+        try:
+            hobbies, cursor = paginate_rows(request, await auser_hobby_rows(user), default=HOBBY_PAGE_SIZE)
+        except InvalidCursor as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        hobbies_data = [
+            {"id": hobby_id, "name": name} for hobby_id, name in hobbies
+        ]
+        return paginated_response(request, hobbies_data, cursor)
+    return JsonResponse({'error': 'Invalid request method'}, status=405)
+
+
+@login_required
+@cache_control(private=True, no_cache=True)
+async def all_hobbies(request: HttpRequest) -> HttpResponse:
+    # Conditional requests are handled here rather than with @condition,
+    # which calls its etag function synchronously and the catalogue version
+    # is a database read
+    if request.method == 'GET':
+        async def compute_page() -> tuple[list[dict], Optional[str]]:
+            hobbies, cursor = await apaginate(request, Hobby.objects.all(), 'id', 'name', default=HOBBY_PAGE_SIZE)
+            hobbies_data = [
+                {"id": hobby_id, "name": name} for hobby_id, name in hobbies
+            ]
+            return hobbies_data, cursor
+
+        try:
+            key = hobby_page_key(request, await acatalogue_version())
+        except InvalidCursor as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        etag = quote_etag(key)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            # Requests missing the same page at once share a single query
+            page = await aget_or_compute(key, compute_page)
+            response = paginated_response(request, *page)
+        response['ETag'] = etag
+        return response
+    return JsonResponse({'error': 'Invalid request method'}, status=405)
+
+
+@login_required
+async def delete_hobby(request: HttpRequest, hobby_id: int) -> JsonResponse:
+    if request.method == 'DELETE':
+        user = await request.auser()
+        try:
+            hobby = await user.hobbies.aget(id=hobby_id)
+            await user.hobbies.aremove(hobby)
+            return JsonResponse({'message': 'Hobby deleted successfully'}, status=200)
+        except Hobby.DoesNotExist:
+            return JsonResponse({'error': 'Hobby not found'}, status=404)
+    return JsonResponse({'error': 'Invalid request method'}, status=405)
+
+
+@login_required
+async def add_hobby(request: HttpRequest) -> JsonResponse:
+    if request.method == "POST":
+        data = json.loads(request.body)
+        hobby_id = data.get("hobby_id")
+        if hobby_id:
+            user = await request.auser()
+            try:
+                hobby = await Hobby.objects.aget(id=hobby_id)
+            except Hobby.DoesNotExist:
+                return JsonResponse({"error": "Hobby not found"}, status=404)
+            await user.hobbies.aadd(hobby)
+            return JsonResponse({"message": "Hobby added successfully"}, status=200)
+        return JsonResponse({"error": "Hobby ID is required"}, status=400)
+    return JsonResponse({"error": "Invalid method"}, status=405)
+
+
+@login_required
+async def similar_users(request: HttpRequest) -> JsonResponse:
+    if request.method == 'GET':
+        try:
+            after = decode_cursor(request.GET.get('cursor'), size=2)
+            condition = age_filter(request)
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        limit = get_limit(request)
+        user = await request.auser()
+        users_data = await asimilar_users(user, limit, tuple(after) if after else None, condition)
+        cursor = None
+        if len(users_data) == limit:
+            cursor = encode_cursor([users_data[-1]['shared'], users_data[-1]['id']])
+        return paginated_response(request, users_data, cursor)
+    return JsonResponse({'error': 'Invalid request method'}, status=405)
+
+
+@login_required
+async def events(request: HttpRequest) -> HttpResponse:
+    """Server-sent events with hobby match updates for the user, see api.events."""
+    if request.method == 'GET':
+        user = await request.auser()
+        hobby_ids = [hobby_id for hobby_id, _ in await auser_hobby_rows(user)]
+        # The stream stays open for as long as the client is connected, it
+        # must not hold on to a database connection all that time
+        await sync_to_async(connections.close_all)()
+        response = StreamingHttpResponse(event_stream.stream(user.id, hobby_ids), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        # Stops nginx from buffering the stream
+        response['X-Accel-Buffering'] = 'no'
+        return response
+    return JsonResponse({'error': 'Invalid request method'}, status=405)
@@ -0,0 +1,190 @@
+"""
+Measurement helpers and request scenarios shared by the benchmark commands.
+"""
+import http.cookiejar
+import json
+import re
+import statistics
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections.abc import Mapping
+from typing import Any, Optional
+
+
+def summarize(latencies: list[float], elapsed: float) -> dict[str, Any]:
+    """
+    Throughput and latency percentiles, in milliseconds, of one run.
+
+    The percentiles are ``None`` for a run without requests.
+    """
+    latencies = sorted(latencies)
+    if not latencies:
+        return {
+            'requests': 0, 'throughput': 0.0, 'p50_ms': None, 'p90_ms': None, 'p99_ms': None,
+            'max_ms': None, 'mean_ms': None,
+        }
+
+    def percentile(p: float) -> float:
+        return round(latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000, 3)
+
+    return {
+        'requests': len(latencies),
+        'throughput': round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        'p50_ms': percentile(0.50),
+        'p90_ms': percentile(0.90),
+        'p99_ms': percentile(0.99),
+        'max_ms': round(latencies[-1] * 1000, 3),
+        'mean_ms': round(statistics.fmean(latencies) * 1000, 3),
+    }
+
+
+class TestClientTarget:
+    """Drives the app in-process through the Django test client."""
+
+    def __init__(self) -> None:
+        from django.test import Client
+
+        self.client = Client()
+
+    def request(self, method: str, path: str, data: Any = None,
+                form: bool = False) -> tuple[int, Any, Optional[int], Mapping[str, str]]:
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        kwargs: dict[str, Any] = {}
+        if data is not None:
+            kwargs = {'data': data} if form else {'data': json.dumps(data), 'content_type': 'application/json'}
+        with CaptureQueriesContext(connection) as queries:
+            response = getattr(self.client, method.lower())(path, **kwargs)
+        body = response.json() if response.get('Content-Type') == 'application/json' else None
+        return response.status_code, body, len(queries), response.headers
+
+
+class HttpTarget:
+    """Drives a running server over real HTTP, keeping cookies like a browser."""
+
+    def __init__(self, base_url: str) -> None:
+        class NoRedirect(urllib.request.HTTPRedirectHandler):
+            def redirect_request(self, *args: Any, **kwargs: Any) -> None:
+                return None
+
+        self.base_url = base_url.rstrip('/')
+        self.cookies = http.cookiejar.CookieJar()
+        self.opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(self.cookies), NoRedirect)
+
+    def csrf_token(self) -> str:
+        for cookie in self.cookies:
+            if cookie.name == 'csrftoken':
+                return cookie.value
+        return ''
+
+    def request(self, method: str, path: str, data: Any = None,
+                form: bool = False) -> tuple[int, Any, Optional[int], Mapping[str, str]]:
+        headers = {'X-CSRFToken': self.csrf_token(), 'Referer': self.base_url + '/'}
+        body = None
+        if data is not None and form:
+            body = urllib.parse.urlencode(dict(data, csrfmiddlewaretoken=self.csrf_token())).encode()
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+        elif data is not None:
+            body = json.dumps(data).encode()
+            headers['Content-Type'] = 'application/json'
+        request = urllib.request.Request(self.base_url + path, data=body, headers=headers, method=method)
+        try:
+            with self.opener.open(request) as response:
+                status, content, headers = response.status, response.read(), response.headers
+        except urllib.error.HTTPError as e:
+            status, content, headers = e.code, e.read(), e.headers
+        content_type, timing = headers.get('Content-Type'), headers.get('Server-Timing')
+        parsed = json.loads(content) if content_type == 'application/json' and content else None
+        # Only known when the server runs with REQUEST_METRICS enabled
+        queries = re.search(r'db;[^,]*desc="(\d+) queries"', timing or '')
+        return status, parsed, int(queries.group(1)) if queries else None, headers
+
+
+def run_scenario(target: Any, username: str, password: str, requests: int,
+                 endpoints: Optional[list[str]] = None) -> dict[str, dict[str, Any]]:
+    """
+    Log in, then time ``requests`` calls of every endpoint.
+
+    Hobby additions and deletions use distinct hobbies the user does not have
+    yet, so they run fewer times when the catalogue runs out of them. Only the
+    hobbies that were really added are deleted again, which leaves the user
+    as the run found it.
+    """
+    endpoints = endpoints or ENDPOINTS
+    results: dict[str, dict[str, Any]] = {}
+    login_form = {'username': username, 'password': password}
+
+    # Fetches the CSRF cookie over HTTP, and checks the credentials
+    target.request('GET', '/login/')
+    status, _, _, _ = target.request('POST', '/login/', login_form, form=True)
+    if status != 302:
+        raise ValueError(f'Could not log in as {username!r}')
+
+    def measure(name: str, calls: list[tuple[str, str, Any, bool]]) -> list[int]:
+        latencies, queries, statuses = [], [], []
+        start = time.perf_counter()
+        for method, path, data, form in calls:
+            call_start = time.perf_counter()
+            status, _, count, _ = target.request(method, path, data, form)
+            latencies.append(time.perf_counter() - call_start)
+            statuses.append(status)
+            if count is not None:
+                queries.append(count)
+        results[name] = summarize(latencies, time.perf_counter() - start)
+        results[name]['errors'] = sum(status >= 400 for status in statuses)
+        results[name]['queries_mean'] = round(statistics.fmean(queries), 2) if queries else None
+        return statuses
+
+    def add(hobby_id: int) -> tuple[str, str, Any, bool]:
+        return 'POST', '/api/hobbies/add/', {'hobby_id': hobby_id}, False
+
+    def delete(hobby_id: int) -> tuple[str, str, Any, bool]:
+        return 'DELETE', f'/api/hobbies/{hobby_id}/', None, False
+
+    free_ids = free_hobby_ids(target, requests) if {'add_hobby', 'delete_hobby'} & set(endpoints) else []
+    added: list[int] = []
+    for name in endpoints:
+        if name == 'login':
+            measure(name, [('POST', '/login/', login_form, True)] * requests)
+        elif name == 'add_hobby':
+            candidates = [hobby_id for hobby_id in free_ids if hobby_id not in added]
+            statuses = measure(name, [add(hobby_id) for hobby_id in candidates])
+            added += [hobby_id for hobby_id, status in zip(candidates, statuses) if status < 400]
+        elif name == 'delete_hobby':
+            if not added:
+                added = [hobby_id for hobby_id in free_ids if target.request(*add(hobby_id))[0] < 400]
+            measure(name, [delete(hobby_id) for hobby_id in added])
+            added = []
+        else:
+            measure(name, [('GET', ENDPOINT_PATHS[name], None, False)] * requests)
+    # When additions were measured without deletions
+    for hobby_id in added:
+        target.request(*delete(hobby_id))
+    return results
+
+
+def free_hobby_ids(target: Any, count: int) -> list[int]:
+    """Up to ``count`` ids of hobbies the logged in user does not have, following the catalogue pages."""
+    _, held, _, _ = target.request('GET', '/api/hobbies/')
+    held_ids = {hobby['id'] for hobby in held or []}
+    free_ids: list[int] = []
+    path: Optional[str] = '/api/all-hobbies/?limit=100'
+    while path and len(free_ids) < count:
+        _, catalogue, _, headers = target.request('GET', path)
+        free_ids += [hobby['id'] for hobby in catalogue or [] if hobby['id'] not in held_ids]
+        link = re.match(r'<([^>]*)>; rel="next"', headers.get('Link') or '')
+        path = link.group(1) if link else None
+    return free_ids[:count]
+
+
+ENDPOINT_PATHS = {
+    'profile': '/api/profile',
+    'user_hobbies': '/api/hobbies/',
+    'all_hobbies': '/api/all-hobbies/',
+    'similar_users': '/api/similar-users/',
+}
+
+ENDPOINTS = ['profile', 'user_hobbies', 'all_hobbies', 'similar_users', 'add_hobby', 'delete_hobby', 'login']
@@ -0,0 +1,210 @@
+"""
+Streaming bulk import and export of users, hobbies and hobby memberships.
+
+Records are read and written as JSON lines or CSV, one chunk at a time, so
+memory stays bounded by the batch size rather than by the size of the file.
+"""
+import csv
+import json
+from collections.abc import Iterable, Iterator
+from datetime import date
+from itertools import islice
+from typing import IO, Any, Optional
+
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.db import transaction
+
+from .cache import invalidate_user_hobbies
+from .models import CustomUser, Hobby, normalize_hobby_name
+from .popularity import reconcile_user_counts
+
+
+UserHobby = CustomUser.hobbies.through
+
+FIELDS = {
+    'hobbies': ['name'],
+    'users': ['username', 'email', 'name', 'date_of_birth', 'password', 'hobbies'],
+    'memberships': ['username', 'hobby'],
+}
+
+
+def read_records(stream: IO[str], fmt: str) -> Iterator[dict[str, Any]]:
+    if fmt == 'csv':
+        for row in csv.DictReader(stream):
+            if 'hobbies' in row:
+                row['hobbies'] = [name for name in (row['hobbies'] or '').split(';') if name]
+            yield row
+        return
+    for line in stream:
+        if line.strip():
+            yield json.loads(line)
+
+
+class RecordWriter:
+    def __init__(self, stream: IO[str], fmt: str, fields: list[str]) -> None:
+        self.stream = stream
+        self.fmt = fmt
+        if fmt == 'csv':
+            self.writer = csv.DictWriter(stream, fieldnames=fields)
+            self.writer.writeheader()
+
+    def write(self, record: dict[str, Any]) -> None:
+        if self.fmt == 'csv':
+            if 'hobbies' in record:
+                record = dict(record, hobbies=';'.join(record['hobbies']))
+            self.writer.writerow(record)
+        else:
+            self.stream.write(json.dumps(record, default=str) + '\n')
+
+
+def chunked(records: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    iterator = iter(records)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class HobbyMap:
+    """Normalized hobby name to id, creating unknown names a chunk at a time."""
+
+    def __init__(self) -> None:
+        self.ids = {name: hobby_id for hobby_id, name in Hobby.objects.values_list('id', 'name')}
+        self.created = 0
+
+    def resolve(self, names: Iterable[str]) -> dict[str, int]:
+        normalized = {normalize_hobby_name(name) for name in names} - {''}
+        missing = normalized - self.ids.keys()
+        if missing:
+            hobbies, created = Hobby.objects.resolve(missing)
+            self.ids.update((name, hobby.id) for name, hobby in hobbies.items())
+            self.created += len(created)
+        return {name: self.ids[name] for name in normalized}
+
+
+def import_hobbies(records: Iterable[dict[str, Any]], batch_size: int) -> dict[str, int]:
+    hobbies = HobbyMap()
+    for chunk in chunked(records, batch_size):
+        hobbies.resolve(record['name'] for record in chunk)
+    return {'hobbies': hobbies.created}
+
+
+def import_users(records: Iterable[dict[str, Any]], batch_size: int,
+                 hasher: Optional[str] = None) -> dict[str, int]:
+    """
+    Create users that do not exist yet, plus the hobbies listed for them.
+
+    Passwords that are already hashed are stored as they are, anything else
+    is hashed with ``hasher`` (the default hasher when None), and users
+    without a password get an unusable one.
+    """
+    hobbies = HobbyMap()
+    created = memberships = 0
+    for chunk in chunked(records, batch_size):
+        existing = set(
+            CustomUser.objects.filter(username__in=[record['username'] for record in chunk])
+            .values_list('username', flat=True)
+        )
+        users = []
+        for record in chunk:
+            if record['username'] in existing:
+                continue
+            existing.add(record['username'])
+            users.append(CustomUser(
+                username=record['username'],
+                email=record['email'],
+                name=record.get('name') or None,
+                date_of_birth=date.fromisoformat(record['date_of_birth']) if record.get('date_of_birth') else None,
+                password=_password(record.get('password'), hasher),
+            ))
+        with transaction.atomic():
+            CustomUser.objects.bulk_create(users, batch_size=batch_size)
+            pairs = [
+                (record['username'], name)
+                for record in chunk
+                for name in record.get('hobbies') or []
+            ]
+            memberships += _link(pairs, hobbies)
+        created += len(users)
+    return {'users': created, 'hobbies': hobbies.created, 'memberships': memberships}
+
+
+def import_memberships(records: Iterable[dict[str, Any]], batch_size: int) -> dict[str, int]:
+    hobbies = HobbyMap()
+    memberships = 0
+    for chunk in chunked(records, batch_size):
+        with transaction.atomic():
+            memberships += _link([(record['username'], record['hobby']) for record in chunk], hobbies)
+    return {'hobbies': hobbies.created, 'memberships': memberships}
+
+
+def _password(password: Optional[str], hasher: Optional[str]) -> str:
+    if not password:
+        return make_password(None)
+    try:
+        identify_hasher(password)
+        return password
+    except ValueError:
+        return make_password(password, hasher=hasher or 'default')
+
+
+def _link(pairs: list[tuple[str, str]], hobbies: HobbyMap) -> int:
+    # Written straight to the through table, so m2m_changed is not sent. The
+    # hobbies' user counts are recounted here, the caller has to rebuild the
+    # hobby overlaps
+    if not pairs:
+        return 0
+    user_ids = dict(
+        CustomUser.objects.filter(username__in={username for username, _ in pairs})
+        .values_list('username', 'id')
+    )
+    hobby_ids = hobbies.resolve(name for _, name in pairs)
+    rows = {
+        (user_ids[username], hobby_ids[normalize_hobby_name(name)])
+        for username, name in pairs
+        if username in user_ids and normalize_hobby_name(name) in hobby_ids
+    }
+    UserHobby.objects.bulk_create(
+        [UserHobby(customuser_id=user_id, hobby_id=hobby_id) for user_id, hobby_id in rows],
+        ignore_conflicts=True,
+    )
+    reconcile_user_counts({hobby_id for _, hobby_id in rows})
+    invalidate_user_hobbies({user_id for user_id, _ in rows})
+    return len(rows)
+
+
+def export_records(kind: str, batch_size: int) -> Iterator[dict[str, Any]]:
+    """Yield every record of ``kind`` in id order, reading one keyset page at a time."""
+    if kind == 'hobbies':
+        for chunk in _pages(Hobby.objects.all(), batch_size, 'id', 'name'):
+            for _, name in chunk:
+                yield {'name': name}
+    elif kind == 'users':
+        fields = ('id', 'username', 'email', 'name', 'date_of_birth', 'password')
+        for chunk in _pages(CustomUser.objects.all(), batch_size, *fields):
+            names: dict[int, list[str]] = {row[0]: [] for row in chunk}
+            for user_id, hobby in (UserHobby.objects.filter(customuser_id__in=names)
+                                   .order_by('hobby__name').values_list('customuser_id', 'hobby__name')):
+                names[user_id].append(hobby)
+            for user_id, username, email, name, date_of_birth, password in chunk:
+                yield {
+                    'username': username,
+                    'email': email,
+                    'name': name or '',
+                    'date_of_birth': date_of_birth.isoformat() if date_of_birth else '',
+                    'password': password,
+                    'hobbies': names[user_id],
+                }
+    elif kind == 'memberships':
+        rows = UserHobby.objects.all()
+        for chunk in _pages(rows, batch_size, 'id', 'customuser__username', 'hobby__name'):
+            for _, username, hobby in chunk:
+                yield {'username': username, 'hobby': hobby}
+
+
+def _pages(queryset: Any, batch_size: int, *fields: str) -> Iterator[list[tuple]]:
+    last_id = 0
+    while True:
+        page = list(queryset.filter(id__gt=last_id).order_by('id').values_list(*fields)[:batch_size])
+        if not page:
+            return
+        yield page
+        last_id = page[-1][0]
@@ -0,0 +1,237 @@
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import transaction
+from django.db.models import F, QuerySet
+
+from .models import CatalogueVersion, CustomUser
+
+
+UserHobby = CustomUser.hobbies.through
+
+
+def _initial_version() -> CatalogueVersion:
+    # Time based rather than 1 so that recreating the row can never bring
+    # back a version, and an ETag, that was handed out before
+    return CatalogueVersion(id=1, version=time.time_ns() // 1000)
+
+
+def catalogue_version() -> int:
+    """
+    Current version of the hobby catalogue, bumped after every Hobby change.
+
+    Read from the database rather than the cache, so a bump made by one
+    worker is seen by all of them, at the cost of a primary key lookup.
+    """
+    version = CatalogueVersion.objects.filter(id=1).values_list('version', flat=True).first()
+    if version is None:
+        CatalogueVersion.objects.bulk_create([_initial_version()], ignore_conflicts=True)
+        version = CatalogueVersion.objects.filter(id=1).values_list('version', flat=True).get()
+    return version
+
+
+async def acatalogue_version() -> int:
+    """Async version of :func:`catalogue_version`."""
+    version = await CatalogueVersion.objects.filter(id=1).values_list('version', flat=True).afirst()
+    if version is None:
+        await CatalogueVersion.objects.abulk_create([_initial_version()], ignore_conflicts=True)
+        version = await CatalogueVersion.objects.filter(id=1).values_list('version', flat=True).aget()
+    return version
+
+
+def bump_catalogue_version() -> None:
+    """
+    Bump the catalogue version once the current transaction commits.
+
+    Bumping earlier would let a concurrent request cache the catalogue as it
+    was before the commit under the new version.
+    """
+    transaction.on_commit(_bump_catalogue_version)
+
+
+def _bump_catalogue_version() -> None:
+    if not CatalogueVersion.objects.filter(id=1).update(version=F('version') + 1):
+        # No version yet, starting a fresh one is enough
+        catalogue_version()
+
+
+def catalogue_key(version: int, *parts: Any) -> str:
+    return 'hobby-catalogue:{}:{}'.format(version, ':'.join(str(part) for part in parts))
+
+
+def user_key(user_id: Any) -> str:
+    return f'auth-user:{user_id}'
+
+
+def user_hobbies_version_key(user_id: Any) -> str:
+    return f'user-hobbies-version:{user_id}'
+
+
+def user_hobbies_key(user_id: Any, version: int) -> str:
+    return f'user-hobbies:{user_id}:{version}'
+
+
+def user_hobbies_version(user_id: Any) -> int:
+    """
+    Version of ``user_id``'s cached hobby list, kept in the cache itself.
+
+    Invalidating deletes it, and the next read starts a new time based one,
+    so a list computed from rows read before the change can only be cached
+    under a version that is no longer handed out.
+    """
+    key = user_hobbies_version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        version = time.time_ns() // 1000
+        if not cache.add(key, version, None):
+            # Started by another request in the meantime
+            version = cache.get(key, version)
+    return version
+
+
+async def auser_hobbies_version(user_id: Any) -> int:
+    """Async version of :func:`user_hobbies_version`."""
+    key = user_hobbies_version_key(user_id)
+    version = await cache.aget(key)
+    if version is None:
+        version = time.time_ns() // 1000
+        if not await cache.aadd(key, version, None):
+            version = await cache.aget(key, version)
+    return version
+
+
+def invalidate_user(user_id: Any) -> None:
+    cache.delete(user_key(user_id))
+
+
+def invalidate_user_hobbies(user_ids: Iterable[Any]) -> None:
+    """
+    Drop the cached hobby lists of ``user_ids``, after their hobbies changed
+    or one of their hobbies was renamed or deleted.
+    """
+    if settings.AUTH_USER_CACHE:
+        cache.delete_many([user_hobbies_version_key(user_id) for user_id in user_ids])
+
+
+def user_hobbies_query(user: Any) -> QuerySet:
+    # Read off the through table so that its (customuser_id, hobby_id) index
+    # gives the order as well
+    return (
+        UserHobby.objects.filter(customuser_id=user.pk)
+        .order_by('hobby_id').values_list('hobby_id', 'hobby__name')
+    )
+
+
+def user_hobby_rows(user: Any) -> list[tuple[int, str]]:
+    """``(id, name)`` of every hobby of ``user`` ordered by id, cached per user with ``AUTH_USER_CACHE``."""
+    if not settings.AUTH_USER_CACHE:
+        return list(user_hobbies_query(user))
+    return get_or_compute(
+        user_hobbies_key(user.pk, user_hobbies_version(user.pk)), lambda: list(user_hobbies_query(user)),
+        settings.AUTH_USER_CACHE_TIMEOUT,
+    )
+
+
+async def auser_hobby_rows(user: Any) -> list[tuple[int, str]]:
+    """Async version of :func:`user_hobby_rows`."""
+    async def rows() -> list[tuple[int, str]]:
+        return [row async for row in user_hobbies_query(user)]
+
+    if not settings.AUTH_USER_CACHE:
+        return await rows()
+    return await aget_or_compute(
+        user_hobbies_key(user.pk, await auser_hobbies_version(user.pk)), rows, settings.AUTH_USER_CACHE_TIMEOUT,
+    )
+
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+_flights: dict[str, _Flight] = {}
+_flights_lock = threading.Lock()
+_aflights: dict[tuple[asyncio.AbstractEventLoop, str], asyncio.Future] = {}
+
+
+def get_or_compute(key: str, compute: Callable[[], Any], timeout: Any = DEFAULT_TIMEOUT) -> Any:
+    """
+    ``cache.get(key)``, or else ``compute()`` and cache the result.
+
+    Concurrent misses on the same key in this process are coalesced: one
+    thread computes the value and the others wait for it and share it, or
+    its exception, so a cache expiry under load runs the query once per
+    process rather than once per request.
+    """
+    value = cache.get(key)
+    if value is not None:
+        return value
+    with _flights_lock:
+        flight = _flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = _flights[key] = _Flight()
+    if not leader:
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.value
+    try:
+        # The previous leader may have filled the cache since the miss
+        value = cache.get(key)
+        if value is None:
+            value = compute()
+            cache.set(key, value, timeout)
+        flight.value = value
+        return value
+    except BaseException as e:
+        flight.error = e
+        raise
+    finally:
+        with _flights_lock:
+            del _flights[key]
+        flight.done.set()
+
+
+async def aget_or_compute(key: str, compute: Callable[[], Awaitable[Any]],
+                          timeout: Any = DEFAULT_TIMEOUT) -> Any:
+    """Async version of :func:`get_or_compute`, coalescing misses per event loop."""
+    value = await cache.aget(key)
+    if value is not None:
+        return value
+    loop = asyncio.get_running_loop()
+    while (future := _aflights.get((loop, key))) is not None:
+        try:
+            # Shielded so that a waiter going away does not cancel the leader
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise
+            # The leader was cancelled, e.g. its client disconnected, so the
+            # next one in line takes over
+    future = _aflights[(loop, key)] = loop.create_future()
+    try:
+        value = await cache.aget(key)
+        if value is None:
+            value = await compute()
+            await cache.aset(key, value, timeout)
+        future.set_result(value)
+        return value
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except BaseException as e:
+        future.set_exception(e)
+        # Marks the exception as retrieved when nobody else was waiting
+        future.exception()
+        raise
+    finally:
+        del _aflights[(loop, key)]
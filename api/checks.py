@@ -0,0 +1,59 @@
+"""
+Checks for the settings of this app. The deployment ones only matter with
+several workers behind a proxy and run with ``python manage.py check --deploy``.
+"""
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth import hashers as django_hashers
+from django.core.checks import Tags, Warning, register
+
+from . import hashers
+
+
+# Cost settings and the attribute each one sets
+HASHER_COSTS = [
+    ('PBKDF2_ITERATIONS', hashers.PBKDF2PasswordHasher, django_hashers.PBKDF2PasswordHasher, 'iterations'),
+    ('SCRYPT_WORK_FACTOR', hashers.ScryptPasswordHasher, django_hashers.ScryptPasswordHasher, 'work_factor'),
+    ('SCRYPT_BLOCK_SIZE', hashers.ScryptPasswordHasher, django_hashers.ScryptPasswordHasher, 'block_size'),
+    ('SCRYPT_PARALLELISM', hashers.ScryptPasswordHasher, django_hashers.ScryptPasswordHasher, 'parallelism'),
+    ('ARGON2_TIME_COST', hashers.Argon2PasswordHasher, django_hashers.Argon2PasswordHasher, 'time_cost'),
+    ('ARGON2_MEMORY_COST', hashers.Argon2PasswordHasher, django_hashers.Argon2PasswordHasher, 'memory_cost'),
+    ('ARGON2_PARALLELISM', hashers.Argon2PasswordHasher, django_hashers.Argon2PasswordHasher, 'parallelism'),
+]
+
+
+@register(Tags.security)
+def check_password_hashers(app_configs: Any, **kwargs: Any) -> list[Warning]:
+    warnings = []
+    for name, hasher, default, attribute in HASHER_COSTS:
+        value = getattr(settings, name, None)
+        if value and value < getattr(default, attribute):
+            warnings.append(Warning(
+                f'{name} is {value}, below Django\'s default of {getattr(default, attribute)}, '
+                f'so {getattr(hasher, attribute)} is used instead.',
+                hint=f'Remove {name} or raise it to at least the default.',
+                id='api.W003',
+            ))
+    return warnings
+
+
+@register(Tags.security, deploy=True)
+def check_rate_limits(app_configs: Any, **kwargs: Any) -> list[Warning]:
+    warnings = []
+    if not any(getattr(settings, 'RATE_LIMITS', {}).values()):
+        return warnings
+    if not getattr(settings, 'RATE_LIMIT_IP_HEADER', ''):
+        warnings.append(Warning(
+            'RATE_LIMIT_IP_HEADER is not set, so anonymous clients are told apart by REMOTE_ADDR.',
+            hint='Behind a reverse proxy every client would share its address and rate limits, set '
+                 'RATE_LIMIT_IP_HEADER to the META key of the header the proxy sets, e.g. HTTP_X_FORWARDED_FOR.',
+            id='api.W001',
+        ))
+    if settings.CACHES['ratelimit']['BACKEND'] in settings.PROCESS_LOCAL_CACHES:
+        warnings.append(Warning(
+            'The ratelimit cache is local to each process, so every worker enforces the rate limits on its own.',
+            hint='Set RATE_LIMIT_CACHE_BACKEND, or CACHE_BACKEND, to a shared cache such as Redis.',
+            id='api.W002',
+        ))
+    return warnings
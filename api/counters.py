@@ -0,0 +1,184 @@
+"""
+Page view counters that keep row updates off the request path.
+
+Increments are collected in process memory and flushed by a background
+thread every ``PAGEVIEW_FLUSH_INTERVAL`` seconds, or as soon as
+``PAGEVIEW_FLUSH_COUNT`` views are pending, and once more when the process
+exits. That bounds what a killed or recycled worker can lose. When the
+buffer is overdue anyway, because the server does not run background
+threads, the request that notices flushes it.
+
+With ``SHARED_CACHE`` the increments are collected in the cache instead,
+with an atomic ``incr`` of one pending counter per key, so they survive a
+worker that is killed before it flushes. Whichever worker flushes next, under
+a lock in the cache, moves them to the database. Every key has a ``PageView``
+row from its first view on, which is how the flushing worker knows the keys.
+
+Each flush adds to one of ``PAGEVIEW_SHARDS`` rows of ``PageView``, picked at
+random, with an ``F()`` expression. Concurrent flushes from different
+workers therefore rarely update the same row, and when they do one waits for
+the other's short transaction. The total is the sum of the shards.
+"""
+import atexit
+import logging
+import os
+import random
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F, Sum
+
+from .models import PageView
+
+
+logger = logging.getLogger(__name__)
+
+_pending: Counter = Counter()
+_pending_views = 0
+_flushed_at = time.monotonic()
+_lock = threading.Lock()
+_wake = threading.Event()
+_owner_pid: Optional[int] = None
+
+# Held by the worker flushing the counters in the cache, expires in case it dies
+FLUSH_LOCK = 'pageviews:flush-lock'
+FLUSH_LOCK_TIMEOUT = 60
+
+
+def pending_key(key: str) -> str:
+    return f'pageviews:pending:{key}'
+
+
+def increment(key: str = 'homepage', amount: int = 1) -> None:
+    global _pending_views
+    interval = getattr(settings, 'PAGEVIEW_FLUSH_INTERVAL', 5.0)
+    flush_count = getattr(settings, 'PAGEVIEW_FLUSH_COUNT', 100)
+    if settings.SHARED_CACHE:
+        # Per key rather than per process
+        full = _cache_increment(key, amount) >= flush_count
+        with _lock:
+            overdue = time.monotonic() - _flushed_at > 2 * interval
+    else:
+        with _lock:
+            _pending[key] += amount
+            _pending_views += amount
+            full = _pending_views >= flush_count
+            overdue = time.monotonic() - _flushed_at > 2 * interval
+    _ensure_flusher()
+    if overdue:
+        flush()
+    elif full:
+        _wake.set()
+
+
+def flush() -> None:
+    """
+    Write all pending increments of this process to the database, or with
+    ``SHARED_CACHE`` those of every process unless another one is at it.
+    """
+    global _pending_views, _flushed_at
+    if settings.SHARED_CACHE:
+        _flush_cache()
+        return
+    with _lock:
+        pending = dict(_pending)
+        _pending.clear()
+        _pending_views = 0
+        _flushed_at = time.monotonic()
+    if not pending:
+        return
+    try:
+        _write(pending)
+    except Exception:
+        logger.exception('Could not flush page views, keeping them for the next attempt')
+        with _lock:
+            _pending.update(pending)
+            _pending_views += sum(pending.values())
+
+
+def total(key: str = 'homepage') -> int:
+    """Flushed count across all shards plus what has not been flushed yet."""
+    flushed = PageView.objects.filter(key=key).aggregate(total=Sum('count'))['total'] or 0
+    if settings.SHARED_CACHE:
+        return flushed + (cache.get(pending_key(key)) or 0)
+    with _lock:
+        return flushed + _pending[key]
+
+
+def _write(pending: dict[str, int]) -> None:
+    shard = random.randrange(getattr(settings, 'PAGEVIEW_SHARDS', 8))
+    with transaction.atomic():
+        for key, amount in pending.items():
+            updated = PageView.objects.filter(key=key, shard=shard).update(count=F('count') + amount)
+            if not updated:
+                PageView.objects.get_or_create(key=key, shard=shard)
+                PageView.objects.filter(key=key, shard=shard).update(count=F('count') + amount)
+
+
+def _cache_increment(key: str, amount: int) -> int:
+    # Returns the views of ``key`` now pending
+    try:
+        return cache.incr(pending_key(key), amount)
+    except ValueError:
+        # The first view of the key, or its counter was evicted. The row makes
+        # the key known to every flushing worker
+        PageView.objects.get_or_create(key=key, shard=0)
+        if cache.add(pending_key(key), amount, None):
+            return amount
+        return cache.incr(pending_key(key), amount)
+
+
+def _flush_cache() -> None:
+    global _flushed_at
+    with _lock:
+        _flushed_at = time.monotonic()
+    if not cache.add(FLUSH_LOCK, os.getpid(), FLUSH_LOCK_TIMEOUT):
+        return
+    try:
+        known = PageView.objects.order_by().values_list('key', flat=True).distinct()
+        keys = {pending_key(key): key for key in known}
+        pending = {keys[name]: amount for name, amount in cache.get_many(keys).items() if amount}
+        if not pending:
+            return
+        # Views counted meanwhile stay pending, only this worker takes any away
+        for key, amount in pending.items():
+            cache.decr(pending_key(key), amount)
+        try:
+            _write(pending)
+        except Exception:
+            logger.exception('Could not flush page views, keeping them for the next attempt')
+            for key, amount in pending.items():
+                _cache_increment(key, amount)
+    finally:
+        cache.delete(FLUSH_LOCK)
+
+
+def _ensure_flusher() -> None:
+    global _owner_pid, _pending_views, _flushed_at
+    if _owner_pid == os.getpid():
+        return
+    with _lock:
+        if _owner_pid == os.getpid():
+            return
+        if _owner_pid is not None:
+            # Forked from a process that had already counted, those
+            # increments belong to the parent
+            _pending.clear()
+            _pending_views = 0
+            _flushed_at = time.monotonic()
+        _owner_pid = os.getpid()
+    interval = getattr(settings, 'PAGEVIEW_FLUSH_INTERVAL', 5.0)
+    threading.Thread(target=_flush_forever, args=(interval,), name='pageview-flush', daemon=True).start()
+    atexit.register(flush)
+
+
+def _flush_forever(interval: float) -> None:
+    while True:
+        _wake.wait(interval)
+        _wake.clear()
+        flush()
@@ -0,0 +1,191 @@
+"""
+Publish/subscribe for the server-sent event stream of ``async_views.events``.
+
+Events are dicts published to named channels: ``user:<id>`` for events meant
+for one user and ``hobby:<id>`` for changes to who has a hobby. The broker
+named by ``EVENTS_BROKER`` fans them out to subscriptions. The default
+``LocalBroker`` only reaches subscribers in the same process. A shared
+backend, e.g. Redis or PostgreSQL LISTEN/NOTIFY, can replace it with the
+same ``publish``, ``subscribe`` and ``has_subscribers`` methods.
+"""
+import asyncio
+import itertools
+import json
+import threading
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterable
+from typing import Any, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+
+def user_channel(user_id: int) -> str:
+    return f'user:{user_id}'
+
+
+def hobby_channel(hobby_id: int) -> str:
+    return f'hobby:{hobby_id}'
+
+
+class Subscription:
+    """
+    Events for a set of channels, read by one coroutine on one event loop.
+
+    At most ``maxsize`` events are buffered. When a slow reader falls further
+    behind, the buffer is replaced by a single ``overflow`` event telling the
+    client to reload instead of growing without bound.
+    """
+
+    def __init__(self, broker: 'LocalBroker', loop: asyncio.AbstractEventLoop, maxsize: int) -> None:
+        self.broker = broker
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.channels: set[str] = set()
+
+    def add(self, *channels: str) -> None:
+        self.broker._add(self, channels)
+
+    def discard(self, *channels: str) -> None:
+        self.broker._discard(self, channels)
+
+    def close(self) -> None:
+        self.broker._discard(self, list(self.channels))
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[dict[str, Any]]:
+        """The next event, or None after ``timeout`` seconds without one."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def _deliver(self, event: dict[str, Any]) -> None:
+        # Runs on the subscription's loop
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({'id': event['id'], 'type': 'overflow', 'data': {}})
+
+
+class LocalBroker:
+    """In-process fanout, safe to publish to from any thread."""
+
+    def __init__(self) -> None:
+        self._subscriptions: dict[str, set[Subscription]] = defaultdict(set)
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def subscribe(self, channels: Iterable[str] = ()) -> Subscription:
+        """Subscribe the running event loop to ``channels``."""
+        subscription = Subscription(self, asyncio.get_running_loop(), getattr(settings, 'EVENTS_QUEUE_SIZE', 100))
+        subscription.add(*channels)
+        return subscription
+
+    def has_subscribers(self) -> bool:
+        return bool(self._subscriptions)
+
+    def publish(self, channel: str, event_type: str, data: dict[str, Any]) -> int:
+        """Send an event to every subscription of ``channel``. Returns how many there were."""
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(channel, ()))
+        event = {'id': next(self._ids), 'type': event_type, 'channel': channel, 'data': data}
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._deliver, event)
+            except RuntimeError:
+                # The loop has been closed, the subscription is gone
+                subscription.close()
+        return len(subscriptions)
+
+    def _add(self, subscription: Subscription, channels: Iterable[str]) -> None:
+        with self._lock:
+            for channel in channels:
+                self._subscriptions[channel].add(subscription)
+                subscription.channels.add(channel)
+
+    def _discard(self, subscription: Subscription, channels: Iterable[str]) -> None:
+        with self._lock:
+            for channel in channels:
+                subscribers = self._subscriptions.get(channel)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._subscriptions[channel]
+                subscription.channels.discard(channel)
+
+
+_broker: Optional[Any] = None
+_broker_lock = threading.Lock()
+
+
+def get_broker() -> Any:
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = import_string(getattr(settings, 'EVENTS_BROKER', 'api.events.LocalBroker'))()
+    return _broker
+
+
+def publish_on_commit(channel: str, event_type: str, data: dict[str, Any]) -> None:
+    transaction.on_commit(lambda: get_broker().publish(channel, event_type, data))
+
+
+def hobbies_changed(user_ids: Iterable[int], hobby_ids: Iterable[int], added: bool) -> None:
+    """
+    Announce that each of ``user_ids`` gained or lost each of ``hobby_ids``.
+
+    Everyone with one of the hobbies receives a ``match`` event through the
+    hobby's channel and the users themselves a ``hobbies`` event, once the
+    change has been committed.
+    """
+    broker = get_broker()
+    if not broker.has_subscribers():
+        return
+    user_ids, hobby_ids = list(user_ids), list(hobby_ids)
+    change = 'added' if added else 'removed'
+    for user_id in user_ids:
+        publish_on_commit(user_channel(user_id), 'hobbies', {'hobby_ids': hobby_ids, 'change': change})
+        for hobby_id in hobby_ids:
+            publish_on_commit(hobby_channel(hobby_id), 'match', {
+                'user_id': user_id, 'hobby_id': hobby_id, 'change': change,
+            })
+
+
+def format_event(event: dict[str, Any]) -> bytes:
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event['data'])}\n\n".encode()
+
+
+async def stream(user_id: int, hobby_ids: Iterable[int]) -> AsyncIterator[bytes]:
+    """
+    Server-sent events for ``user_id``, with a comment line as keep-alive.
+
+    The subscription follows the user's hobbies as they change, and match
+    events about the user themselves are left out. Closing the stream, e.g.
+    when the client disconnects, ends the subscription.
+    """
+    heartbeat = getattr(settings, 'EVENTS_HEARTBEAT_SECONDS', 15.0)
+    subscription = get_broker().subscribe(
+        [user_channel(user_id), *(hobby_channel(hobby_id) for hobby_id in hobby_ids)]
+    )
+    try:
+        yield b'retry: 5000\n\n'
+        while True:
+            event = await subscription.get(heartbeat)
+            if event is None:
+                yield b': keep-alive\n\n'
+                continue
+            if event['type'] == 'hobbies':
+                channels = [hobby_channel(hobby_id) for hobby_id in event['data']['hobby_ids']]
+                if event['data']['change'] == 'added':
+                    subscription.add(*channels)
+                else:
+                    subscription.discard(*channels)
+            elif event['type'] == 'match' and event['data']['user_id'] == user_id:
+                continue
+            yield format_event(event)
+    finally:
+        subscription.close()
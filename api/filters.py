@@ -0,0 +1,51 @@
+from datetime import date
+from typing import Optional
+
+from django.db.models import Q
+from django.http import HttpRequest
+from django.utils import timezone
+
+
+def years_before(day: date, years: int) -> date:
+    try:
+        return day.replace(year=day.year - years)
+    except ValueError:
+        # 29 February in a year that is not a leap year
+        return day.replace(year=day.year - years, day=28)
+
+
+def age_on(day: date, date_of_birth: date) -> int:
+    """Age in whole years on ``day``, the inverse of :func:`years_before`."""
+    return day.year - date_of_birth.year - ((day.month, day.day) < (date_of_birth.month, date_of_birth.day))
+
+
+def age_filter(request: HttpRequest, field: str = 'date_of_birth') -> Q:
+    """
+    Translate ``min_age``/``max_age`` query parameters into a birth date range.
+
+    Comparing ``field`` against two constant dates keeps the filter an index
+    range scan instead of computing every user's age. Raises ``ValueError``
+    for malformed parameters.
+    """
+    min_age = _get_age(request, 'min_age')
+    max_age = _get_age(request, 'max_age')
+    today = timezone.localdate()
+    condition = Q()
+    if min_age is not None:
+        condition &= Q(**{f'{field}__lte': years_before(today, min_age)})
+    if max_age is not None:
+        condition &= Q(**{f'{field}__gt': years_before(today, max_age + 1)})
+    return condition
+
+
+def _get_age(request: HttpRequest, name: str) -> Optional[int]:
+    value = request.GET.get(name)
+    if value in (None, ''):
+        return None
+    try:
+        age = int(value)
+    except ValueError:
+        raise ValueError(f'{name} must be a whole number')
+    if age < 0:
+        raise ValueError(f'{name} must not be negative')
+    return age
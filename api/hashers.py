@@ -0,0 +1,37 @@
+"""
+Password hashers with their cost parameters taken from settings.
+
+The algorithm names are Django's own, so existing hashes keep verifying.
+When a stored hash was made with other parameters (or another algorithm than
+the first of ``PASSWORD_HASHERS``) Django rehashes it on the next successful
+login, which is how a change of ``PASSWORD_HASHER`` or of the costs below
+reaches existing users without a migration. Costs below Django's defaults
+are raised to them, as rehashing would otherwise weaken existing hashes.
+"""
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+def at_least_default(name: str, default: int) -> int:
+    # Lower than Django's default would not only weaken new hashes: Django
+    # also rehashes existing ones on login whenever the parameters differ
+    return max(getattr(settings, name, None) or 0, default)
+
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    iterations = at_least_default('PBKDF2_ITERATIONS', hashers.PBKDF2PasswordHasher.iterations)
+
+
+class ScryptPasswordHasher(hashers.ScryptPasswordHasher):
+    # Memory used per hash is 128 * work_factor * block_size bytes
+    work_factor = at_least_default('SCRYPT_WORK_FACTOR', hashers.ScryptPasswordHasher.work_factor)
+    block_size = at_least_default('SCRYPT_BLOCK_SIZE', hashers.ScryptPasswordHasher.block_size)
+    parallelism = at_least_default('SCRYPT_PARALLELISM', hashers.ScryptPasswordHasher.parallelism)
+    maxmem = 256 * work_factor * block_size * parallelism
+
+
+class Argon2PasswordHasher(hashers.Argon2PasswordHasher):
+    # Requires argon2-cffi. memory_cost is in KiB
+    time_cost = at_least_default('ARGON2_TIME_COST', hashers.Argon2PasswordHasher.time_cost)
+    memory_cost = at_least_default('ARGON2_MEMORY_COST', hashers.Argon2PasswordHasher.memory_cost)
+    parallelism = at_least_default('ARGON2_PARALLELISM', hashers.Argon2PasswordHasher.parallelism)
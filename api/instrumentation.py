@@ -0,0 +1,72 @@
+"""
+Per-request timing of database queries and response serialization.
+
+``RequestMetricsMiddleware`` opens a ``RequestMetrics`` for every request
+and the hooks below add to whichever one is current. The database hook is
+an execute wrapper installed on each connection as it is created, so queries
+run from ``sync_to_async`` threads are counted for the request too.
+"""
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Optional
+
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+class RequestMetrics:
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.view_start: Optional[float] = None
+        self.queries = 0
+        self.db_time = 0.0
+        self.serialize_time = 0.0
+
+
+_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar('request_metrics', default=None)
+
+
+def begin() -> tuple[RequestMetrics, Any]:
+    metrics = RequestMetrics()
+    return metrics, _metrics.set(metrics)
+
+
+def end(token: Any) -> None:
+    _metrics.reset(token)
+
+
+def current() -> Optional[RequestMetrics]:
+    return _metrics.get()
+
+
+@contextmanager
+def serializing() -> Iterator[None]:
+    metrics = _metrics.get()
+    if metrics is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.serialize_time += time.perf_counter() - start
+
+
+def count_queries(execute: Callable, sql: str, params: Any, many: bool, context: dict[str, Any]) -> Any:
+    metrics = _metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.queries += 1
+        metrics.db_time += time.perf_counter() - start
+
+
+@receiver(connection_created)
+def install_query_counter(sender: Any, connection: Any, **kwargs: Any) -> None:
+    if count_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.append(count_queries)
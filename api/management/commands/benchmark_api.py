@@ -0,0 +1,57 @@
+import json
+import platform
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.test import override_settings
+from django.utils import timezone
+
+from api.benchmark import ENDPOINTS, HttpTarget, TestClientTarget, run_scenario
+
+
+class Command(BaseCommand):
+    help = "Benchmark the main endpoints in-process or against a running server"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--url', help='Base URL of a running server, in-process when omitted. '
+                                          'Run the server with RATE_LIMIT_LOGIN= to benchmark logins')
+        parser.add_argument('--requests', type=int, default=200, help='Requests per endpoint')
+        parser.add_argument('--endpoint', action='append', dest='endpoints', choices=ENDPOINTS,
+                            help='Endpoint to benchmark, repeatable, all by default')
+        parser.add_argument('--username', default='user0', help='Existing user, see generate_data')
+        parser.add_argument('--password', default='benchmark')
+        parser.add_argument('--json', action='store_true', help='Print machine-readable results')
+        parser.add_argument('--output', help='Also write the JSON results to this file')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        target = HttpTarget(options['url']) if options['url'] else TestClientTarget()
+        # The login scenario repeats far more logins than the rate limits allow.
+        # Tasks are queued for a worker as in production, rather than timed
+        # with the request when DEBUG makes them run inline
+        try:
+            with override_settings(RATE_LIMITS={}, TASKS_EAGER=False):
+                results = run_scenario(target, options['username'], options['password'],
+                                       options['requests'], options['endpoints'])
+        except ValueError as e:
+            raise CommandError(e)
+
+        report = {
+            'target': options['url'] or 'in-process',
+            'timestamp': timezone.now().isoformat(),
+            'python': platform.python_version(),
+            'requests': options['requests'],
+            'endpoints': results,
+        }
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as output:
+                json.dump(report, output, indent=2)
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+        for name, stats in results.items():
+            # None when unknown, or when no request was made at all
+            shown = {key: '-' if value is None else value for key, value in stats.items()}
+            self.stdout.write(
+                f"{name:<14} {shown['throughput']:>9} req/s  p50 {shown['p50_ms']:>8} ms  "
+                f"p99 {shown['p99_ms']:>8} ms  queries {shown['queries_mean']:>5}  errors {shown['errors']}"
+            )
@@ -0,0 +1,78 @@
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.test import AsyncClient, Client, override_settings
+
+from api.benchmark import summarize
+from api.models import CustomUser
+
+
+DEFAULT_PATHS = ['/api/profile/', '/api/hobbies/', '/api/all-hobbies/', '/api/similar-users/']
+
+
+class Command(BaseCommand):
+    help = "Compare the WSGI (sync views) and ASGI (async views) request paths in-process"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--requests', type=int, default=500, help='Requests per path and mode')
+        parser.add_argument('--concurrency', type=int, default=20, help='Requests in flight at once')
+        parser.add_argument('--path', action='append', dest='paths', help='Path to request, repeatable')
+        parser.add_argument('--json', action='store_true', help='Print machine-readable results')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        paths = options['paths'] or DEFAULT_PATHS
+        user, _ = CustomUser.objects.get_or_create(
+            username='benchmark-async', defaults={'email': 'benchmark-async@example.com'}
+        )
+        results: dict[str, dict[str, Any]] = {}
+        try:
+            for path in paths:
+                with override_settings(ROOT_URLCONF='project.urls'):
+                    results.setdefault(path, {})['wsgi'] = self.run_wsgi(user, path, options)
+                with override_settings(ROOT_URLCONF='project.urls_async'):
+                    results[path]['asgi'] = asyncio.run(self.run_asgi(user, path, options))
+        finally:
+            user.delete()
+
+        if options['json']:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+        for path, modes in results.items():
+            for mode, stats in modes.items():
+                self.stdout.write(
+                    f"{path:<24} {mode:<5} {stats['throughput']:>9} req/s  "
+                    f"p50 {stats['p50_ms']:>8} ms  p99 {stats['p99_ms']:>8} ms"
+                )
+
+    def run_wsgi(self, user: CustomUser, path: str, options: dict[str, Any]) -> dict[str, float]:
+        client = Client()
+        client.force_login(user)
+
+        def timed(_: int) -> float:
+            start = time.perf_counter()
+            client.get(path)
+            return time.perf_counter() - start
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as pool:
+            latencies = list(pool.map(timed, range(options['requests'])))
+        return summarize(latencies, time.perf_counter() - start)
+
+    async def run_asgi(self, user: CustomUser, path: str, options: dict[str, Any]) -> dict[str, float]:
+        client = AsyncClient()
+        await client.aforce_login(user)
+        semaphore = asyncio.Semaphore(options['concurrency'])
+
+        async def timed() -> float:
+            async with semaphore:
+                start = time.perf_counter()
+                await client.get(path)
+                return time.perf_counter() - start
+
+        start = time.perf_counter()
+        latencies = await asyncio.gather(*(timed() for _ in range(options['requests'])))
+        return summarize(list(latencies), time.perf_counter() - start)
@@ -0,0 +1,63 @@
+import json
+import time
+from datetime import date, timedelta
+from typing import Any, Callable
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.http import JsonResponse
+
+from api import responses
+from api.responses import FastJsonResponse, rows_as_dicts, streaming_json_response
+
+
+class Command(BaseCommand):
+    help = "Compare JsonResponse with the fast and streaming JSON paths on a large payload"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--rows', type=int, default=100_000)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--json', action='store_true', help='Print machine-readable results')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        # Shaped like the /api/users/ rows, as values_list() returns them
+        keys = ('id', 'username', 'name', 'date_of_birth')
+        start = date(1970, 1, 1)
+        rows = [
+            (i, f'user{i}', f'User {i}', start + timedelta(days=i % 15000))
+            for i in range(1, options['rows'] + 1)
+        ]
+
+        def stdlib() -> int:
+            data = [
+                {'id': i, 'username': u, 'name': n, 'date_of_birth': d.strftime('%Y-%m-%d')}
+                for i, u, n, d in rows
+            ]
+            return len(JsonResponse(data, safe=False).content)
+
+        def fast() -> int:
+            return len(FastJsonResponse(list(rows_as_dicts(keys, rows)), safe=False).content)
+
+        def streaming() -> int:
+            return sum(len(chunk) for chunk in streaming_json_response(keys, iter(rows)).streaming_content)
+
+        cases: dict[str, Callable[[], int]] = {'JsonResponse': stdlib, 'fast': fast, 'streaming': streaming}
+        results = {
+            name: self.measure(case, options['repeat']) for name, case in cases.items()
+        }
+        results['encoder'] = 'orjson' if responses.orjson is not None else 'json'
+
+        if options['json']:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+        self.stdout.write(f"{options['rows']} rows, encoder: {results['encoder']}")
+        for name in cases:
+            self.stdout.write(f"{name:<14} {results[name]['best_ms']:>10} ms  {results[name]['bytes']:>10} bytes")
+
+    def measure(self, case: Callable[[], int], repeat: int) -> dict[str, float]:
+        timings = []
+        size = 0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            size = case()
+            timings.append(time.perf_counter() - start)
+        return {'best_ms': round(min(timings) * 1000, 2), 'bytes': size}
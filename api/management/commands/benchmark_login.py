@@ -0,0 +1,82 @@
+import json
+import time
+from typing import Any
+
+from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import get_hasher
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+from django.test import RequestFactory, override_settings
+
+from api.forms import LoginForm
+from api.models import CustomUser
+
+
+HASHERS = {
+    'pbkdf2': 'api.hashers.PBKDF2PasswordHasher',
+    'scrypt': 'api.hashers.ScryptPasswordHasher',
+    'argon2': 'api.hashers.Argon2PasswordHasher',
+}
+
+
+class Command(BaseCommand):
+    help = "Measure logins per second on one core for each password hasher, verifying once and twice"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--hashers', default=','.join(HASHERS), help='Comma separated, from: ' + ', '.join(HASHERS))
+        parser.add_argument('--logins', type=int, default=20)
+        parser.add_argument('--json', action='store_true', help='Print machine-readable results')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        names = [name.strip() for name in options['hashers'].split(',') if name.strip()]
+        unknown = set(names) - HASHERS.keys()
+        if unknown:
+            raise CommandError(f"Unknown hashers: {', '.join(sorted(unknown))}")
+
+        results = {}
+        for name in names:
+            # Only this hasher is configured, so check_password never rehashes
+            # to another algorithm halfway through the measurement
+            with override_settings(PASSWORD_HASHERS=[HASHERS[name]]):
+                try:
+                    get_hasher().encode('probe', get_hasher().salt())
+                except ValueError as e:
+                    self.stderr.write(f"Skipping {name}: {e}")
+                    continue
+                results[name] = self.measure(options['logins'])
+
+        if options['json']:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+        self.stdout.write(f"{'hasher':<8} {'verify twice':>14} {'verify once':>14}   logins/s per core")
+        for name, result in results.items():
+            self.stdout.write(f"{name:<8} {result['twice']:>14} {result['once']:>14}")
+
+    def measure(self, logins: int) -> dict[str, float]:
+        username, password = 'benchmark-login', 'Benchmark-password-1'
+        factory = RequestFactory()
+        data = {'username': username, 'password': password}
+
+        def once() -> None:
+            form = LoginForm(factory.post('/login/'), data=data)
+            assert form.is_valid() and form.get_user() is not None
+
+        def twice() -> None:
+            # The login view before credentials were verified only once
+            request = factory.post('/login/')
+            form = LoginForm(request, data=data)
+            assert form.is_valid()
+            assert authenticate(request, username=username, password=password) is not None
+
+        with transaction.atomic():
+            CustomUser.objects.create_user(username=username, email='benchmark@example.com', password=password)
+            result = {'twice': self.rate(twice, logins), 'once': self.rate(once, logins)}
+            transaction.set_rollback(True)
+        return result
+
+    def rate(self, login: Any, logins: int) -> float:
+        login()
+        start = time.perf_counter()
+        for _ in range(logins):
+            login()
+        return round(logins / (time.perf_counter() - start), 1)
@@ -0,0 +1,97 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+
+PROFILES = {
+    'full': 'project.wsgi',
+    'api': 'project.wsgi_api',
+}
+
+# Run in a fresh interpreter per sample, so imports are measured cold
+PROBE = '''
+import io, json, sys, time
+start = time.perf_counter()
+application = __import__(sys.argv[1], fromlist=['application']).application
+boot = time.perf_counter() - start
+modules = len(sys.modules)
+
+from wsgiref.util import setup_testing_defaults
+
+def request(path):
+    environ = {'PATH_INFO': path, 'REQUEST_METHOD': 'GET', 'wsgi.input': io.BytesIO()}
+    setup_testing_defaults(environ)
+    result = application(environ, lambda status, headers, exc_info=None: None)
+    b''.join(result)
+    getattr(result, 'close', lambda: None)()
+
+results = {'boot_ms': boot * 1000, 'modules': modules}
+for path in sys.argv[3:]:
+    start = time.perf_counter()
+    request(path)
+    first = time.perf_counter() - start
+    count = int(sys.argv[2])
+    start = time.perf_counter()
+    for _ in range(count):
+        request(path)
+    results[path] = {'first_ms': first * 1000, 'request_us': (time.perf_counter() - start) / count * 1e6}
+print(json.dumps(results))
+'''
+
+
+class Command(BaseCommand):
+    help = "Compare worker start-up time and per-request overhead of the full and lean API profiles"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--runs', type=int, default=5, help='Fresh interpreters started per profile')
+        parser.add_argument('--requests', type=int, default=500, help='Requests per path in each run')
+        parser.add_argument('--path', action='append', dest='paths',
+                            help='Path to request, repeatable (default: /health and /api/profile/)')
+        parser.add_argument('--json', action='store_true', help='Print machine-readable results')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        paths = options['paths'] or ['/health', '/api/profile/']
+        env = dict(os.environ)
+        # Each entry point picks its own settings and URLconf
+        env.pop('DJANGO_SETTINGS_MODULE', None)
+        env.pop('DJANGO_ROOT_URLCONF', None)
+
+        results = {}
+        for profile, module in PROFILES.items():
+            runs = []
+            for _ in range(options['runs']):
+                completed = subprocess.run(
+                    [sys.executable, '-c', PROBE, module, str(options['requests']), *paths],
+                    cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+                )
+                if completed.returncode != 0:
+                    raise CommandError(f"{module} failed:\n{completed.stderr}")
+                runs.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+            results[profile] = {
+                'boot_ms': round(statistics.median(run['boot_ms'] for run in runs), 1),
+                'modules': runs[0]['modules'],
+                **{
+                    path: {
+                        'first_ms': round(statistics.median(run[path]['first_ms'] for run in runs), 2),
+                        'request_us': round(statistics.median(run[path]['request_us'] for run in runs), 1),
+                    }
+                    for path in paths
+                },
+            }
+
+        if options['json']:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+        self.stdout.write(f"{'profile':<8} {'boot ms':>9} {'modules':>8}")
+        for profile, result in results.items():
+            self.stdout.write(f"{profile:<8} {result['boot_ms']:>9} {result['modules']:>8}")
+        self.stdout.write(f"\n{'path':<20} {'profile':<8} {'first ms':>9} {'per request us':>15}")
+        for path in paths:
+            for profile, result in results.items():
+                self.stdout.write(f"{path:<20} {profile:<8} {result[path]['first_ms']:>9} {result[path]['request_us']:>15}")
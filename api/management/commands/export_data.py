@@ -0,0 +1,29 @@
+import sys
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from api import bulk
+
+
+class Command(BaseCommand):
+    help = "Stream users, hobbies or hobby memberships to a JSON lines or CSV file"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('kind', choices=sorted(bulk.FIELDS))
+        parser.add_argument('path', nargs='?', default='-', help="File to write, '-' for stdout")
+        parser.add_argument('--format', choices=['jsonl', 'csv'],
+                            help='Defaults to csv for .csv files and jsonl otherwise')
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        path = options['path']
+        fmt = options['format'] or ('csv' if path.endswith('.csv') else 'jsonl')
+        stream = sys.stdout if path == '-' else open(path, 'w', newline='', encoding='utf-8')
+        try:
+            writer = bulk.RecordWriter(stream, fmt, bulk.FIELDS[options['kind']])
+            for record in bulk.export_records(options['kind'], options['batch_size']):
+                writer.write(record)
+        finally:
+            if stream is not sys.stdout:
+                stream.close()
@@ -0,0 +1,61 @@
+import random
+from collections.abc import Iterator
+from datetime import timedelta
+from itertools import accumulate
+from typing import Any
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandParser
+from django.utils import timezone
+
+from api import bulk
+from api.matching import rebuild_overlaps
+
+
+class Command(BaseCommand):
+    help = "Generate a reproducible synthetic dataset of users, hobbies and memberships"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--users', type=int, default=10_000)
+        parser.add_argument('--hobbies', type=int, default=1_000)
+        parser.add_argument('--hobbies-per-user', type=int, default=5,
+                            help='Average number of hobbies per user')
+        parser.add_argument('--zipf', type=float, default=1.1,
+                            help='Exponent of the Zipf distribution of hobby popularity')
+        parser.add_argument('--min-age', type=int, default=18)
+        parser.add_argument('--max-age', type=int, default=80)
+        parser.add_argument('--password', default='benchmark',
+                            help='Password shared by every generated user, hashed once')
+        parser.add_argument('--prefix', default='user', help='Prefix of the generated usernames')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--batch-size', type=int, default=2000)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        counts = bulk.import_users(self.records(options), options['batch_size'])
+        rebuild_overlaps()
+        self.stdout.write(self.style.SUCCESS(
+            'Generated ' + ', '.join(f'{count} {name}' for name, count in counts.items())
+        ))
+
+    def records(self, options: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        rng = random.Random(options['seed'])
+        names = [f"Hobby {rank}" for rank in range(1, options['hobbies'] + 1)]
+        # Hobby k is picked with probability proportional to 1 / k^s
+        weights = list(accumulate(1 / rank ** options['zipf'] for rank in range(1, len(names) + 1)))
+        password = make_password(options['password'])
+        today = timezone.localdate()
+        youngest = today - timedelta(days=365.25 * options['min_age'])
+        span = int(365.25 * (options['max_age'] - options['min_age']))
+        for i in range(options['users']):
+            count = min(len(names), max(0, round(rng.gauss(options['hobbies_per_user'], 2))))
+            hobbies = set()
+            while len(hobbies) < count:
+                hobbies.update(rng.choices(names, cum_weights=weights, k=count - len(hobbies)))
+            yield {
+                'username': f"{options['prefix']}{i}",
+                'email': f"{options['prefix']}{i}@example.com",
+                'name': f"User {i}",
+                'date_of_birth': (youngest - timedelta(days=rng.randrange(span))).isoformat(),
+                'password': password,
+                'hobbies': sorted(hobbies),
+            }
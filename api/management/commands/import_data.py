@@ -0,0 +1,54 @@
+import sys
+from typing import Any
+
+from django.contrib.auth.hashers import get_hasher
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from api import bulk
+from api.matching import rebuild_overlaps
+
+
+class Command(BaseCommand):
+    help = "Stream users, hobbies or hobby memberships from a JSON lines or CSV file"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('kind', choices=sorted(bulk.FIELDS))
+        parser.add_argument('path', help="File to read, '-' for stdin")
+        parser.add_argument('--format', choices=['jsonl', 'csv'],
+                            help='Defaults to csv for .csv files and jsonl otherwise')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--hasher', help='Algorithm from PASSWORD_HASHERS for plain text passwords, '
+                                             'e.g. pbkdf2_sha256, instead of the first one')
+        parser.add_argument('--no-rebuild', action='store_true',
+                            help='Do not rebuild the hobby overlap table afterwards')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        path = options['path']
+        fmt = options['format'] or ('csv' if path.endswith('.csv') else 'jsonl')
+        if options['hasher']:
+            if options['kind'] != 'users':
+                raise CommandError('--hasher only applies to users')
+            try:
+                # Passwords hashed with anything else could never be checked
+                get_hasher(options['hasher'])
+            except ValueError as e:
+                raise CommandError(e)
+        stream = sys.stdin if path == '-' else open(path, newline='', encoding='utf-8')
+        try:
+            records = bulk.read_records(stream, fmt)
+            if options['kind'] == 'hobbies':
+                counts = bulk.import_hobbies(records, options['batch_size'])
+            elif options['kind'] == 'users':
+                counts = bulk.import_users(records, options['batch_size'], options['hasher'])
+            else:
+                counts = bulk.import_memberships(records, options['batch_size'])
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+        if counts.get('memberships') and not options['no_rebuild']:
+            # Memberships were inserted without m2m signals
+            rebuild_overlaps()
+        self.stdout.write(self.style.SUCCESS(
+            'Imported ' + ', '.join(f'{count} {name}' for name, count in counts.items())
+        ))
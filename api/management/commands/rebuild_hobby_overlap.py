@@ -0,0 +1,17 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from api.matching import rebuild_overlaps
+
+
+class Command(BaseCommand):
+    help = "Rebuild the HobbyOverlap table from users' current hobbies"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Number of users recomputed per INSERT ... SELECT')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        written = rebuild_overlaps(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {written} hobby overlap rows'))
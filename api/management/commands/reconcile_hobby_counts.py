@@ -0,0 +1,20 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from api.popularity import reconcile_user_counts
+
+
+class Command(BaseCommand):
+    help = "Recount the users of every hobby and fix user counts that drifted"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Number of hobbies recounted per transaction')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Only report how many counts are off')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        fixed = reconcile_user_counts(batch_size=options['batch_size'], dry_run=options['dry_run'])
+        verb = 'Found' if options['dry_run'] else 'Fixed'
+        self.stdout.write(self.style.SUCCESS(f'{verb} {fixed} drifted hobby user counts'))
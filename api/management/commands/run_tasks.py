@@ -0,0 +1,35 @@
+import signal
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from api import tasks  # noqa: F401  registers the tasks
+from api.queue import Worker
+
+
+class Command(BaseCommand):
+    help = "Run queued background tasks until stopped"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--queue', action='append', dest='queues',
+                            help='Queue to take tasks from, repeatable (default: default and email)')
+        parser.add_argument('--concurrency', type=int, default=settings.TASKS_CONCURRENCY,
+                            help='Tasks run at the same time by this worker')
+        parser.add_argument('--poll-interval', type=float, default=1.0,
+                            help='Seconds to wait when no task is due')
+        parser.add_argument('--burst', action='store_true',
+                            help='Exit once no task is due instead of waiting for more')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        worker = Worker(
+            options['queues'] or ['default', 'email'],
+            concurrency=options['concurrency'],
+            poll_interval=options['poll_interval'],
+            lease=settings.TASKS_LEASE_SECONDS,
+        )
+        # Finish the running tasks, but claim no new ones
+        signal.signal(signal.SIGTERM, worker.stop)
+        signal.signal(signal.SIGINT, worker.stop)
+        processed = worker.run(burst=options['burst'])
+        self.stdout.write(self.style.SUCCESS(f'Ran {processed} tasks'))
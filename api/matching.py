@@ -0,0 +1,315 @@
+from collections.abc import Iterable
+from typing import Any, Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count, F, Q, QuerySet
+
+from .models import CustomUser, HobbyOverlap
+
+
+UserHobby = CustomUser.hobbies.through
+
+# Users handled per statement when updating match lists
+CHUNK_SIZE = 500
+
+
+def similar_users(user: CustomUser, limit: int, after: Optional[tuple[int, int]] = None,
+                  condition: Q = Q()) -> list[dict[str, Any]]:
+    """
+    Rank other users by the number of hobbies they share with ``user``.
+
+    Overlap counts are read from the materialized ``HobbyOverlap`` table, so a
+    page is one range scan on its ``(user, -shared, other)`` index. Pages are
+    keyed on ``(shared, id)`` which keeps deep pages as cheap as the first one.
+    ``condition`` further restricts the matched users, as a filter on users.
+    Only the ``MATCHING_TOP_K`` best matches of each user are kept, the last
+    unfiltered page ends there. A filtered page that comes up short while the
+    list is full is ranked from the hobbies themselves instead, as the users
+    it is missing may rank below the stored matches.
+    """
+    page = list(_ranked(user, after, condition)[:limit])
+    if len(page) < limit and condition and _truncated(user):
+        page = list(_ranked_by_hobbies(user, after, condition)[:limit])
+    if not page:
+        return []
+    return _matches(page, list(_common_hobbies(user, page)))
+
+
+async def asimilar_users(user: CustomUser, limit: int, after: Optional[tuple[int, int]] = None,
+                         condition: Q = Q()) -> list[dict[str, Any]]:
+    """Async version of :func:`similar_users`."""
+    page = [row async for row in _ranked(user, after, condition)[:limit]]
+    if len(page) < limit and condition and await _atruncated(user):
+        page = [row async for row in _ranked_by_hobbies(user, after, condition)[:limit]]
+    if not page:
+        return []
+    return _matches(page, [row async for row in _common_hobbies(user, page)])
+
+
+def _ranked(user: CustomUser, after: Optional[tuple[int, int]], condition: Q) -> QuerySet:
+    ranked = HobbyOverlap.objects.filter(_prefixed(condition, 'other__'), user_id=user.id, shared__gt=0)
+    if after is not None:
+        shared, user_id = after
+        ranked = ranked.filter(Q(shared__lt=shared) | Q(shared=shared, other_id__gt=user_id))
+    return ranked.order_by('-shared', 'other_id').values_list('other_id', 'shared', 'other__username', 'other__name')
+
+
+def _ranked_by_hobbies(user: CustomUser, after: Optional[tuple[int, int]], condition: Q) -> QuerySet:
+    # The same ranking as _ranked() counted from the hobbies table, which is
+    # not limited to the stored matches but has to group every user sharing
+    # a hobby with ``user``
+    ranked = (
+        UserHobby.objects
+        .filter(
+            _prefixed(condition, 'customuser__'),
+            hobby_id__in=UserHobby.objects.filter(customuser_id=user.id).values('hobby_id'),
+        )
+        .exclude(customuser_id=user.id)
+        .values('customuser_id')
+        .annotate(shared=Count('hobby_id'))
+    )
+    if after is not None:
+        shared, user_id = after
+        ranked = ranked.filter(Q(shared__lt=shared) | Q(shared=shared, customuser_id__gt=user_id))
+    return ranked.order_by('-shared', 'customuser_id').values_list(
+        'customuser_id', 'shared', 'customuser__username', 'customuser__name',
+    )
+
+
+def _truncated(user: CustomUser) -> bool:
+    return HobbyOverlap.objects.filter(user_id=user.id).count() >= top_k()
+
+
+async def _atruncated(user: CustomUser) -> bool:
+    return await HobbyOverlap.objects.filter(user_id=user.id).acount() >= top_k()
+
+
+def _prefixed(condition: Q, prefix: str) -> Q:
+    # ``condition`` with every lookup made relative to the related user at ``prefix``
+    return Q.create(
+        [
+            _prefixed(child, prefix) if isinstance(child, Q) else (prefix + child[0], child[1])
+            for child in condition.children
+        ],
+        connector=condition.connector,
+        negated=condition.negated,
+    )
+
+
+def _common_hobbies(user: CustomUser, page: list[tuple]) -> QuerySet:
+    # Names of the hobbies each matched user has in common with ``user``
+    return (
+        UserHobby.objects
+        .filter(customuser_id__in=[row[0] for row in page], hobby__users=user)
+        .values_list('customuser_id', 'hobby__name')
+    )
+
+
+def _matches(page: list[tuple], common_hobbies: list[tuple[int, str]]) -> list[dict[str, Any]]:
+    common: dict[int, list[str]] = {row[0]: [] for row in page}
+    for user_id, hobby_name in common_hobbies:
+        common[user_id].append(hobby_name)
+    # Sorted here rather than by the database, which could not use an index
+    # for it, it is a page of users' hobbies at most
+    for names in common.values():
+        names.sort()
+
+    return [
+        {
+            'id': other_id,
+            'username': username,
+            'name': name,
+            'shared': shared,
+            'common_hobbies': common[other_id],
+        }
+        for other_id, shared, username, name in page
+    ]
+
+
+def top_k() -> int:
+    return getattr(settings, 'MATCHING_TOP_K', 100)
+
+
+def _ranked_select(where: str) -> str:
+    # The top_k() users sharing the most hobbies with each user matched by
+    # ``where``, ties broken by id like the ranking index
+    through = connection.ops.quote_name(UserHobby._meta.db_table)
+    return (
+        f'SELECT user_id, other_id, shared FROM ('
+        f'SELECT a.customuser_id AS user_id, b.customuser_id AS other_id, COUNT(*) AS shared, '
+        f'ROW_NUMBER() OVER (PARTITION BY a.customuser_id ORDER BY COUNT(*) DESC, b.customuser_id) AS position '
+        f'FROM {through} a JOIN {through} b '
+        f'ON a.hobby_id = b.hobby_id AND a.customuser_id <> b.customuser_id '
+        f'WHERE {where} '
+        f'GROUP BY a.customuser_id, b.customuser_id'
+        f') ranked WHERE position <= %s'
+    )
+
+
+def rebuild_overlaps(batch_size: int = 1000) -> int:
+    """
+    Recompute the whole ``HobbyOverlap`` table from the hobby through table.
+
+    Each batch of users is filled with one ``INSERT ... SELECT`` self-join so
+    nothing is pulled into Python. Returns the number of rows written.
+    """
+    overlap = connection.ops.quote_name(HobbyOverlap._meta.db_table)
+    sql = f'INSERT INTO {overlap} (user_id, other_id, shared) ' + _ranked_select('a.customuser_id BETWEEN %s AND %s')
+    written = 0
+    start = 0
+    with transaction.atomic(), connection.cursor() as cursor:
+        HobbyOverlap.objects.all().delete()
+        while True:
+            user_ids = list(
+                CustomUser.objects.filter(id__gte=start).order_by('id').values_list('id', flat=True)[:batch_size]
+            )
+            if not user_ids:
+                break
+            cursor.execute(sql, [user_ids[0], user_ids[-1], top_k()])
+            written += cursor.rowcount
+            start = user_ids[-1] + 1
+    return written
+
+
+def refresh_overlaps(user_ids: Iterable[int]) -> int:
+    """
+    Recompute the match lists of ``user_ids`` from their current hobbies.
+
+    It reads the current hobbies rather than a change, so it can run at any
+    later point and any number of times. Returns the number of rows written.
+    """
+    user_ids = sorted(set(user_ids))
+    overlap = connection.ops.quote_name(HobbyOverlap._meta.db_table)
+    written = 0
+    for start in range(0, len(user_ids), CHUNK_SIZE):
+        chunk = user_ids[start:start + CHUNK_SIZE]
+        placeholders = ', '.join(['%s'] * len(chunk))
+        with transaction.atomic(), connection.cursor() as cursor:
+            HobbyOverlap.objects.filter(user_id__in=chunk).delete()
+            cursor.execute(
+                f'INSERT INTO {overlap} (user_id, other_id, shared) '
+                + _ranked_select(f'a.customuser_id IN ({placeholders})'),
+                [*chunk, top_k()],
+            )
+            written += cursor.rowcount
+    return written
+
+
+def trim_overlaps(user_ids: Iterable[int]) -> None:
+    """Cut the match lists of ``user_ids`` back to their top_k() entries."""
+    user_ids = list(user_ids)
+    if not user_ids:
+        return
+    overlap = connection.ops.quote_name(HobbyOverlap._meta.db_table)
+    placeholders = ', '.join(['%s'] * len(user_ids))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {overlap} WHERE id IN ('
+            f'SELECT id FROM ('
+            f'SELECT id, ROW_NUMBER() OVER (PARTITION BY user_id ORDER BY shared DESC, other_id) AS position '
+            f'FROM {overlap} WHERE user_id IN ({placeholders})'
+            f') ranked WHERE position > %s)',
+            [*user_ids, top_k()],
+        )
+
+
+def update_overlaps(user_id: int, hobby_ids: Iterable[int]) -> None:
+    """
+    Bring the match lists up to date after ``user_id`` gained or lost ``hobby_ids``.
+
+    The user's own list is recomputed. Everyone else holding one of the
+    hobbies now shares a different number of hobbies with the user, so their
+    entry for the user is rewritten with a fresh count. It is added when it
+    makes their top_k(). A full list whose entry went down is recomputed,
+    since someone outside the list may now rank above the user.
+
+    Runs from the task queue, see ``api.signals``. Like
+    :func:`refresh_overlaps` it only reads current hobbies, so it can run
+    late, more than once, or after a later change.
+    """
+    hobby_ids = list(hobby_ids)
+    refresh_overlaps([user_id])
+    holders = (
+        UserHobby.objects.filter(hobby_id__in=hobby_ids).exclude(customuser_id=user_id)
+        .values_list('customuser_id', flat=True).distinct().order_by('customuser_id')
+    )
+    last = 0
+    while others := list(holders.filter(customuser_id__gt=last)[:CHUNK_SIZE]):
+        last = others[-1]
+        with transaction.atomic():
+            _update_entries(user_id, others)
+
+
+def _update_entries(user_id: int, others: list[int]) -> None:
+    limit = top_k()
+    shared = dict(
+        UserHobby.objects
+        .filter(customuser_id__in=others, hobby_id__in=UserHobby.objects.filter(customuser_id=user_id).values('hobby_id'))
+        .values('customuser_id').annotate(n=Count('hobby_id')).values_list('customuser_id', 'n')
+    )
+    current = dict(
+        HobbyOverlap.objects.filter(user_id__in=others, other_id=user_id).values_list('user_id', 'shared')
+    )
+    sizes = dict(
+        HobbyOverlap.objects.filter(user_id__in=others)
+        .values('user_id').annotate(n=Count('id')).values_list('user_id', 'n')
+    )
+    # A list that is not full holds every positive overlap of its user
+    stale, removed, changed, trim = [], [], [], []
+    for other_id in others:
+        new, old, full = shared.get(other_id, 0), current.get(other_id), sizes.get(other_id, 0) >= limit
+        if old == new or (old is None and not new):
+            continue
+        if old is not None and new < old and full:
+            stale.append(other_id)
+        elif not new:
+            removed.append(other_id)
+        else:
+            changed.append(HobbyOverlap(user_id=other_id, other_id=user_id, shared=new))
+            if old is None and full:
+                trim.append(other_id)
+
+    if removed:
+        HobbyOverlap.objects.filter(user_id__in=removed, other_id=user_id).delete()
+    if changed:
+        HobbyOverlap.objects.bulk_create(
+            changed, update_conflicts=True, unique_fields=['user', 'other'], update_fields=['shared'],
+        )
+    trim_overlaps(trim)
+    refresh_overlaps(stale)
+
+
+def remove_hobby(hobby_id: int) -> list[int]:
+    """
+    Take ``hobby_id`` out of every match list, before the hobby is deleted.
+
+    Every pair of its holders shares one hobby less, which is a single
+    ``UPDATE``. Returns the holders whose lists were full: someone outside
+    such a list may now rank above the entries that went down, so they have
+    to be recomputed with :func:`refresh_overlaps` once the hobby is gone.
+    """
+    holders = UserHobby.objects.filter(hobby_id=hobby_id).values('customuser_id')
+    full = list(
+        HobbyOverlap.objects.filter(user_id__in=holders)
+        .values('user_id').annotate(n=Count('id')).filter(n__gte=top_k())
+        .values_list('user_id', flat=True)
+    )
+    HobbyOverlap.objects.filter(user_id__in=holders, other_id__in=holders).update(shared=F('shared') - 1)
+    HobbyOverlap.objects.filter(user_id__in=holders, shared__lte=0).delete()
+    return full
+
+
+def remove_user(user_id: int) -> list[int]:
+    """
+    The users whose full lists include ``user_id``, before it is deleted.
+
+    Its entries go with it, and those lists have to be recomputed with
+    :func:`refresh_overlaps` once it is gone.
+    """
+    return list(
+        HobbyOverlap.objects
+        .filter(user_id__in=HobbyOverlap.objects.filter(other_id=user_id).values('user_id'))
+        .values('user_id').annotate(n=Count('id')).filter(n__gte=top_k())
+        .values_list('user_id', flat=True)
+    )
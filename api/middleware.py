@@ -0,0 +1,165 @@
+import json
+import logging
+import time
+from typing import Any, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.contrib import auth
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY, get_user_model
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
+from django.utils.crypto import constant_time_compare
+from django.utils.functional import SimpleLazyObject
+
+from . import instrumentation
+from .cache import user_key
+
+
+logger = logging.getLogger('api.requests')
+
+
+def get_cached_user(request: HttpRequest):
+    """
+    Like ``django.contrib.auth.get_user`` but served from the cache when possible.
+
+    Only cached with ``AUTH_USER_CACHE``, which needs a cache shared by all
+    workers. A cached user is only trusted while its session hash still
+    matches, so a password change logs out other sessions exactly as before. Anything that
+    does not check out falls back to the regular lookup, which also takes care
+    of flushing invalid sessions.
+    """
+    if not hasattr(request, '_cached_user'):
+        request._cached_user = _load_user(request)
+    return request._cached_user
+
+
+def _load_user(request: HttpRequest):
+    if not settings.AUTH_USER_CACHE:
+        return auth.get_user(request)
+    try:
+        user_id = get_user_model()._meta.pk.to_python(request.session[SESSION_KEY])
+        backend_path = request.session[BACKEND_SESSION_KEY]
+    except KeyError:
+        return auth.get_user(request)
+    user = cache.get(user_key(user_id))
+    if _trusted(user, backend_path, request.session.get(HASH_SESSION_KEY)):
+        return user
+    user = auth.get_user(request)
+    if user.is_authenticated:
+        cache.set(user_key(user.pk), user, settings.AUTH_USER_CACHE_TIMEOUT)
+    return user
+
+
+async def aget_cached_user(request: HttpRequest):
+    """Async version of :func:`get_cached_user`."""
+    if not hasattr(request, '_acached_user'):
+        request._acached_user = await _aload_user(request)
+    return request._acached_user
+
+
+async def _aload_user(request: HttpRequest):
+    if not settings.AUTH_USER_CACHE:
+        return await auth.aget_user(request)
+    user_id = await request.session.aget(SESSION_KEY)
+    backend_path = await request.session.aget(BACKEND_SESSION_KEY)
+    if user_id is None or backend_path is None:
+        return await auth.aget_user(request)
+    user = await cache.aget(user_key(get_user_model()._meta.pk.to_python(user_id)))
+    if _trusted(user, backend_path, await request.session.aget(HASH_SESSION_KEY)):
+        return user
+    user = await auth.aget_user(request)
+    if user.is_authenticated:
+        await cache.aset(user_key(user.pk), user, settings.AUTH_USER_CACHE_TIMEOUT)
+    return user
+
+
+def _trusted(user: Any, backend_path: str, session_hash: Optional[str]) -> bool:
+    return (user is not None and user.is_active and bool(session_hash)
+            and backend_path in settings.AUTHENTICATION_BACKENDS
+            and constant_time_compare(session_hash, user.get_session_auth_hash()))
+
+
+class CachedAuthenticationMiddleware(AuthenticationMiddleware):
+    """AuthenticationMiddleware that resolves request.user through the cache."""
+
+    def process_request(self, request: HttpRequest) -> None:
+        super().process_request(request)
+        request.user = SimpleLazyObject(lambda: get_cached_user(request))
+        request.auser = lambda: aget_cached_user(request)
+
+
+class RequestMetricsMiddleware:
+    """
+    Opt-in per-request metrics: query count, DB time, serialization and view time.
+
+    The numbers are sent back in a ``Server-Timing`` header and logged as one
+    JSON line on the ``api.requests`` logger. Requests that run more than
+    ``REQUEST_METRICS_QUERY_BUDGET`` queries or take longer than
+    ``REQUEST_METRICS_TIME_BUDGET_MS`` are logged as warnings.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+        self.query_budget = getattr(settings, 'REQUEST_METRICS_QUERY_BUDGET', 20)
+        self.time_budget = getattr(settings, 'REQUEST_METRICS_TIME_BUDGET_MS', 200)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics, token = instrumentation.begin()
+        try:
+            response = self.get_response(request)
+        finally:
+            instrumentation.end(token)
+        return self.report(request, response, metrics)
+
+    async def __acall__(self, request: HttpRequest):
+        metrics, token = instrumentation.begin()
+        try:
+            response = await self.get_response(request)
+        finally:
+            instrumentation.end(token)
+        return self.report(request, response, metrics)
+
+    def process_view(self, request: HttpRequest, view_func, view_args, view_kwargs) -> None:
+        metrics = instrumentation.current()
+        if metrics is not None:
+            metrics.view_start = time.perf_counter()
+
+    def report(self, request: HttpRequest, response: HttpResponse,
+               metrics: instrumentation.RequestMetrics) -> HttpResponse:
+        now = time.perf_counter()
+        total_ms = (now - metrics.start) * 1000
+        view_ms = (now - metrics.view_start) * 1000 if metrics.view_start is not None else 0.0
+        db_ms = metrics.db_time * 1000
+        serialize_ms = metrics.serialize_time * 1000
+        response['Server-Timing'] = ', '.join([
+            f'db;dur={db_ms:.2f};desc="{metrics.queries} queries"',
+            f'serialize;dur={serialize_ms:.2f}',
+            f'view;dur={view_ms:.2f}',
+            f'total;dur={total_ms:.2f}',
+        ])
+
+        match = getattr(request, 'resolver_match', None)
+        record = {
+            'method': request.method,
+            'path': request.path,
+            'view': match.view_name if match else None,
+            'status': response.status_code,
+            'queries': metrics.queries,
+            'db_ms': round(db_ms, 2),
+            'serialize_ms': round(serialize_ms, 2),
+            'view_ms': round(view_ms, 2),
+            'total_ms': round(total_ms, 2),
+        }
+        over_budget = metrics.queries > self.query_budget or total_ms > self.time_budget
+        record['over_budget'] = over_budget
+        logger.log(logging.WARNING if over_budget else logging.INFO, json.dumps(record), extra={'metrics': record})
+        return response
+
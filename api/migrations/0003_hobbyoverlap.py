@@ -0,0 +1,28 @@
+# Generated by Django 5.1.1 on 2026-10-18 19:17
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_alter_hobby_id_delete_friendrequest'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HobbyOverlap',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('shared', models.IntegerField(default=0)),
+                ('other', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='hobby_overlaps', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', '-shared', 'other'], name='hobbyoverlap_ranking_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'other'), name='hobbyoverlap_unique_pair')],
+            },
+        ),
+    ]
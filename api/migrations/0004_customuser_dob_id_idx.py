@@ -0,0 +1,18 @@
+# Generated by Django 5.1.1 on 2026-10-18 19:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_hobbyoverlap'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['date_of_birth', 'id'], name='user_dob_id_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.1 on 2026-10-18 19:40
+
+from django.db import migrations
+
+
+def create_prefix_index(apps, schema_editor):
+    # istartswith compiles to UPPER(name) LIKE UPPER('q%') on PostgreSQL, which
+    # can only use an index built with a pattern operator class
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(
+            'CREATE INDEX IF NOT EXISTS hobby_name_upper_prefix_idx '
+            'ON api_hobby (UPPER(name::text) varchar_pattern_ops)'
+        )
+
+
+def drop_prefix_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS hobby_name_upper_prefix_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_customuser_dob_id_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_prefix_index, drop_prefix_index),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.1 on 2026-10-18 19:20
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_hobby_name_prefix_idx'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='hobby',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('name'), name='hobby_name_ci_unique'),
+        ),
+    ]
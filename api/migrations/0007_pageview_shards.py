@@ -0,0 +1,42 @@
+# Generated by Django 5.1.1 on 2026-10-18 19:24
+
+from django.db import migrations, models
+
+
+def number_existing_rows(apps, schema_editor):
+    # Older rows all share key 'site', give each its own shard so that none
+    # of the counts is lost when the unique constraint is added
+    PageView = apps.get_model('api', 'PageView')
+    for shard, page_view in enumerate(PageView.objects.order_by('id')):
+        page_view.shard = shard
+        page_view.save(update_fields=['shard'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_hobby_name_ci_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pageview',
+            name='key',
+            field=models.CharField(default='site', max_length=100),
+        ),
+        migrations.AddField(
+            model_name='pageview',
+            name='shard',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='pageview',
+            name='count',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.RunPython(number_existing_rows, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='pageview',
+            constraint=models.UniqueConstraint(fields=('key', 'shard'), name='pageview_unique_shard'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.1 on 2026-10-18 19:43
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def count_users(apps, schema_editor):
+    Hobby = apps.get_model('api', 'Hobby')
+    UserHobby = apps.get_model('api', 'CustomUser').hobbies.through
+    counts = UserHobby.objects.values_list('hobby_id').annotate(n=Count('id')).order_by()
+    hobbies = [Hobby(id=hobby_id, user_count=n) for hobby_id, n in counts]
+    Hobby.objects.bulk_update(hobbies, ['user_count'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_pageview_shards'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='hobby',
+            name='user_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(count_users, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='hobby',
+            index=models.Index(fields=['-user_count', 'id'], name='hobby_popularity_idx'),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.1.1 on 2026-10-18 19:48
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+def create_indexes(apps, schema_editor):
+    quote = schema_editor.quote_name
+    through = apps.get_model('api', 'CustomUser').hobbies.through._meta.db_table
+    # The auto-created through table only has (customuser_id, hobby_id). Going
+    # from a hobby to its users, as the overlap queries do, needs the reverse
+    # order, which also covers those queries without reading the table
+    schema_editor.execute(
+        f'CREATE INDEX {quote("user_hobbies_hobby_user_idx")} '
+        f'ON {quote(through)} ({quote("hobby_id")}, {quote("customuser_id")})'
+    )
+    if schema_editor.connection.vendor == 'postgresql':
+        # Active users by birth date, with the columns /api/users/ returns,
+        # so its age filtered pages are index-only scans
+        schema_editor.execute(
+            'CREATE INDEX IF NOT EXISTS user_active_dob_covering_idx '
+            'ON api_customuser (date_of_birth, id) INCLUDE (username, name) WHERE is_active'
+        )
+
+
+def drop_indexes(apps, schema_editor):
+    through = apps.get_model('api', 'CustomUser').hobbies.through._meta.db_table
+    if schema_editor.connection.vendor == 'mysql':
+        schema_editor.execute(f'DROP INDEX user_hobbies_hobby_user_idx ON {through}')
+    else:
+        schema_editor.execute('DROP INDEX user_hobbies_hobby_user_idx')
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS user_active_dob_covering_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_task'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(django.db.models.functions.text.Upper('username'), name='user_username_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(django.db.models.functions.text.Upper('email'), name='user_email_upper_idx'),
+        ),
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
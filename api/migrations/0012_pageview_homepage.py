@@ -0,0 +1,33 @@
+# Generated by Django 5.1.1 on 2026-10-18 20:32
+
+from django.db import migrations, models
+from django.db.models import F, Sum
+
+
+def move_site_totals(apps, schema_editor):
+    # 0007 kept the site-wide counts from before page views were keyed under
+    # 'site', which nothing reads. They go to the homepage, the default key of
+    # /api/page-views/
+    PageView = apps.get_model('api', 'PageView')
+    site = PageView.objects.filter(key='site')
+    total = site.aggregate(total=Sum('count'))['total']
+    if total:
+        PageView.objects.get_or_create(key='homepage', shard=0)
+        PageView.objects.filter(key='homepage', shard=0).update(count=F('count') + total)
+    site.delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_catalogue_version'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='pageview',
+            name='key',
+            field=models.CharField(default='homepage', max_length=100),
+        ),
+        migrations.RunPython(move_site_totals, migrations.RunPython.noop),
+    ]
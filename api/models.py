@@ -1,20 +1,79 @@
 from django.db import models
+from django.utils import timezone
+from django.db.models.functions import Lower, Upper
 from django.contrib.auth.models import AbstractUser
-from typing import Optional
+from typing import Iterable, Optional
+
+
+def normalize_hobby_name(name: str) -> str:
+    # Collapse whitespace and capitalize the first letter of each word
+    return ' '.join(name.split()).title()
+
+
+class HobbyManager(models.Manager):
+    def resolve(self, names: Iterable[str]) -> tuple[dict[str, 'Hobby'], set[str]]:
+        """
+        Get or create a hobby for each of ``names`` without racing other writers.
+
+        Missing names are inserted with a single ``INSERT ... ON CONFLICT DO
+        NOTHING`` (``INSERT OR IGNORE`` on SQLite), so concurrent requests
+        creating the same hobby never hit the unique constraint. Returns the
+        hobbies keyed by normalized name and the set of names that were missing.
+        """
+        from .cache import bump_catalogue_version
+
+        wanted = {normalize_hobby_name(name) for name in names} - {''}
+        hobbies = self._by_lower_name(wanted)
+        missing = wanted - hobbies.keys()
+        if missing:
+            self.bulk_create([Hobby(name=name) for name in missing], ignore_conflicts=True)
+            hobbies.update(self._by_lower_name(missing))
+            # bulk_create does not send post_save
+            bump_catalogue_version()
+        return hobbies, missing
+
+    def _by_lower_name(self, names: set[str]) -> dict[str, 'Hobby']:
+        # Matched on LOWER(name) like the unique constraint, whose index it
+        # uses, so rows saved before names were normalized are found too
+        hobbies = self.alias(lower_name=Lower('name')).filter(lower_name__in={name.lower() for name in names})
+        return {normalize_hobby_name(hobby.name): hobby for hobby in hobbies}
+
 
 class Hobby(models.Model):
     id: int = models.AutoField(primary_key=True)
     name: str = models.CharField(max_length=255, unique=True)
+    # Number of users with this hobby, maintained by api.signals so the most
+    # popular hobbies are read off an index instead of counted
+    user_count: int = models.PositiveIntegerField(default=0)
+
+    objects = HobbyManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(Lower('name'), name='hobby_name_ci_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['-user_count', 'id'], name='hobby_popularity_idx'),
+        ]
 
     def save(self, *args: tuple, **kwargs: dict) -> None:
-        # Capitalize the first letter of each word in the name
-        self.name = self.name.title()
+        self.name = normalize_hobby_name(self.name)
         super().save(*args, **kwargs)
 
     def __str__(self) -> str:
         return self.name
 
 
+class CatalogueVersion(models.Model):
+    # A single row, bumped after every change to the hobby catalogue commits.
+    # It lives in the database so that every worker sees the same version,
+    # see api.cache
+    version: int = models.BigIntegerField()
+
+    def __str__(self) -> str:
+        return f"Catalogue version {self.version}"
+
+
 class CustomUser(AbstractUser):
     name: Optional[str] = models.CharField(max_length=255, null=True)
     email: str = models.EmailField(unique=True)
@@ -23,12 +82,81 @@ class CustomUser(AbstractUser):
 
     REQUIRED_FIELDS: list[str] = ['email', 'name', 'date_of_birth']
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Age filters are date_of_birth range scans, id makes them keyset friendly
+            models.Index(fields=['date_of_birth', 'id'], name='user_dob_id_idx'),
+            # iexact compiles to UPPER(column) = UPPER(value) on PostgreSQL, as
+            # in the registration form's username check and password resets
+            models.Index(Upper('username'), name='user_username_upper_idx'),
+            models.Index(Upper('email'), name='user_email_upper_idx'),
+        ]
+
     def __str__(self) -> str:
         return self.username
 
 
 class PageView(models.Model):
-    count = models.IntegerField(default=0)
+    # A counter is spread over several shard rows so that concurrent flushes
+    # from different workers rarely contend for the same row
+    key: str = models.CharField(max_length=100, default='homepage')
+    shard: int = models.PositiveSmallIntegerField(default=0)
+    count = models.BigIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['key', 'shard'], name='pageview_unique_shard'),
+        ]
 
     def __str__(self):
-        return f"Page view count: {self.count}"
\ No newline at end of file
+        return f"Page view count: {self.count}"
+
+
+class HobbyOverlap(models.Model):
+    # Materialized number of hobbies two users share, for the MATCHING_TOP_K
+    # users sharing the most with ``user``, so that a user's matches are a
+    # single index range scan on (user, -shared)
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name="hobby_overlaps")
+    other = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name="+")
+    shared: int = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'other'], name='hobbyoverlap_unique_pair'),
+        ]
+        indexes = [
+            models.Index(fields=['user', '-shared', 'other'], name='hobbyoverlap_ranking_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.user_id} ~ {self.other_id}: {self.shared}"
+
+
+class Task(models.Model):
+    # A unit of deferred work, claimed and run by the run_tasks worker. Tasks
+    # that succeed are deleted, failed ones are kept for inspection
+    PENDING = 'pending'
+    RUNNING = 'running'
+    FAILED = 'failed'
+    STATUS_CHOICES = [(PENDING, 'Pending'), (RUNNING, 'Running'), (FAILED, 'Failed')]
+
+    name: str = models.CharField(max_length=200)
+    queue: str = models.CharField(max_length=50, default='default')
+    args = models.JSONField(default=list)
+    kwargs = models.JSONField(default=dict)
+    status: str = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    attempts: int = models.PositiveSmallIntegerField(default=0)
+    max_attempts: int = models.PositiveSmallIntegerField(default=3)
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error: str = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['queue', 'status', 'run_at', 'id'], name='task_claim_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.name} ({self.status})"
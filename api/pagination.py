@@ -0,0 +1,139 @@
+import base64
+import binascii
+import json
+from bisect import bisect_right
+from operator import itemgetter
+from typing import Any, Optional
+
+from django.db.models import Q, QuerySet
+from django.http import HttpRequest
+
+from .responses import FastJsonResponse
+
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(position: list[Any]) -> str:
+    # Cursors are opaque to clients, they just hand back what they were given
+    raw = json.dumps(position, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: Optional[str], size: int = 1) -> Optional[list[int]]:
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, ValueError):
+        raise InvalidCursor('Invalid cursor')
+    if not isinstance(position, list) or len(position) != size \
+            or not all(isinstance(value, int) for value in position):
+        raise InvalidCursor('Invalid cursor')
+    return position
+
+
+def get_limit(request: HttpRequest, default: int = DEFAULT_LIMIT, maximum: int = MAX_LIMIT) -> int:
+    try:
+        limit = int(request.GET.get('limit', default))
+    except ValueError:
+        return default
+    return max(1, min(limit, maximum))
+
+
+def next_link(request: HttpRequest, cursor: Optional[str]) -> Optional[str]:
+    """Build a ``Link`` header value pointing at the next page, if any."""
+    if cursor is None:
+        return None
+    params = request.GET.copy()
+    params['cursor'] = cursor
+    return '<{}?{}>; rel="next"'.format(request.path, params.urlencode())
+
+
+def paginate(request: HttpRequest, queryset: QuerySet, *fields: str,
+             default: int = DEFAULT_LIMIT) -> tuple[list[tuple], Optional[str]]:
+    """
+    Return one page of ``fields`` from ``queryset`` keyed on ``id``.
+
+    ``id`` must be the first of ``fields``. Pages continue strictly after the
+    cursor's id, so each page is an index range scan regardless of depth.
+    Raises ``InvalidCursor`` for a cursor this function did not produce.
+    """
+    page, limit = _page(request, queryset, fields, default)
+    rows = list(page)
+    return rows, _next_cursor(rows, limit)
+
+
+def _page(request: HttpRequest, queryset: QuerySet, fields: tuple[str, ...],
+          default: int) -> tuple[QuerySet, int]:
+    # The page :func:`paginate` reads, shared with :func:`apaginate`
+    after = decode_cursor(request.GET.get('cursor'))
+    limit = get_limit(request, default=default)
+    if after:
+        queryset = queryset.filter(id__gt=after[0])
+    return queryset.order_by('id').values_list(*fields)[:limit], limit
+
+
+def _next_cursor(rows: list[tuple], limit: int) -> Optional[str]:
+    return encode_cursor([rows[-1][0]]) if len(rows) == limit else None
+
+
+def paginate_by_date(request: HttpRequest, queryset: QuerySet, *fields: str,
+                     default: int = DEFAULT_LIMIT) -> tuple[list[tuple], Optional[str]]:
+    """
+    Like :func:`paginate`, keyed on ``(<date field>, id)`` instead of ``id``.
+
+    ``fields`` must start with ``id`` and the date field. For querysets
+    filtered on a range of that field, so that pages are read in the order of
+    a ``(<date field>, id)`` index rather than sorting the whole range for
+    every page. Rows without a date must already be filtered out. The cursor
+    only holds the last id, its date is looked up again, so that clients
+    cannot read dates, such as birth dates, off it.
+    """
+    date_field = fields[1]
+    after = decode_cursor(request.GET.get('cursor'))
+    limit = get_limit(request, default=default)
+    if after:
+        day = queryset.model._default_manager.filter(id=after[0]).values_list(date_field, flat=True).first()
+        if day is None:
+            raise InvalidCursor('Invalid cursor')
+        # The leading >= keeps it a range scan on the index, in index order
+        queryset = queryset.filter(
+            Q(**{f'{date_field}__gt': day}) | Q(id__gt=after[0]), **{f'{date_field}__gte': day},
+        )
+    rows = list(queryset.order_by(date_field, 'id').values_list(*fields)[:limit])
+    return rows, _next_cursor(rows, limit)
+
+
+def paginate_rows(request: HttpRequest, rows: list[tuple],
+                  default: int = DEFAULT_LIMIT) -> tuple[list[tuple], Optional[str]]:
+    """Like :func:`paginate` for rows already in memory, sorted by their leading id."""
+    after = decode_cursor(request.GET.get('cursor'))
+    limit = get_limit(request, default=default)
+    start = bisect_right(rows, after[0], key=itemgetter(0)) if after else 0
+    page = rows[start:start + limit]
+    return page, _next_cursor(page, limit)
+
+
+async def apaginate(request: HttpRequest, queryset: QuerySet, *fields: str,
+                    default: int = DEFAULT_LIMIT) -> tuple[list[tuple], Optional[str]]:
+    """Async version of :func:`paginate`."""
+    page, limit = _page(request, queryset, fields, default)
+    rows = [row async for row in page]
+    return rows, _next_cursor(rows, limit)
+
+
+def paginated_response(request: HttpRequest, data: list[Any], cursor: Optional[str]) -> FastJsonResponse:
+    # The body stays a plain list for existing clients, the next page is
+    # advertised through a Link header instead
+    response = FastJsonResponse(data, safe=False)
+    link = next_link(request, cursor)
+    if link:
+        response['Link'] = link
+    return response
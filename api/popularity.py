@@ -0,0 +1,68 @@
+from collections.abc import Iterable
+from typing import Any, Optional
+
+from django.db import transaction
+from django.db.models import Count, F
+
+from .models import CustomUser, Hobby
+
+
+UserHobby = CustomUser.hobbies.through
+
+
+def popular_hobbies(limit: int) -> list[dict[str, Any]]:
+    """
+    The ``limit`` hobbies with the most users, most popular first.
+
+    Reads the denormalized ``Hobby.user_count``, so the page is the first
+    ``limit`` entries of the ``(-user_count, id)`` index.
+    """
+    rows = Hobby.objects.order_by('-user_count', 'id').values_list('id', 'name', 'user_count')[:limit]
+    return [
+        {'id': hobby_id, 'name': name, 'user_count': user_count}
+        for hobby_id, name, user_count in rows
+    ]
+
+
+def update_user_counts(hobby_ids: Iterable[int], delta: int) -> None:
+    """Add ``delta`` to the user count of each of ``hobby_ids``."""
+    hobby_ids = list(hobby_ids)
+    if hobby_ids and delta:
+        Hobby.objects.filter(id__in=hobby_ids).update(user_count=F('user_count') + delta)
+
+
+def reconcile_user_counts(hobby_ids: Optional[Iterable[int]] = None, batch_size: int = 1000,
+                          dry_run: bool = False) -> int:
+    """
+    Recount the users of each hobby and fix the counts that drifted.
+
+    Covers every hobby, one id batch at a time, or only ``hobby_ids``. Each
+    batch is one ``GROUP BY`` on the through table and one bulk update of the
+    hobbies whose count differs. Returns the number of hobbies that were off.
+    """
+    queryset = Hobby.objects.all()
+    if hobby_ids is not None:
+        queryset = queryset.filter(id__in=list(hobby_ids))
+    fixed = 0
+    last_id = 0
+    while True:
+        with transaction.atomic():
+            batch = list(
+                queryset.filter(id__gt=last_id).order_by('id').select_for_update()
+                .only('id', 'user_count')[:batch_size]
+            )
+            if not batch:
+                return fixed
+            last_id = batch[-1].id
+            actual = dict(
+                UserHobby.objects.filter(hobby_id__in=[hobby.id for hobby in batch])
+                .values_list('hobby_id').annotate(n=Count('id')).order_by()
+            )
+            drifted = []
+            for hobby in batch:
+                if hobby.user_count != actual.get(hobby.id, 0):
+                    hobby.user_count = actual.get(hobby.id, 0)
+                    drifted.append(hobby)
+            if drifted and not dry_run:
+                Hobby.objects.bulk_update(drifted, ['user_count'])
+            fixed += len(drifted)
@@ -0,0 +1,212 @@
+"""
+A small database-backed task queue for work that should not hold up a request.
+
+Tasks are plain functions registered with :func:`task`. ``enqueue`` stores a
+``Task`` row, inside the caller's transaction, so work is only queued if the
+request that asked for it commits. The ``run_tasks`` management command runs a
+:class:`Worker` that claims due tasks with a conditional ``UPDATE``, runs them
+on a thread pool and retries failures with exponential backoff. Everything
+goes through the regular database, so no broker is needed, and with
+``TASKS_EAGER`` tasks run inline instead, e.g. during development.
+"""
+import logging
+import threading
+import traceback
+from collections import Counter
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Optional
+
+from django.conf import settings
+from django.db import close_old_connections, connections
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Task
+
+
+logger = logging.getLogger(__name__)
+
+
+class TaskDefinition:
+    def __init__(self, func: Callable[..., Any], name: str, queue: str, max_attempts: int,
+                 retry_delay: float, concurrency: Optional[int], unique: bool) -> None:
+        self.func = func
+        self.name = name
+        self.queue = queue
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.concurrency = concurrency
+        self.unique = unique
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.func(*args, **kwargs)
+
+    def enqueue(self, *args: Any, delay: float = 0, **kwargs: Any) -> Optional[Task]:
+        return enqueue(self.name, args, kwargs, delay=delay)
+
+
+_registry: dict[str, TaskDefinition] = {}
+
+
+def task(func: Optional[Callable[..., Any]] = None, *, name: Optional[str] = None, queue: str = 'default',
+         max_attempts: int = 3, retry_delay: float = 5.0, concurrency: Optional[int] = None,
+         unique: bool = False) -> Any:
+    """
+    Register ``func`` as a task, callable as before and queued with ``.enqueue()``.
+
+    ``concurrency`` caps how many of these tasks run at once across workers.
+    A ``unique`` task is not queued again while an identical one is still
+    pending, which suits tasks that recompute state from scratch. Arguments
+    must be JSON serializable.
+    """
+    def register(func: Callable[..., Any]) -> TaskDefinition:
+        definition = TaskDefinition(
+            func, name or f'{func.__module__}.{func.__qualname__}', queue,
+            max_attempts, retry_delay, concurrency, unique,
+        )
+        _registry[definition.name] = definition
+        return definition
+
+    return register(func) if func is not None else register
+
+
+def enqueue(name: str, args: Iterable[Any] = (), kwargs: Optional[dict[str, Any]] = None,
+            delay: float = 0) -> Optional[Task]:
+    """Queue the task ``name``, or run it right away with ``TASKS_EAGER``."""
+    definition = _registry[name]
+    args, kwargs = list(args), kwargs or {}
+    if getattr(settings, 'TASKS_EAGER', False):
+        definition.func(*args, **kwargs)
+        return None
+    if definition.unique and Task.objects.filter(
+        name=name, args=args, kwargs=kwargs, status=Task.PENDING,
+    ).exists():
+        return None
+    return Task.objects.create(
+        name=name,
+        queue=definition.queue,
+        args=args,
+        kwargs=kwargs,
+        max_attempts=definition.max_attempts,
+        run_at=timezone.now() + timedelta(seconds=delay),
+    )
+
+
+class Worker:
+    """
+    Claims due tasks from ``queues`` and runs up to ``concurrency`` at a time.
+
+    A task that has been running for longer than ``lease`` seconds is assumed
+    to belong to a worker that died and is handed out again.
+    """
+
+    def __init__(self, queues: list[str], concurrency: int = 4, poll_interval: float = 1.0,
+                 lease: float = 300.0) -> None:
+        self.queues = queues
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.lease = lease
+        self.stopping = threading.Event()
+        self.running: set[Future] = set()
+        self.processed = 0
+        self._lock = threading.Lock()
+
+    def stop(self, *args: Any) -> None:
+        self.stopping.set()
+
+    def run(self, burst: bool = False) -> int:
+        """Work until stopped, or until the queues are empty with ``burst``. Returns the tasks run."""
+        with ThreadPoolExecutor(self.concurrency, thread_name_prefix='task') as executor:
+            while not self.stopping.is_set():
+                self.requeue_expired()
+                with self._lock:
+                    free = self.concurrency - len(self.running)
+                claimed = self.claim(free) if free > 0 else []
+                for task_id in claimed:
+                    future = executor.submit(self.execute, task_id)
+                    with self._lock:
+                        self.running.add(future)
+                    future.add_done_callback(self._done)
+                if burst and not claimed:
+                    with self._lock:
+                        idle = not self.running
+                    if idle:
+                        break
+                # Nothing else is due yet, or every slot is busy and one
+                # frees up soon
+                self.stopping.wait(self.poll_interval if len(claimed) < free else 0.05)
+            # Leaving the block waits for the tasks already running
+        close_old_connections()
+        return self.processed
+
+    def _done(self, future: Future) -> None:
+        with self._lock:
+            self.running.discard(future)
+            self.processed += 1
+
+    def claim(self, limit: int) -> list[int]:
+        now = timezone.now()
+        due = list(
+            Task.objects.filter(queue__in=self.queues, status=Task.PENDING, run_at__lte=now)
+            .order_by('run_at', 'id').values_list('id', 'name')[:limit * 4]
+        )
+        if not due:
+            return []
+        limited = {name for _, name in due if name in _registry and _registry[name].concurrency is not None}
+        running = Counter(
+            Task.objects.filter(status=Task.RUNNING, name__in=limited).values_list('name', flat=True)
+        ) if limited else Counter()
+
+        claimed = []
+        for task_id, name in due:
+            if len(claimed) == limit:
+                break
+            if name in limited and running[name] >= _registry[name].concurrency:
+                continue
+            # Only one worker's UPDATE can still match a pending row
+            updated = Task.objects.filter(id=task_id, status=Task.PENDING).update(
+                status=Task.RUNNING, locked_at=now, attempts=F('attempts') + 1,
+            )
+            if updated:
+                claimed.append(task_id)
+                running[name] += 1
+        return claimed
+
+    def execute(self, task_id: int) -> None:
+        close_old_connections()
+        try:
+            task = Task.objects.get(id=task_id)
+            definition = _registry.get(task.name)
+            try:
+                if definition is None:
+                    raise LookupError(f'Unknown task {task.name}')
+                definition.func(*task.args, **task.kwargs)
+            except Exception:
+                logger.exception('Task %s %s failed on attempt %s', task.id, task.name, task.attempts)
+                error = traceback.format_exc()
+                now = timezone.now()
+                if definition is not None and task.attempts < task.max_attempts:
+                    delay = definition.retry_delay * 2 ** (task.attempts - 1)
+                    Task.objects.filter(id=task.id).update(
+                        status=Task.PENDING, locked_at=None, last_error=error,
+                        run_at=now + timedelta(seconds=delay),
+                    )
+                else:
+                    Task.objects.filter(id=task.id).update(
+                        status=Task.FAILED, locked_at=None, last_error=error, finished_at=now,
+                    )
+            else:
+                Task.objects.filter(id=task.id).delete()
+        finally:
+            connections.close_all()
+
+    def requeue_expired(self) -> None:
+        expired = Task.objects.filter(
+            status=Task.RUNNING, locked_at__lt=timezone.now() - timedelta(seconds=self.lease),
+        )
+        expired.filter(attempts__lt=F('max_attempts')).update(status=Task.PENDING, locked_at=None)
+        expired.update(
+            status=Task.FAILED, locked_at=None, last_error='Lease expired', finished_at=timezone.now(),
+        )
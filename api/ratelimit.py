@@ -0,0 +1,196 @@
+"""
+Token bucket rate limits for the endpoints that are expensive to abuse.
+
+Every scope in ``RATE_LIMITS``, e.g. ``'login': '10/minute'``, gives each
+client a bucket of that many tokens, refilled evenly over the period. A
+request takes one token and is answered with 429 when none is left. Clients
+are the logged in user, or the client IP for anonymous requests. Logins are
+limited per username and client IP, and more loosely per client IP alone.
+
+Buckets live in the ``ratelimit`` cache, which is shared by every worker
+unless it is a local memory cache, in which case each worker enforces the
+limits on its own. Reading and writing a bucket are two cache calls, so
+concurrent requests from one client on different workers can occasionally
+both take the last token, which is fine for throttling. When the cache
+cannot hold them, because it is a dummy cache or its server is down, each
+process keeps its own buckets in memory instead.
+"""
+import hashlib
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import wraps
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.http import HttpRequest, HttpResponse, JsonResponse
+
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400}
+
+# Buckets kept per process when the cache cannot be used, least recently
+# used ones are dropped first
+LOCAL_BUCKETS = 10000
+
+
+def parse_rate(rate: str) -> Optional[tuple[int, float]]:
+    """``'10/minute'`` to ``(10, 60.0)``, None for an empty rate."""
+    if not rate:
+        return None
+    count, _, period = rate.partition('/')
+    seconds = PERIODS.get(period.strip().lower().removesuffix('s'))
+    if seconds is None or not count.strip().isdigit() or int(count) < 1:
+        raise ValueError(f'Invalid rate {rate!r}, expected e.g. 10/minute')
+    return int(count), float(seconds)
+
+
+def take(tokens: float, updated: float, now: float, capacity: int, period: float) -> tuple[float, float]:
+    """
+    Refill a bucket of ``capacity`` tokens per ``period`` up to ``now`` and
+    take one token. Returns the tokens left, negative when there was none to
+    take, and the seconds until the next one.
+    """
+    per_second = capacity / period
+    tokens = min(capacity, tokens + (now - updated) * per_second)
+    if tokens < 1:
+        return tokens - 1, (1 - tokens) / per_second
+    return tokens - 1, 0.0
+
+
+class LocalBuckets:
+    """Buckets in process memory, safe to use from any thread."""
+
+    def __init__(self, size: int = LOCAL_BUCKETS) -> None:
+        self.size = size
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, capacity: int, period: float) -> float:
+        """Take a token from bucket ``key``, returns the seconds to wait when there is none."""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (capacity, now))
+            left, wait = take(tokens, updated, now, capacity, period)
+            if left >= 0:
+                tokens, updated = left, now
+            self._buckets[key] = (tokens, updated)
+            while len(self._buckets) > self.size:
+                self._buckets.popitem(last=False)
+        return wait
+
+
+def cache_hit(key: str, capacity: int, period: float) -> float:
+    """Like ``LocalBuckets.hit`` with the bucket kept in the ``ratelimit`` cache."""
+    cache = caches['ratelimit']
+    now = time.time()
+    tokens, updated = cache.get(key) or (capacity, now)
+    left, wait = take(tokens, updated, now, capacity, period)
+    if left >= 0:
+        # A bucket left alone for a whole period is full again, the same as no bucket
+        cache.set(key, (left, now), math.ceil(period))
+    return wait
+
+
+_local = LocalBuckets()
+
+
+_proxy_warned = False
+
+
+def client_ip(request: HttpRequest) -> str:
+    global _proxy_warned
+    header = getattr(settings, 'RATE_LIMIT_IP_HEADER', '')
+    if header:
+        # Proxies append to X-Forwarded-For, so the last address is the one
+        # the trusted proxy saw
+        address = request.META.get(header, '').rsplit(',', 1)[-1].strip()
+        if address:
+            return address
+    elif not _proxy_warned and 'HTTP_X_FORWARDED_FOR' in request.META:
+        _proxy_warned = True
+        logger.warning(
+            'Request came through a proxy but RATE_LIMIT_IP_HEADER is not set, '
+            'anonymous clients share the rate limits of the proxy address'
+        )
+    return request.META.get('REMOTE_ADDR', '')
+
+
+def client_key(request: HttpRequest) -> str:
+    """The logged in user, or the client IP of an anonymous request."""
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return f'user:{user.pk}'
+    return f'ip:{client_ip(request)}'
+
+
+def ip_key(request: HttpRequest) -> str:
+    """The client IP, whether or not the request is logged in."""
+    return f'ip:{client_ip(request)}'
+
+
+def login_key(request: HttpRequest) -> str:
+    """
+    The username tried and the client IP, so that failed attempts at one
+    account from one address neither lock out other users behind the same
+    address nor the same user elsewhere.
+    """
+    username = request.POST.get('username', '').casefold()
+    # Hashed to keep the cache key short and free of spaces
+    return f'{client_ip(request)}:{hashlib.sha256(username.encode()).hexdigest()[:32]}'
+
+
+def hit(request: HttpRequest, scope: str, key: Callable[[HttpRequest], str] = client_key) -> float:
+    """
+    Take a token from the client's bucket for ``scope``. Returns 0 when the
+    request may go ahead, or else the seconds until it may be retried.
+    """
+    rate = parse_rate(getattr(settings, 'RATE_LIMITS', {}).get(scope, ''))
+    if rate is None:
+        return 0.0
+    capacity, period = rate
+    bucket = f'{scope}:{key(request)}'
+    if not isinstance(caches['ratelimit'], DummyCache):
+        try:
+            return cache_hit(bucket, capacity, period)
+        except Exception:
+            logger.warning('Rate limit cache unavailable, using in-process buckets', exc_info=True)
+    return _local.hit(bucket, capacity, period)
+
+
+def too_many_requests(retry_after: float, json: bool = True) -> HttpResponse:
+    seconds = max(1, math.ceil(retry_after))
+    message = f'Too many requests, try again in {seconds} seconds.'
+    if json:
+        response = JsonResponse({'error': message}, status=429)
+    else:
+        response = HttpResponse(message, status=429, content_type='text/plain; charset=utf-8')
+    response['Retry-After'] = str(seconds)
+    return response
+
+
+def rate_limit(scope: str, methods: tuple[str, ...] = ('POST',), json: bool = True,
+               key: Callable[[HttpRequest], str] = client_key,
+               ) -> Callable[[Callable[..., HttpResponse]], Callable[..., HttpResponse]]:
+    """
+    Limit ``methods`` requests to a view to the ``RATE_LIMITS`` rate of
+    ``scope``, with one bucket per ``key(request)``. Put it below
+    ``login_required`` so that requests which are turned away anyway do not
+    use up tokens. Form views pass ``json=False`` to answer with plain text.
+    """
+    def decorator(view: Callable[..., HttpResponse]) -> Callable[..., HttpResponse]:
+        @wraps(view)
+        def wrapper(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+            if request.method in methods:
+                retry_after = hit(request, scope, key)
+                if retry_after:
+                    return too_many_requests(retry_after, json)
+            return view(request, *args, **kwargs)
+        return wrapper
+    return decorator
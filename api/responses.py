@@ -0,0 +1,62 @@
+import json
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
+from typing import Any
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse, StreamingHttpResponse
+
+from .instrumentation import serializing
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_encoder = DjangoJSONEncoder()
+
+
+def dumps(data: Any) -> bytes:
+    """Encode ``data`` with orjson when it is installed, the stdlib otherwise."""
+    with serializing():
+        if orjson is not None:
+            return orjson.dumps(data, default=_encoder.default)
+        return json.dumps(data, cls=DjangoJSONEncoder, separators=(',', ':')).encode()
+
+
+class FastJsonResponse(HttpResponse):
+    """Drop-in replacement for ``JsonResponse`` using :func:`dumps`."""
+
+    def __init__(self, data: Any, safe: bool = True, **kwargs: Any) -> None:
+        if safe and not isinstance(data, dict):
+            raise TypeError('In order to allow non-dict objects to be serialized set the safe parameter to False.')
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(content=dumps(data), **kwargs)
+
+
+def rows_as_dicts(keys: Sequence[str], rows: Iterable[Sequence[Any]]) -> Iterator[dict[str, Any]]:
+    for row in rows:
+        yield dict(zip(keys, row))
+
+
+def streaming_json_response(keys: Sequence[str], rows: Iterable[Sequence[Any]],
+                            chunk_size: int = 2000, **kwargs: Any) -> StreamingHttpResponse:
+    """
+    Stream ``rows`` as a JSON list of objects with ``keys``.
+
+    Rows are typically a ``values_list().iterator()`` so that neither model
+    instances nor the whole payload ever exist in memory. Each chunk of rows
+    is encoded in one call and sent as it is ready.
+    """
+    def chunks() -> Iterator[bytes]:
+        yield b'['
+        iterator = iter(rows)
+        separator = b''
+        while chunk := list(islice(iterator, chunk_size)):
+            yield separator + dumps(list(rows_as_dicts(keys, chunk)))[1:-1]
+            separator = b','
+        yield b']'
+
+    kwargs.setdefault('content_type', 'application/json')
+    return StreamingHttpResponse(chunks(), **kwargs)
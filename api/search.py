@@ -0,0 +1,87 @@
+import threading
+from bisect import bisect_left
+from typing import Optional
+
+from django.conf import settings
+
+from .cache import catalogue_version
+from .models import Hobby
+
+
+class HobbyIndex:
+    """
+    Sorted in-memory arrays of hobby names for type-ahead search.
+
+    ``names`` holds every casefolded name and ``words`` every suffix of a name
+    that starts at a later word, so "climb" finds "Rock Climbing" as well.
+    Both are searched with a binary search followed by a short forward scan.
+    """
+
+    def __init__(self, version: int, hobbies: list[tuple[int, str]], oversized: bool = False) -> None:
+        self.version = version
+        self.oversized = oversized
+        self.names: list[tuple[str, int, str]] = []
+        self.words: list[tuple[str, int, str]] = []
+        for hobby_id, name in hobbies:
+            key = name.casefold()
+            self.names.append((key, hobby_id, name))
+            position = key.find(' ')
+            while position != -1:
+                self.words.append((key[position + 1:], hobby_id, name))
+                position = key.find(' ', position + 1)
+        self.names.sort()
+        self.words.sort()
+
+    def search(self, query: str, limit: int) -> list[dict[str, object]]:
+        prefix = query.casefold()
+        results: list[dict[str, object]] = []
+        seen: set[int] = set()
+        for entries in (self.names, self.words):
+            index = bisect_left(entries, (prefix,))
+            while index < len(entries) and len(results) < limit:
+                key, hobby_id, name = entries[index]
+                if not key.startswith(prefix):
+                    break
+                if hobby_id not in seen:
+                    seen.add(hobby_id)
+                    results.append({"id": hobby_id, "name": name})
+                index += 1
+        return results
+
+
+_index: Optional[HobbyIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_index() -> Optional[HobbyIndex]:
+    """
+    Return the index for the current catalogue version, rebuilding it lazily.
+
+    The version is read from the database, so hobbies created through any
+    worker become searchable in this one on its next search.
+
+    Returns ``None`` when the catalogue is larger than
+    ``HOBBY_SEARCH_INDEX_LIMIT`` and should be searched in the database.
+    """
+    global _index
+    version = catalogue_version()
+    index = _index
+    if index is None or index.version != version:
+        with _index_lock:
+            if _index is None or _index.version != version:
+                max_size = getattr(settings, 'HOBBY_SEARCH_INDEX_LIMIT', 200_000)
+                if Hobby.objects.count() > max_size:
+                    # An empty index for this version records the decision
+                    _index = HobbyIndex(version, [], oversized=True)
+                else:
+                    _index = HobbyIndex(version, list(Hobby.objects.values_list('id', 'name')))
+            index = _index
+    return None if index.oversized else index
+
+
+def search_hobbies(query: str, limit: int) -> list[dict[str, object]]:
+    index = get_index()
+    if index is not None:
+        return index.search(query, limit)
+    hobbies = Hobby.objects.filter(name__istartswith=query).order_by('name').values_list('id', 'name')[:limit]
+    return [{"id": hobby_id, "name": name} for hobby_id, name in hobbies]
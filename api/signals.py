@@ -0,0 +1,123 @@
+from typing import Any, Optional
+
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.db import transaction
+from django.dispatch import receiver
+
+from . import events, tasks
+from .cache import bump_catalogue_version, invalidate_user, invalidate_user_hobbies
+from .matching import CHUNK_SIZE, UserHobby, remove_hobby, remove_user
+from .models import CustomUser, Hobby
+from .popularity import update_user_counts
+
+
+@receiver(m2m_changed, sender=UserHobby)
+def hobbies_changed(sender: type, instance: Any, action: str, reverse: bool,
+                    pk_set: Optional[set[int]], **kwargs: Any) -> None:
+    # Additions are counted once the rows exist and removals while they still
+    # do, so in both cases the other users in the same batch are visible and
+    # each pair has to be counted only once.
+    if action == 'post_add':
+        delta = 1
+    elif action == 'pre_remove':
+        # Unlike additions, pk_set here also contains ids that were never linked
+        delta = -1
+        if reverse:
+            pk_set = set(instance.users.filter(id__in=pk_set).values_list('id', flat=True))
+        else:
+            pk_set = set(instance.hobbies.filter(id__in=pk_set).values_list('id', flat=True))
+    elif action == 'pre_clear':
+        delta = -1
+        if reverse:
+            pk_set = set(instance.users.values_list('id', flat=True))
+        else:
+            pk_set = set(instance.hobbies.values_list('id', flat=True))
+    else:
+        return
+    if not pk_set:
+        return
+
+    if not reverse:
+        update_user_counts(pk_set, delta)
+        events.hobbies_changed([instance.id], pk_set, added=delta > 0)
+    else:
+        update_user_counts([instance.id], delta * len(pk_set))
+        events.hobbies_changed(pk_set, [instance.id], added=delta > 0)
+
+    # Match lists are brought up to date by the task queue once the change
+    # has been committed, so the request does not wait for them
+    if not reverse:
+        changes = [(instance.id, sorted(pk_set))]
+    else:
+        # ``instance`` is a Hobby and ``pk_set`` holds the users gaining or losing it
+        changes = [(user_id, [instance.id]) for user_id in sorted(pk_set)]
+
+    def enqueue_updates() -> None:
+        for user_id, hobby_ids in changes:
+            tasks.update_overlaps.enqueue(user_id, hobby_ids)
+
+    transaction.on_commit(enqueue_updates)
+
+
+def enqueue_refreshes(user_ids: list[int]) -> None:
+    """Have the task queue recompute the match lists of ``user_ids`` after commit."""
+    def enqueue() -> None:
+        for start in range(0, len(user_ids), CHUNK_SIZE):
+            tasks.refresh_overlaps.enqueue(*user_ids[start:start + CHUNK_SIZE])
+
+    if user_ids:
+        transaction.on_commit(enqueue)
+
+
+@receiver(pre_delete, sender=Hobby)
+def hobby_deleted(sender: type, instance: Hobby, **kwargs: Any) -> None:
+    # Deleting a hobby cascades to the through table without m2m_changed. Its
+    # share of every overlap is taken out at once rather than per holder
+    user_ids = list(instance.users.values_list('id', flat=True))
+    if user_ids:
+        invalidate_user_hobbies(user_ids)
+        transaction.on_commit(lambda: invalidate_user_hobbies(user_ids))
+        events.hobbies_changed(user_ids, [instance.id], added=False)
+        enqueue_refreshes(remove_hobby(instance.id))
+
+
+@receiver(pre_delete, sender=CustomUser)
+def user_deleted(sender: type, instance: CustomUser, **kwargs: Any) -> None:
+    # The user's memberships cascade without m2m_changed as well, and so do
+    # its overlap rows. Full match lists it was in lose an entry
+    update_user_counts(instance.hobbies.values_list('id', flat=True), -1)
+    enqueue_refreshes(remove_user(instance.id))
+
+
+@receiver(post_save, sender=Hobby)
+@receiver(post_delete, sender=Hobby)
+def hobby_catalogue_changed(sender: type, instance: Hobby, created: bool = False, **kwargs: Any) -> None:
+    bump_catalogue_version()
+    if kwargs['signal'] is post_save and not created:
+        # Possibly renamed, the hobby lists cached for its users show the old name
+        user_ids = list(instance.users.values_list('id', flat=True))
+        invalidate_user_hobbies(user_ids)
+        transaction.on_commit(lambda: invalidate_user_hobbies(user_ids))
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def user_changed(sender: type, instance: CustomUser, **kwargs: Any) -> None:
+    # Also after commit, in case the old row was cached again in between
+    invalidate_user(instance.pk)
+    transaction.on_commit(lambda: invalidate_user(instance.pk))
+
+
+@receiver(m2m_changed, sender=UserHobby)
+def user_hobbies_changed(sender: type, instance: Any, action: str, reverse: bool,
+                         pk_set: Optional[set[int]], **kwargs: Any) -> None:
+    if action not in ('post_add', 'post_remove', 'pre_clear'):
+        return
+    if not reverse:
+        user_ids = {instance.pk}
+    elif action == 'pre_clear':
+        user_ids = set(instance.users.values_list('id', flat=True))
+    else:
+        user_ids = pk_set or set()
+    invalidate_user_hobbies(user_ids)
+    transaction.on_commit(lambda: invalidate_user_hobbies(user_ids))
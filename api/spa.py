@@ -0,0 +1,136 @@
+"""
+The HTML shell of the Vite single page app, rendered once and kept in memory.
+
+With ``build.manifest`` enabled Vite writes ``manifest.json`` next to the
+bundle, listing the hashed file of each entry point with its CSS and the
+chunks it imports. The shell links those files through the staticfiles
+storage, so after ``collectstatic`` they point at the fingerprinted,
+precompressed copies WhiteNoise serves as immutable. Without a manifest the
+``index.html`` moved into the templates by ``npm run build`` is used as is.
+``StaticFilesMiddleware`` serves the bundle itself.
+"""
+import json
+import os
+import re
+import threading
+from typing import Any, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.http import HttpRequest, HttpResponse
+from django.template.loader import render_to_string
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+
+SPA_STATIC_DIR = 'api/spa'
+MANIFEST = f'{SPA_STATIC_DIR}/manifest.json'
+ENTRY = 'index.html'
+
+_lock = threading.Lock()
+_shell: Optional[tuple[Optional[float], str]] = None
+
+
+def read_manifest() -> tuple[Optional[float], Optional[dict[str, Any]]]:
+    path = finders.find(MANIFEST)
+    if not path:
+        return None, None
+    with open(path) as f:
+        return os.path.getmtime(path), json.load(f)
+
+
+def entry_assets(manifest: dict[str, Any], entry: str = ENTRY) -> dict[str, list[str]]:
+    """Static URLs of the script, stylesheets and preloaded chunks of ``entry``."""
+    chunk = manifest[entry]
+    styles = list(chunk.get('css', []))
+    preloads = []
+    seen = {entry}
+    pending = list(chunk.get('imports', []))
+    while pending:
+        name = pending.pop(0)
+        if name in seen:
+            continue
+        seen.add(name)
+        imported = manifest[name]
+        preloads.append(imported['file'])
+        styles.extend(css for css in imported.get('css', []) if css not in styles)
+        pending.extend(imported.get('imports', []))
+
+    def url(file: str) -> str:
+        return staticfiles_storage.url(f'{SPA_STATIC_DIR}/{file}')
+
+    return {
+        'scripts': [url(chunk['file'])],
+        'styles': [url(file) for file in styles],
+        'preloads': [url(file) for file in preloads],
+    }
+
+
+def render_shell() -> tuple[Optional[float], str]:
+    mtime, manifest = read_manifest()
+    if manifest is None:
+        return None, render_to_string('api/spa/index.html')
+    return mtime, render_to_string('api/spa/shell.html', entry_assets(manifest))
+
+
+def shell() -> str:
+    """
+    The rendered shell, built on first use.
+
+    In DEBUG the manifest's modification time is checked on every call so a
+    rebuild of the frontend shows up without restarting the server.
+    """
+    global _shell
+    current = _shell
+    if current is not None and settings.DEBUG:
+        path = finders.find(MANIFEST)
+        if (os.path.getmtime(path) if path else None) != current[0]:
+            current = None
+    if current is None:
+        with _lock:
+            current = _shell = render_shell()
+    return current[1]
+
+
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoise that also treats the Vite bundle's own hashed names as immutable.
+
+    Files collected by the manifest storage are recognised by WhiteNoise
+    already. Vite names its assets ``name-<8 character hash>.ext`` too, and
+    those URLs, used when the shell falls back to Vite's index.html, are
+    just as safe to cache forever.
+
+    WhiteNoise itself is sync only, which under ASGI would run every request
+    through a thread. Here only the static files it serves leave the event
+    loop, other requests are passed on as they are.
+    """
+    sync_capable = True
+    async_capable = True
+    vite_asset = re.compile(r'-[\w-]{8}\.(js|css|woff2?|svg|png|jpe?g|webp|gif)$')
+
+    def __init__(self, get_response: Any = None, settings: Any = settings) -> None:
+        super().__init__(get_response, settings)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            # Opens and stats the file
+            return await sync_to_async(self.serve)(static_file, request)
+        return await self.get_response(request)
+
+    def immutable_file_test(self, path: str, url: str) -> bool:
+        if super().immutable_file_test(path, url):
+            return True
+        return url.startswith(f'{self.static_prefix}{SPA_STATIC_DIR}/assets/') and bool(self.vite_asset.search(url))
@@ -18,7 +18,7 @@
   * vue-router v4.4.5
   * (c) 2024 Eduardo San Martin Morote
   * @license MIT
-  */const pn=typeof document<"u";function Ga(e){return typeof e=="object"||"displayName"in e||"props"in e||"__vccOpts"in e}function kd(e){return e.__esModule||e[Symbol.toStringTag]==="Module"||e.default&&Ga(e.default)}const st=Object.assign;function kr(e,t){const n={};for(const s in t){const r=t[s];n[s]=oe(r)?r.map(e):e(r)}return n}const ss=()=>{},oe=Array.isArray,za=/#/g,Hd=/&/g,Vd=/\//g,Fd=/=/g,jd=/\?/g,Xa=/\+/g,Wd=/%5B/g,Bd=/%5D/g,Qa=/%5E/g,Kd=/%60/g,Ja=/%7B/g,Ud=/%7C/g,Za=/%7D/g,Yd=/%20/g;function Wi(e){return encodeURI(""+e).replace(Ud,"|").replace(Wd,"[").replace(Bd,"]")}function qd(e){return Wi(e).replace(Ja,"{").replace(Za,"}").replace(Qa,"^")}function hi(e){return Wi(e).replace(Xa,"%2B").replace(Yd,"+").replace(za,"%23").replace(Hd,"%26").replace(Kd,"`").replace(Ja,"{").replace(Za,"}").replace(Qa,"^")}function Gd(e){return hi(e).replace(Fd,"%3D")}function zd(e){return Wi(e).replace(za,"%23").replace(jd,"%3F")}function Xd(e){return e==null?"":zd(e).replace(Vd,"%2F")}function hs(e){try{return decodeURIComponent(""+e)}catch{}return""+e}const Qd=/\/$/,Jd=e=>e.replace(Qd,"");function Hr(e,t,n="/"){let s,r={},i="",o="";const l=t.indexOf("#");let a=t.indexOf("?");return l<a&&l>=0&&(a=-1),a>-1&&(s=t.slice(0,a),i=t.slice(a+1,l>-1?l:t.length),r=e(i)),l>-1&&(s=s||t.slice(0,l),o=t.slice(l,t.length)),s=nh(s??t,n),{fullPath:s+(i&&"?")+i+o,path:s,query:r,hash:hs(o)}}function Zd(e,t){const n=t.query?e(t.query):"";return t.path+(n&&"?")+n+(t.hash||"")}function Ko(e,t){return!t||!e.toLowerCase().startsWith(t.toLowerCase())?e:e.slice(t.length)||"/"}function th(e,t,n){const s=t.matched.length-1,r=n.matched.length-1;return s>-1&&s===r&&$n(t.matched[s],n.matched[r])&&tc(t.params,n.params)&&e(t.query)===e(n.query)&&t.hash===n.hash}function $n(e,t){return(e.aliasOf||e)===(t.aliasOf||t)}function tc(e,t){if(Object.keys(e).length!==Object.keys(t).length)return!1;for(const n in e)if(!eh(e[n],t[n]))return!1;return!0}function eh(e,t){return oe(e)?Uo(e,t):oe(t)?Uo(t,e):e===t}function Uo(e,t){return oe(t)?e.length===t.length&&e.every((n,s)=>n===t[s]):e.length===1&&e[0]===t}function nh(e,t){if(e.startsWith("/"))return e;if(!e)return t;const n=t.split("/"),s=e.split("/"),r=s[s.length-1];(r===".."||r===".")&&s.push("");let i=n.length-1,o,l;for(o=0;o<s.length;o++)if(l=s[o],l!==".")if(l==="..")i>1&&i--;else break;return n.slice(0,i).join("/")+"/"+s.slice(o).join("/")}const xe={path:"/",name:void 0,params:{},query:{},hash:"",fullPath:"/",matched:[],meta:{},redirectedFrom:void 0};var ps;(function(e){e.pop="pop",e.push="push"})(ps||(ps={}));var rs;(function(e){e.back="back",e.forward="forward",e.unknown=""})(rs||(rs={}));function sh(e){if(!e)if(pn){const t=document.querySelector("base");e=t&&t.getAttribute("href")||"/",e=e.replace(/^\w+:\/\/[^\/]+/,"")}else e="/";return e[0]!=="/"&&e[0]!=="#"&&(e="/"+e),Jd(e)}const rh=/^[^#]+#/;function ih(e,t){return e.replace(rh,"#")+t}function oh(e,t){const n=document.documentElement.getBoundingClientRect(),s=e.getBoundingClientRect();return{behavior:t.behavior,left:s.left-n.left-(t.left||0),top:s.top-n.top-(t.top||0)}}const _r=()=>({left:window.scrollX,top:window.scrollY});function lh(e){let t;if("el"in e){const n=e.el,s=typeof n=="string"&&n.startsWith("#"),r=typeof n=="string"?s?document.getElementById(n.slice(1)):document.querySelector(n):n;if(!r)return;t=oh(r,e)}else t=e;"scrollBehavior"in document.documentElement.style?window.scrollTo(t):window.scrollTo(t.left!=null?t.left:window.scrollX,t.top!=null?t.top:window.scrollY)}function Yo(e,t){return(history.state?history.state.position-t:-1)+e}const pi=new Map;function ah(e,t){pi.set(e,t)}function ch(e){const t=pi.get(e);return pi.delete(e),t}let uh=()=>location.protocol+"//"+location.host;function ec(e,t){const{pathname:n,search:s,hash:r}=t,i=e.indexOf("#");if(i>-1){let l=r.includes(e.slice(i))?e.slice(i).length:1,a=r.slice(l);return a[0]!=="/"&&(a="/"+a),Ko(a,"")}return Ko(n,e)+s+r}function fh(e,t,n,s){let r=[],i=[],o=null;const l=({state:m})=>{const p=ec(e,location),y=n.value,v=t.value;let x=0;if(m){if(n.value=p,t.value=m,o&&o===y){o=null;return}x=v?m.position-v.position:0}else s(p);r.forEach(S=>{S(n.value,y,{delta:x,type:ps.pop,direction:x?x>0?rs.forward:rs.back:rs.unknown})})};function a(){o=n.value}function u(m){r.push(m);const p=()=>{const y=r.indexOf(m);y>-1&&r.splice(y,1)};return i.push(p),p}function c(){const{history:m}=window;m.state&&m.replaceState(st({},m.state,{scroll:_r()}),"")}function f(){for(const m of i)m();i=[],window.removeEventListener("popstate",l),window.removeEventListener("beforeunload",c)}return window.addEventListener("popstate",l),window.addEventListener("beforeunload",c,{passive:!0}),{pauseListeners:a,listen:u,destroy:f}}function qo(e,t,n,s=!1,r=!1){return{back:e,current:t,forward:n,replaced:s,position:window.history.length,scroll:r?_r():null}}function dh(e){const{history:t,location:n}=window,s={value:ec(e,n)},r={value:t.state};r.value||i(s.value,{back:null,current:s.value,forward:null,position:t.length-1,replaced:!0,scroll:null},!0);function i(a,u,c){const f=e.indexOf("#"),m=f>-1?(n.host&&document.querySelector("base")?e:e.slice(f))+a:uh()+e+a;try{t[c?"replaceState":"pushState"](u,"",m),r.value=u}catch(p){console.error(p),n[c?"replace":"assign"](m)}}function o(a,u){const c=st({},t.state,qo(r.value.back,a,r.value.forward,!0),u,{position:r.value.position});i(a,c,!0),s.value=a}function l(a,u){const c=st({},r.value,t.state,{forward:a,scroll:_r()});i(c.current,c,!0);const f=st({},qo(s.value,a,null),{position:c.position+1},u);i(a,f,!1),s.value=a}return{location:s,state:r,push:l,replace:o}}function hh(e){e=sh(e);const t=dh(e),n=fh(e,t.state,t.location,t.replace);function s(i,o=!0){o||n.pauseListeners(),history.go(i)}const r=st({location:"",base:e,go:s,createHref:ih.bind(null,e)},t,n);return Object.defineProperty(r,"location",{enumerable:!0,get:()=>t.location.value}),Object.defineProperty(r,"state",{enumerable:!0,get:()=>t.state.value}),r}function ph(e){return typeof e=="string"||e&&typeof e=="object"}function nc(e){return typeof e=="string"||typeof e=="symbol"}const sc=Symbol("");var Go;(function(e){e[e.aborted=4]="aborted",e[e.cancelled=8]="cancelled",e[e.duplicated=16]="duplicated"})(Go||(Go={}));function Pn(e,t){return st(new Error,{type:e,[sc]:!0},t)}function ve(e,t){return e instanceof Error&&sc in e&&(t==null||!!(e.type&t))}const zo="[^/]+?",mh={sensitive:!1,strict:!1,start:!0,end:!0},gh=/[.+*?^${}()[\]/\\]/g;function _h(e,t){const n=st({},mh,t),s=[];let r=n.start?"^":"";const i=[];for(const u of e){const c=u.length?[]:[90];n.strict&&!u.length&&(r+="/");for(let f=0;f<u.length;f++){const m=u[f];let p=40+(n.sensitive?.25:0);if(m.type===0)f||(r+="/"),r+=m.value.replace(gh,"\\$&"),p+=40;else if(m.type===1){const{value:y,repeatable:v,optional:x,regexp:S}=m;i.push({name:y,repeatable:v,optional:x});const $=S||zo;if($!==zo){p+=10;try{new RegExp(`(${$})`)}catch(C){throw new Error(`Invalid custom RegExp for param "${y}" (${$}): `+C.message)}}let L=v?`((?:${$})(?:/(?:${$}))*)`:`(${$})`;f||(L=x&&u.length<2?`(?:/${L})`:"/"+L),x&&(L+="?"),r+=L,p+=20,x&&(p+=-8),v&&(p+=-20),$===".*"&&(p+=-50)}c.push(p)}s.push(c)}if(n.strict&&n.end){const u=s.length-1;s[u][s[u].length-1]+=.7000000000000001}n.strict||(r+="/?"),n.end?r+="$":n.strict&&(r+="(?:/|$)");const o=new RegExp(r,n.sensitive?"":"i");function l(u){const c=u.match(o),f={};if(!c)return null;for(let m=1;m<c.length;m++){const p=c[m]||"",y=i[m-1];f[y.name]=p&&y.repeatable?p.split("/"):p}return f}function a(u){let c="",f=!1;for(const m of e){(!f||!c.endsWith("/"))&&(c+="/"),f=!1;for(const p of m)if(p.type===0)c+=p.value;else if(p.type===1){const{value:y,repeatable:v,optional:x}=p,S=y in u?u[y]:"";if(oe(S)&&!v)throw new Error(`Provided param "${y}" is an array but it is not repeatable (* or + modifiers)`);const $=oe(S)?S.join("/"):S;if(!$)if(x)m.length<2&&(c.endsWith("/")?c=c.slice(0,-1):f=!0);else throw new Error(`Missing required param "${y}"`);c+=$}}return c||"/"}return{re:o,score:s,keys:i,parse:l,stringify:a}}function bh(e,t){let n=0;for(;n<e.length&&n<t.length;){const s=t[n]-e[n];if(s)return s;n++}return e.length<t.length?e.length===1&&e[0]===80?-1:1:e.length>t.length?t.length===1&&t[0]===80?1:-1:0}function rc(e,t){let n=0;const s=e.score,r=t.score;for(;n<s.length&&n<r.length;){const i=bh(s[n],r[n]);if(i)return i;n++}if(Math.abs(r.length-s.length)===1){if(Xo(s))return 1;if(Xo(r))return-1}return r.length-s.length}function Xo(e){const t=e[e.length-1];return e.length>0&&t[t.length-1]<0}const vh={type:0,value:""},Eh=/[a-zA-Z0-9_]/;function yh(e){if(!e)return[[]];if(e==="/")return[[vh]];if(!e.startsWith("/"))throw new Error(`Invalid path "${e}"`);function t(p){throw new Error(`ERR (${n})/"${u}": ${p}`)}let n=0,s=n;const r=[];let i;function o(){i&&r.push(i),i=[]}let l=0,a,u="",c="";function f(){u&&(n===0?i.push({type:0,value:u}):n===1||n===2||n===3?(i.length>1&&(a==="*"||a==="+")&&t(`A repeatable param (${u}) must be alone in its segment. eg: '/:ids+.`),i.push({type:1,value:u,regexp:c,repeatable:a==="*"||a==="+",optional:a==="*"||a==="?"})):t("Invalid state to consume buffer"),u="")}function m(){u+=a}for(;l<e.length;){if(a=e[l++],a==="\\"&&n!==2){s=n,n=4;continue}switch(n){case 0:a==="/"?(u&&f(),o()):a===":"?(f(),n=1):m();break;case 4:m(),n=s;break;case 1:a==="("?n=2:Eh.test(a)?m():(f(),n=0,a!=="*"&&a!=="?"&&a!=="+"&&l--);break;case 2:a===")"?c[c.length-1]=="\\"?c=c.slice(0,-1)+a:n=3:c+=a;break;case 3:f(),n=0,a!=="*"&&a!=="?"&&a!=="+"&&l--,c="";break;default:t("Unknown state");break}}return n===2&&t(`Unfinished custom RegExp for param "${u}"`),f(),o(),r}function wh(e,t,n){const s=_h(yh(e.path),n),r=st(s,{record:e,parent:t,children:[],alias:[]});return t&&!r.record.aliasOf==!t.record.aliasOf&&t.children.push(r),r}function Ah(e,t){const n=[],s=new Map;t=tl({strict:!1,end:!0,sensitive:!1},t);function r(f){return s.get(f)}function i(f,m,p){const y=!p,v=Jo(f);v.aliasOf=p&&p.record;const x=tl(t,f),S=[v];if("alias"in f){const C=typeof f.alias=="string"?[f.alias]:f.alias;for(const V of C)S.push(Jo(st({},v,{components:p?p.record.components:v.components,path:V,aliasOf:p?p.record:v})))}let $,L;for(const C of S){const{path:V}=C;if(m&&V[0]!=="/"){const K=m.record.path,U=K[K.length-1]==="/"?"":"/";C.path=m.record.path+(V&&U+V)}if($=wh(C,m,x),p?p.alias.push($):(L=L||$,L!==$&&L.alias.push($),y&&f.name&&!Zo($)&&o(f.name)),ic($)&&a($),v.children){const K=v.children;for(let U=0;U<K.length;U++)i(K[U],$,p&&p.children[U])}p=p||$}return L?()=>{o(L)}:ss}function o(f){if(nc(f)){const m=s.get(f);m&&(s.delete(f),n.splice(n.indexOf(m),1),m.children.forEach(o),m.alias.forEach(o))}else{const m=n.indexOf(f);m>-1&&(n.splice(m,1),f.record.name&&s.delete(f.record.name),f.children.forEach(o),f.alias.forEach(o))}}function l(){return n}function a(f){const m=Sh(f,n);n.splice(m,0,f),f.record.name&&!Zo(f)&&s.set(f.record.name,f)}function u(f,m){let p,y={},v,x;if("name"in f&&f.name){if(p=s.get(f.name),!p)throw Pn(1,{location:f});x=p.record.name,y=st(Qo(m.params,p.keys.filter(L=>!L.optional).concat(p.parent?p.parent.keys.filter(L=>L.optional):[]).map(L=>L.name)),f.params&&Qo(f.params,p.keys.map(L=>L.name))),v=p.stringify(y)}else if(f.path!=null)v=f.path,p=n.find(L=>L.re.test(v)),p&&(y=p.parse(v),x=p.record.name);else{if(p=m.name?s.get(m.name):n.find(L=>L.re.test(m.path)),!p)throw Pn(1,{location:f,currentLocation:m});x=p.record.name,y=st({},m.params,f.params),v=p.stringify(y)}const S=[];let $=p;for(;$;)S.unshift($.record),$=$.parent;return{name:x,path:v,params:y,matched:S,meta:Ch(S)}}e.forEach(f=>i(f));function c(){n.length=0,s.clear()}return{addRoute:i,resolve:u,removeRoute:o,clearRoutes:c,getRoutes:l,getRecordMatcher:r}}function Qo(e,t){const n={};for(const s of t)s in e&&(n[s]=e[s]);return n}function Jo(e){const t={path:e.path,redirect:e.redirect,name:e.name,meta:e.meta||{},aliasOf:e.aliasOf,beforeEnter:e.beforeEnter,props:Th(e),children:e.children||[],instances:{},leaveGuards:new Set,updateGuards:new Set,enterCallbacks:{},components:"components"in e?e.components||null:e.component&&{default:e.component}};return Object.defineProperty(t,"mods",{value:{}}),t}function Th(e){const t={},n=e.props||!1;if("component"in e)t.default=n;else for(const s in e.components)t[s]=typeof n=="object"?n[s]:n;return t}function Zo(e){for(;e;){if(e.record.aliasOf)return!0;e=e.parent}return!1}function Ch(e){return e.reduce((t,n)=>st(t,n.meta),{})}function tl(e,t){const n={};for(const s in e)n[s]=s in t?t[s]:e[s];return n}function Sh(e,t){let n=0,s=t.length;for(;n!==s;){const i=n+s>>1;rc(e,t[i])<0?s=i:n=i+1}const r=Oh(e);return r&&(s=t.lastIndexOf(r,s-1)),s}function Oh(e){let t=e;for(;t=t.parent;)if(ic(t)&&rc(e,t)===0)return t}function ic({record:e}){return!!(e.name||e.components&&Object.keys(e.components).length||e.redirect)}function Nh(e){const t={};if(e===""||e==="?")return t;const s=(e[0]==="?"?e.slice(1):e).split("&");for(let r=0;r<s.length;++r){const i=s[r].replace(Xa," "),o=i.indexOf("="),l=hs(o<0?i:i.slice(0,o)),a=o<0?null:hs(i.slice(o+1));if(l in t){let u=t[l];oe(u)||(u=t[l]=[u]),u.push(a)}else t[l]=a}return t}function el(e){let t="";for(let n in e){const s=e[n];if(n=Gd(n),s==null){s!==void 0&&(t+=(t.length?"&":"")+n);continue}(oe(s)?s.map(i=>i&&hi(i)):[s&&hi(s)]).forEach(i=>{i!==void 0&&(t+=(t.length?"&":"")+n,i!=null&&(t+="="+i))})}return t}function $h(e){const t={};for(const n in e){const s=e[n];s!==void 0&&(t[n]=oe(s)?s.map(r=>r==null?null:""+r):s==null?s:""+s)}return t}const Ph=Symbol(""),nl=Symbol(""),Bi=Symbol(""),oc=Symbol(""),mi=Symbol("");function Yn(){let e=[];function t(s){return e.push(s),()=>{const r=e.indexOf(s);r>-1&&e.splice(r,1)}}function n(){e=[]}return{add:t,list:()=>e.slice(),reset:n}}function Le(e,t,n,s,r,i=o=>o()){const o=s&&(s.enterCallbacks[r]=s.enterCallbacks[r]||[]);return()=>new Promise((l,a)=>{const u=m=>{m===!1?a(Pn(4,{from:n,to:t})):m instanceof Error?a(m):ph(m)?a(Pn(2,{from:t,to:m})):(o&&s.enterCallbacks[r]===o&&typeof m=="function"&&o.push(m),l())},c=i(()=>e.call(s&&s.instances[r],t,n,u));let f=Promise.resolve(c);e.length<3&&(f=f.then(u)),f.catch(m=>a(m))})}function Vr(e,t,n,s,r=i=>i()){const i=[];for(const o of e)for(const l in o.components){let a=o.components[l];if(!(t!=="beforeRouteEnter"&&!o.instances[l]))if(Ga(a)){const c=(a.__vccOpts||a)[t];c&&i.push(Le(c,n,s,o,l,r))}else{let u=a();i.push(()=>u.then(c=>{if(!c)throw new Error(`Couldn't resolve component "${l}" at "${o.path}"`);const f=kd(c)?c.default:c;o.mods[l]=c,o.components[l]=f;const p=(f.__vccOpts||f)[t];return p&&Le(p,n,s,o,l,r)()}))}}return i}function sl(e){const t=Ce(Bi),n=Ce(oc),s=re(()=>{const a=Tn(e.to);return t.resolve(a)}),r=re(()=>{const{matched:a}=s.value,{length:u}=a,c=a[u-1],f=n.matched;if(!c||!f.length)return-1;const m=f.findIndex($n.bind(null,c));if(m>-1)return m;const p=rl(a[u-2]);return u>1&&rl(c)===p&&f[f.length-1].path!==p?f.findIndex($n.bind(null,a[u-2])):m}),i=re(()=>r.value>-1&&Ih(n.params,s.value.params)),o=re(()=>r.value>-1&&r.value===n.matched.length-1&&tc(n.params,s.value.params));function l(a={}){return Rh(a)?t[Tn(e.replace)?"replace":"push"](Tn(e.to)).catch(ss):Promise.resolve()}return{route:s,href:re(()=>s.value.href),isActive:i,isExactActive:o,navigate:l}}const xh=ln({name:"RouterLink",compatConfig:{MODE:3},props:{to:{type:[String,Object],required:!0},replace:Boolean,activeClass:String,exactActiveClass:String,custom:Boolean,ariaCurrentValue:{type:String,default:"page"}},useLink:sl,setup(e,{slots:t}){const n=_s(sl(e)),{options:s}=Ce(Bi),r=re(()=>({[il(e.activeClass,s.linkActiveClass,"router-link-active")]:n.isActive,[il(e.exactActiveClass,s.linkExactActiveClass,"router-link-exact-active")]:n.isExactActive}));return()=>{const i=t.default&&t.default(n);return e.custom?i:Ka("a",{"aria-current":n.isExactActive?e.ariaCurrentValue:null,href:n.href,onClick:n.navigate,class:r.value},i)}}}),Dh=xh;function Rh(e){if(!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)&&!e.defaultPrevented&&!(e.button!==void 0&&e.button!==0)){if(e.currentTarget&&e.currentTarget.getAttribute){const t=e.currentTarget.getAttribute("target");if(/\b_blank\b/i.test(t))return}return e.preventDefault&&e.preventDefault(),!0}}function Ih(e,t){for(const n in t){const s=t[n],r=e[n];if(typeof s=="string"){if(s!==r)return!1}else if(!oe(r)||r.length!==s.length||s.some((i,o)=>i!==r[o]))return!1}return!0}function rl(e){return e?e.aliasOf?e.aliasOf.path:e.path:""}const il=(e,t,n)=>e??t??n,Lh=ln({name:"RouterView",inheritAttrs:!1,props:{name:{type:String,default:"default"},route:Object},compatConfig:{MODE:3},setup(e,{attrs:t,slots:n}){const s=Ce(mi),r=re(()=>e.route||s.value),i=Ce(nl,0),o=re(()=>{let u=Tn(i);const{matched:c}=r.value;let f;for(;(f=c[u])&&!f.components;)u++;return u}),l=re(()=>r.value.matched[o.value]);Vs(nl,re(()=>o.value+1)),Vs(Ph,l),Vs(mi,r);const a=yt();return Fs(()=>[a.value,l.value,e.name],([u,c,f],[m,p,y])=>{c&&(c.instances[f]=u,p&&p!==c&&u&&u===m&&(c.leaveGuards.size||(c.leaveGuards=p.leaveGuards),c.updateGuards.size||(c.updateGuards=p.updateGuards))),u&&c&&(!p||!$n(c,p)||!m)&&(c.enterCallbacks[f]||[]).forEach(v=>v(u))},{flush:"post"}),()=>{const u=r.value,c=e.name,f=l.value,m=f&&f.components[c];if(!m)return ol(n.default,{Component:m,route:u});const p=f.props[c],y=p?p===!0?u.params:typeof p=="function"?p(u):p:null,x=Ka(m,st({},y,t,{onVnodeUnmounted:S=>{S.component.isUnmounted&&(f.instances[c]=null)},ref:a}));return ol(n.default,{Component:x,route:u})||x}}});function ol(e,t){if(!e)return null;const n=e(t);return n.length===1?n[0]:n}const lc=Lh;function Mh(e){const t=Ah(e.routes,e),n=e.parseQuery||Nh,s=e.stringifyQuery||el,r=e.history,i=Yn(),o=Yn(),l=Yn(),a=Ku(xe);let u=xe;pn&&e.scrollBehavior&&"scrollRestoration"in history&&(history.scrollRestoration="manual");const c=kr.bind(null,b=>""+b),f=kr.bind(null,Xd),m=kr.bind(null,hs);function p(b,R){let P,k;return nc(b)?(P=t.getRecordMatcher(b),k=R):k=b,t.addRoute(k,P)}function y(b){const R=t.getRecordMatcher(b);R&&t.removeRoute(R)}function v(){return t.getRoutes().map(b=>b.record)}function x(b){return!!t.getRecordMatcher(b)}function S(b,R){if(R=st({},R||a.value),typeof b=="string"){const h=Hr(n,b,R.path),g=t.resolve({path:h.path},R),E=r.createHref(h.fullPath);return st(h,g,{params:m(g.params),hash:hs(h.hash),redirectedFrom:void 0,href:E})}let P;if(b.path!=null)P=st({},b,{path:Hr(n,b.path,R.path).path});else{const h=st({},b.params);for(const g in h)h[g]==null&&delete h[g];P=st({},b,{params:f(h)}),R.params=f(R.params)}const k=t.resolve(P,R),X=b.hash||"";k.params=c(m(k.params));const ft=Zd(s,st({},b,{hash:qd(X),path:k.path})),d=r.createHref(ft);return st({fullPath:ft,hash:X,query:s===el?$h(b.query):b.query||{}},k,{redirectedFrom:void 0,href:d})}function $(b){return typeof b=="string"?Hr(n,b,a.value.path):st({},b)}function L(b,R){if(u!==b)return Pn(8,{from:R,to:b})}function C(b){return U(b)}function V(b){return C(st($(b),{replace:!0}))}function K(b){const R=b.matched[b.matched.length-1];if(R&&R.redirect){const{redirect:P}=R;let k=typeof P=="function"?P(b):P;return typeof k=="string"&&(k=k.includes("?")||k.includes("#")?k=$(k):{path:k},k.params={}),st({query:b.query,hash:b.hash,params:k.path!=null?{}:b.params},k)}}function U(b,R){const P=u=S(b),k=a.value,X=b.state,ft=b.force,d=b.replace===!0,h=K(P);if(h)return U(st($(h),{state:typeof h=="object"?st({},X,h.state):X,force:ft,replace:d}),R||P);const g=P;g.redirectedFrom=R;let E;return!ft&&th(s,k,P)&&(E=Pn(16,{to:g,from:k}),Dt(k,k,!0,!1)),(E?Promise.resolve(E):J(g,k)).catch(_=>ve(_)?ve(_,2)?_:Lt(_):z(_,g,k)).then(_=>{if(_){if(ve(_,2))return U(st({replace:d},$(_.to),{state:typeof _.to=="object"?st({},X,_.to.state):X,force:ft}),R||g)}else _=mt(g,k,!0,d,X);return ut(g,k,_),_})}function rt(b,R){const P=L(b,R);return P?Promise.reject(P):Promise.resolve()}function it(b){const R=Mt.values().next().value;return R&&typeof R.runWithContext=="function"?R.runWithContext(b):b()}function J(b,R){let P;const[k,X,ft]=kh(b,R);P=Vr(k.reverse(),"beforeRouteLeave",b,R);for(const h of k)h.leaveGuards.forEach(g=>{P.push(Le(g,b,R))});const d=rt.bind(null,b,R);return P.push(d),gt(P).then(()=>{P=[];for(const h of i.list())P.push(Le(h,b,R));return P.push(d),gt(P)}).then(()=>{P=Vr(X,"beforeRouteUpdate",b,R);for(const h of X)h.updateGuards.forEach(g=>{P.push(Le(g,b,R))});return P.push(d),gt(P)}).then(()=>{P=[];for(const h of ft)if(h.beforeEnter)if(oe(h.beforeEnter))for(const g of h.beforeEnter)P.push(Le(g,b,R));else P.push(Le(h.beforeEnter,b,R));return P.push(d),gt(P)}).then(()=>(b.matched.forEach(h=>h.enterCallbacks={}),P=Vr(ft,"beforeRouteEnter",b,R,it),P.push(d),gt(P))).then(()=>{P=[];for(const h of o.list())P.push(Le(h,b,R));return P.push(d),gt(P)}).catch(h=>ve(h,8)?h:Promise.reject(h))}function ut(b,R,P){l.list().forEach(k=>it(()=>k(b,R,P)))}function mt(b,R,P,k,X){const ft=L(b,R);if(ft)return ft;const d=R===xe,h=pn?history.state:{};P&&(k||d?r.replace(b.fullPath,st({scroll:d&&h&&h.scroll},X)):r.push(b.fullPath,X)),a.value=b,Dt(b,R,P,d),Lt()}let lt;function It(){lt||(lt=r.listen((b,R,P)=>{if(!kt.listening)return;const k=S(b),X=K(k);if(X){U(st(X,{replace:!0}),k).catch(ss);return}u=k;const ft=a.value;pn&&ah(Yo(ft.fullPath,P.delta),_r()),J(k,ft).catch(d=>ve(d,12)?d:ve(d,2)?(U(d.to,k).then(h=>{ve(h,20)&&!P.delta&&P.type===ps.pop&&r.go(-1,!1)}).catch(ss),Promise.reject()):(P.delta&&r.go(-P.delta,!1),z(d,k,ft))).then(d=>{d=d||mt(k,ft,!1),d&&(P.delta&&!ve(d,8)?r.go(-P.delta,!1):P.type===ps.pop&&ve(d,20)&&r.go(-1,!1)),ut(k,ft,d)}).catch(ss)}))}let xt=Yn(),Q=Yn(),q;function z(b,R,P){Lt(b);const k=Q.list();return k.length?k.forEach(X=>X(b,R,P)):console.error(b),Promise.reject(b)}function bt(){return q&&a.value!==xe?Promise.resolve():new Promise((b,R)=>{xt.add([b,R])})}function Lt(b){return q||(q=!b,It(),xt.list().forEach(([R,P])=>b?P(b):R()),xt.reset()),b}function Dt(b,R,P,k){const{scrollBehavior:X}=e;if(!pn||!X)return Promise.resolve();const ft=!P&&ch(Yo(b.fullPath,0))||(k||!P)&&history.state&&history.state.scroll||null;return Li().then(()=>X(b,R,ft)).then(d=>d&&lh(d)).catch(d=>z(d,b,R))}const dt=b=>r.go(b);let ne;const Mt=new Set,kt={currentRoute:a,listening:!0,addRoute:p,removeRoute:y,clearRoutes:t.clearRoutes,hasRoute:x,getRoutes:v,resolve:S,options:e,push:C,replace:V,go:dt,back:()=>dt(-1),forward:()=>dt(1),beforeEach:i.add,beforeResolve:o.add,afterEach:l.add,onError:Q.add,isReady:bt,install(b){const R=this;b.component("RouterLink",Dh),b.component("RouterView",lc),b.config.globalProperties.$router=R,Object.defineProperty(b.config.globalProperties,"$route",{enumerable:!0,get:()=>Tn(a)}),pn&&!ne&&a.value===xe&&(ne=!0,C(r.location).catch(X=>{}));const P={};for(const X in xe)Object.defineProperty(P,X,{get:()=>a.value[X],enumerable:!0});b.provide(Bi,R),b.provide(oc,ua(P)),b.provide(mi,a);const k=b.unmount;Mt.add(b),b.unmount=function(){Mt.delete(b),Mt.size<1&&(u=xe,lt&&lt(),lt=null,a.value=xe,ne=!1,q=!1),k()}}};function gt(b){return b.reduce((R,P)=>R.then(()=>it(P)),Promise.resolve())}return kt}function kh(e,t){const n=[],s=[],r=[],i=Math.max(t.matched.length,e.matched.length);for(let o=0;o<i;o++){const l=t.matched[o];l&&(e.matched.find(u=>$n(u,l))?s.push(l):n.push(l));const a=e.matched[o];a&&(t.matched.find(u=>$n(u,a))||r.push(a))}return[n,s,r]}const Hh=ln({components:{RouterView:lc}}),Es=(e,t)=>{const n=e.__vccOpts||e;for(const[s,r]of t)n[s]=r;return n},Vh={class:"container py-5"},Fh={class:"d-flex justify-content-between align-items-center bg-main text-light p-4 rounded-lg shadow-lg mb-4"},jh={class:"nav"},Wh={class:"nav-item"},Bh={class:"nav-item"};function Kh(e,t,n,s,r,i){const o=Js("router-link"),l=Js("RouterView");return Et(),Ot("main",Vh,[M("div",Fh,[ht(o,{to:"/dashboard",class:"h2 m-0 text-decoration-none text-light"},{default:Hs(()=>t[0]||(t[0]=[ns("Dashboard")])),_:1}),M("nav",null,[M("ul",jh,[M("li",Wh,[ht(o,{to:"/profile",class:"nav-link text-light"},{default:Hs(()=>t[1]||(t[1]=[ns("Profile")])),_:1})]),M("li",Bh,[ht(o,{to:"/hobbies",class:"nav-link text-light"},{default:Hs(()=>t[2]||(t[2]=[ns("Hobbies")])),_:1})]),t[3]||(t[3]=M("li",{class:"nav-item"},[M("a",{href:"/logout",class:"nav-link text-light"},"Logout")],-1))])])]),ht(l,{class:"flex-shrink-0"})])}const Uh=Es(Hh,[["render",Kh],["__scopeId","data-v-3622d4cf"]]),Yh=ln({name:"Dashboard",setup(){const e=yt(""),t=async()=>{try{const n=await fetch("/api/profile",{method:"GET",headers:{"Content-Type":"application/json"}});if(n.ok){const s=await n.json();e.value=s.name}else console.error("Failed to fetch username:",n.status),e.value=""}catch(n){console.error("Error fetching username:",n),e.value=""}};return Hi(()=>{t()}),{userName:e}}}),qh={class:"mt-4"};function Gh(e,t,n,s,r,i){return Et(),Ot(Gt,null,[M("div",qh,[M("h3",null,"Hello "+wn(e.userName),1)]),t[0]||(t[0]=zf('<div class="row mt-5" data-v-11611174><div class="col-md-4" data-v-11611174><div class="box p-4 text-white bg-info rounded-lg shadow-lg" data-v-11611174><h4 data-v-11611174>Friend Requests</h4></div></div><div class="col-md-4" data-v-11611174><div class="box p-4 text-white bg-teal rounded-lg shadow-lg" data-v-11611174><h4 data-v-11611174>Friends</h4></div></div><div class="col-md-4" data-v-11611174><div class="box p-4 text-white bg-lightTeal rounded-lg shadow-lg" data-v-11611174><h4 data-v-11611174>Pending Requests</h4></div></div></div>',1))],64)}const zh=Es(Yh,[["render",Gh],["__scopeId","data-v-11611174"]]),Xh=ln({name:"ChangePassword",setup(e,{emit:t}){const n=yt(""),s=yt(""),r=yt(""),i=yt(""),o=yt(!1),l=yt(!1),a=yt(!1),u=()=>{t("close")},c=()=>{o.value=!o.value},f=()=>{l.value=!l.value},m=()=>{a.value=!a.value},p=yt({length:!1,nonNumeric:!1}),y=()=>{const S=s.value;p.value.length=S.length>=8,p.value.nonNumeric=!/^\d+$/.test(S)&&/[a-zA-Z!@#$%^&*(),.?":{}|<>]/.test(S)},v=async()=>{if(s.value!==r.value){i.value="Passwords do not match!";return}try{const S=await fetch("/api/update-password",{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":x()},body:JSON.stringify({current_password:n.value,new_password:s.value})}),$=await S.json();S.ok?alert("Password changed successfully!"):i.value=$.error||"An error occurred."}catch{i.value="An error occurred. Please try again."}},x=()=>{const S=document.cookie.match(/csrftoken=([^;]+)/);return S?S[1]:""};return{currentPassword:n,newPassword:s,confirmPassword:r,errorMessage:i,passwordRequirements:p,submitForm:v,checkPasswordRequirements:y,showCurrentPassword:o,showNewPassword:l,showConfirmPassword:a,toggleShowCurrentPassword:c,toggleShowNewPassword:f,toggleShowConfirmPassword:m,closeModal:u}}}),Qh={class:"container mt-5",style:{"background-color":"white","border-radius":"8px",padding:"30px"}},Jh={class:"mb-3"},Zh={class:"input-group"},tp=["type"],ep={class:"mb-3"},np={class:"input-group"},sp=["type"],rp={class:"mt-3",style:{"list-style-type":"none","padding-left":"0"}},ip={class:"mb-3"},op={class:"input-group"},lp=["type"],ap={key:0,class:"alert alert-danger",role:"alert",style:{"background-color":"#ff6b6b",color:"#feffff"}},cp={class:"text-center"};function up(e,t,n,s,r,i){return Et(),Ot("div",Qh,[t[13]||(t[13]=M("h1",{class:"mb-4",style:{color:"#17252A"}},"Change Password",-1)),M("form",{onSubmit:t[8]||(t[8]=di((...o)=>e.submitForm&&e.submitForm(...o),["prevent"])),class:"needs-validation",novalidate:""},[M("div",Jh,[t[9]||(t[9]=M("label",{for:"current_password",class:"form-label",style:{color:"#17252A"}},"Current Password",-1)),M("div",Zh,[Te(M("input",{type:e.showCurrentPassword?"text":"password",id:"current_password","onUpdate:modelValue":t[0]||(t[0]=o=>e.currentPassword=o),class:"form-control",required:"",style:{"background-color":"#feffff",border:"1px solid #2b7a78",color:"#17252A"}},null,8,tp),[[Mr,e.currentPassword]]),M("button",{type:"button",class:"btn btn-outline-secondary",onClick:t[1]||(t[1]=(...o)=>e.toggleShowCurrentPassword&&e.toggleShowCurrentPassword(...o)),style:{"background-color":"#0dcaf0",color:"#feffff",border:"none"}},[M("i",{class:yn(["bi",e.showCurrentPassword?"bi-eye":"bi-eye-slash"])},null,2)])])]),M("div",ep,[t[10]||(t[10]=M("label",{for:"new_password",class:"form-label",style:{color:"#17252A"}},"New Password",-1)),M("div",np,[Te(M("input",{type:e.showNewPassword?"text":"password",id:"new_password","onUpdate:modelValue":t[2]||(t[2]=o=>e.newPassword=o),onInput:t[3]||(t[3]=(...o)=>e.checkPasswordRequirements&&e.checkPasswordRequirements(...o)),class:"form-control",required:"",style:{"background-color":"#feffff",border:"1px solid #2b7a78",color:"#17252A"}},null,40,sp),[[Mr,e.newPassword]]),M("button",{type:"button",class:"btn btn-outline-secondary",onClick:t[4]||(t[4]=(...o)=>e.toggleShowNewPassword&&e.toggleShowNewPassword(...o)),style:{"background-color":"#0dcaf0",color:"#feffff",border:"none"}},[M("i",{class:yn(["bi",e.showCurrentPassword?"bi-eye":"bi-eye-slash"])},null,2)])]),M("ul",rp,[M("li",{style:ls({color:e.passwordRequirements.length?"green":"red"})}," Minimum 8 characters ",4),M("li",{style:ls({color:e.passwordRequirements.nonNumeric?"green":"red"})}," Password should not be entirely numeric ",4)])]),M("div",ip,[t[11]||(t[11]=M("label",{for:"confirm_password",class:"form-label",style:{color:"#17252A"}},"Confirm New Password",-1)),M("div",op,[Te(M("input",{type:e.showConfirmPassword?"text":"password",id:"confirm_password","onUpdate:modelValue":t[5]||(t[5]=o=>e.confirmPassword=o),class:"form-control",required:"",style:{"background-color":"#feffff",border:"1px solid #2b7a78",color:"#17252A"}},null,8,lp),[[Mr,e.confirmPassword]]),M("button",{type:"button",class:"btn btn-outline-secondary",onClick:t[6]||(t[6]=(...o)=>e.toggleShowConfirmPassword&&e.toggleShowConfirmPassword(...o)),style:{"background-color":"#0dcaf0",color:"#feffff",border:"none"}},[M("i",{class:yn(["bi",e.showCurrentPassword?"bi-eye":"bi-eye-slash"])},null,2)])])]),e.errorMessage?(Et(),Ot("div",ap,wn(e.errorMessage),1)):er("",!0),M("div",cp,[t[12]||(t[12]=M("button",{type:"submit",class:"btn",style:{"background-color":"#0dcaf0",color:"#feffff",border:"none"}},"Change Password",-1)),M("button",{type:"button",class:"btn btn-outline-danger",onClick:t[7]||(t[7]=(...o)=>e.closeModal&&e.closeModal(...o))},"Cancel")])],32)])}const ac=Es(Xh,[["render",up],["__scopeId","data-v-e4f38635"]]),fp=ln({name:"UserHobbies",setup(){const e=yt([]),t=yt([]),n=yt(""),s=yt(""),r=yt(null),i=async()=>{try{const f=await fetch("/api/hobbies/");if(!f.ok)throw new Error("Failed to fetch hobbies");const m=await f.json();e.value=m.sort((p,y)=>p.name.localeCompare(y.name))}catch(f){console.error("Error fetching hobbies:",f)}},o=async()=>{try{const f=await fetch("/api/all-hobbies/");if(!f.ok)throw new Error("Failed to fetch all hobbies");const m=await f.json();t.value=m}catch(f){console.error("Error fetching all hobbies:",f)}};function l(){const f=document.cookie.match(/csrftoken=([^;]+)/);return f?f[1]:""}const a=async()=>{let f=n.value;const m=e.value.find(p=>p.id===Number(f)||p.name===s.value);if(m){r.value=`You already have the hobby "${m.name}"!`,setTimeout(()=>{r.value=null},5e3);return}if(f==="other"&&s.value)try{const p=await fetch("/api/hobbies/create/",{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":l()},body:JSON.stringify({name:s.value})});if(!p.ok)throw new Error("Failed to create new hobby");const y=await p.json();if(t.value.push(y),n.value=y.id.toString(),!(await fetch("/api/hobbies/add/",{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":l()},body:JSON.stringify({hobby_id:y.id})})).ok)throw new Error("Failed to add hobby to user");i(),n.value="",s.value="",r.value="Hobby has been added!",setTimeout(()=>{r.value=null},5e3)}catch(p){console.error("Error adding hobby:",p)}else try{if(!(await fetch("/api/hobbies/add/",{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":l()},body:JSON.stringify({hobby_id:f})})).ok)throw new Error("Failed to add hobby to user");i(),n.value="",r.value="Hobby has been added!",setTimeout(()=>{r.value=null},5e3)}catch(p){console.error("Error adding hobby:",p)}},u=f=>{window.confirm(`Are you sure you want to delete the hobby "${f.name}"?`)&&c(f.id)},c=async f=>{try{const m=l();if(!(await fetch(`/api/hobbies/${f}/`,{method:"DELETE",headers:{"Content-Type":"application/json","X-CSRFToken":m}})).ok)throw new Error("Failed to delete hobby");e.value=e.value.filter(y=>y.id!==f)}catch(m){console.error("Error deleting hobby:",m)}};return Hi(()=>{i(),o()}),{hobbies:e,allHobbies:t,selectedHobbyId:n,newHobbyName:s,Message:r,addHobby:a,deleteHobby:c,confirmDelete:u}}}),dp={class:"hobbies-list container bg-def2f1 p-4 rounded"},hp={class:"mb-3"},pp=["value"],mp={key:0,class:"alert alert-success mt-3",role:"alert"},gp={key:0,class:"mb-3"},_p=["disabled"],bp={key:1,class:"list-group"},vp=["onClick"],Ep={key:2,class:"text-center text-2b7a78"};function yp(e,t,n,s,r,i){return Et(),Ot("div",dp,[t[7]||(t[7]=M("h1",{class:"text-center text-3aafa9 mb-4"},"Update Hobbies",-1)),t[8]||(t[8]=M("h2",{class:"text-17252A mb-3"},"Add Hobbies",-1)),M("div",hp,[t[5]||(t[5]=M("label",{for:"allHobbies",class:"form-label text-17252A"},null,-1)),Te(M("select",{id:"allHobbies","onUpdate:modelValue":t[0]||(t[0]=o=>e.selectedHobbyId=o),class:"form-select border-2b7a78"},[t[3]||(t[3]=M("option",{value:""},"--Select a hobby--",-1)),(Et(!0),Ot(Gt,null,_o(e.allHobbies,o=>(Et(),Ot("option",{key:o.id,value:o.id},wn(o.name),9,pp))),128)),t[4]||(t[4]=M("option",{value:"other"},"+Add A New Hobby",-1))],512),[[Ya,e.selectedHobbyId]]),e.Message?(Et(),Ot("div",mp,wn(e.Message),1)):er("",!0)]),e.selectedHobbyId==="other"?(Et(),Ot("div",gp,[Te(M("input",{type:"text","onUpdate:modelValue":t[1]||(t[1]=o=>e.newHobbyName=o),placeholder:"Enter your new hobby",class:"form-control border-2b7a78"},null,512),[[ze,e.newHobbyName]])])):er("",!0),M("button",{onClick:t[2]||(t[2]=(...o)=>e.addHobby&&e.addHobby(...o)),class:"btn btn-3aafa9 text-feffff w-100 mb-4",disabled:!e.selectedHobbyId||e.selectedHobbyId==="other"&&!e.newHobbyName},null,8,_p),t[9]||(t[9]=M("h2",{class:"text-17252A mb-3"},"Added Hobbies",-1)),e.hobbies.length>0?(Et(),Ot("ul",bp,[(Et(!0),Ot(Gt,null,_o(e.hobbies,o=>(Et(),Ot("li",{key:o.id,class:"list-group-item d-flex justify-content-between align-items-center bg-def2f1 text-17252A border-2b7a78"},[ns(wn(o.name)+" ",1),M("button",{onClick:l=>e.confirmDelete(o),class:"btn btn-danger btn-sm"},t[6]||(t[6]=[M("i",{class:"bi bi-trash"},null,-1)]),8,vp)]))),128))])):(Et(),Ot("p",Ep," No Hobbies Added "))])}const cc=Es(fp,[["render",yp],["__scopeId","data-v-75d18020"]]);function wp(){const e=document.cookie.match(/csrftoken=([^;]+)/);return e?e[1]:""}const Ap=ln({name:"Profile",components:{UpdatePassword:ac,UserHobbies:cc},setup(){const e=_s({username:"",name:"",email:"",date_of_birth:""}),t=yt(!1),n=()=>{t.value=!1},s=async()=>{try{const i=await fetch("/api/profile",{method:"GET",headers:{"Content-Type":"application/json"}});if(i.ok){const o=await i.json();Object.assign(e,o)}else console.error("Failed to fetch profile data")}catch(i){console.error("Error fetching profile:",i)}},r=async()=>{try{(await fetch("/api/profile",{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":wp()},body:JSON.stringify(e)})).ok?alert("Profile updated successfully"):console.error("Failed to update profile")}catch(i){console.error("Error updating profile:",i)}};return s(),{profile:e,updateProfile:r,showPasswordModal:t,closePasswordModal:n}}}),Tp={class:"container py-5"},Cp={class:"box p-5 rounded-lg shadow-lg"},Sp={class:"mb-4"},Op={class:"mb-4"},Np={class:"mb-4"},$p={class:"mb-4"},Pp={class:"mt-4 d-flex justify-content-center gap-3"},xp={class:"mt-5"};function Dp(e,t,n,s,r,i){const o=Js("user-hobbies"),l=Js("update-password");return Et(),Ot("div",Tp,[M("div",Cp,[M("form",{onSubmit:t[4]||(t[4]=di((...a)=>e.updateProfile&&e.updateProfile(...a),["prevent"]))},[M("div",Sp,[t[8]||(t[8]=M("label",{for:"username",class:"form-label fw-bold text-main"},"Username:",-1)),Te(M("input",{id:"username",type:"text",class:"form-control","onUpdate:modelValue":t[0]||(t[0]=a=>e.profile.username=a),disabled:!1},null,512),[[ze,e.profile.username]])]),M("div",Op,[t[9]||(t[9]=M("label",{for:"name",class:"form-label fw-bold text-main"},"Name:",-1)),Te(M("input",{id:"name",type:"text",class:"form-control","onUpdate:modelValue":t[1]||(t[1]=a=>e.profile.name=a)},null,512),[[ze,e.profile.name]])]),M("div",Np,[t[10]||(t[10]=M("label",{for:"email",class:"form-label fw-bold text-main"},"Email:",-1)),Te(M("input",{id:"email",type:"email",class:"form-control","onUpdate:modelValue":t[2]||(t[2]=a=>e.profile.email=a)},null,512),[[ze,e.profile.email]])]),M("div",$p,[t[11]||(t[11]=M("label",{for:"date_of_birth",class:"form-label fw-bold text-main"},"Date of Birth:",-1)),Te(M("input",{id:"date_of_birth",type:"date",class:"form-control","onUpdate:modelValue":t[3]||(t[3]=a=>e.profile.date_of_birth=a)},null,512),[[ze,e.profile.date_of_birth]])]),t[12]||(t[12]=M("div",{class:"text-center"},[M("button",{type:"submit",class:"btn btn-info text-white fw-bold"},"Update Profile")],-1))],32),M("div",Pp,[M("button",{onClick:t[5]||(t[5]=a=>e.showPasswordModal=!0),class:"btn btn-outline-danger fw-bold"},"Change Password")])]),M("div",xp,[ht(o)]),e.showPasswordModal?(Et(),Ot("div",{key:0,class:"modal-overlay",onClick:t[7]||(t[7]=(...a)=>e.closePasswordModal&&e.closePasswordModal(...a))},[M("div",{class:"modal-content",onClick:t[6]||(t[6]=di(()=>{},["stop"]))},[ht(l,{onClose:e.closePasswordModal},null,8,["onClose"])])])):er("",!0)])}const Rp=Es(Ap,[["render",Dp],["__scopeId","data-v-b75ea460"]]);let Ip="";const Lp=Mh({history:hh(Ip),routes:[{path:"/dashboard",name:"Dashboard",component:zh},{path:"/profile/",name:"profile",component:Rp},{path:"/updatepassword/",name:"Update Password",component:ac},{path:"/profile/",name:"Hobbies",component:cc}]});var $t="top",Ut="bottom",Yt="right",Pt="left",br="auto",Vn=[$t,Ut,Yt,Pt],sn="start",xn="end",uc="clippingParents",Ki="viewport",mn="popper",fc="reference",gi=Vn.reduce(function(e,t){return e.concat([t+"-"+sn,t+"-"+xn])},[]),Ui=[].concat(Vn,[br]).reduce(function(e,t){return e.concat([t,t+"-"+sn,t+"-"+xn])},[]),dc="beforeRead",hc="read",pc="afterRead",mc="beforeMain",gc="main",_c="afterMain",bc="beforeWrite",vc="write",Ec="afterWrite",yc=[dc,hc,pc,mc,gc,_c,bc,vc,Ec];function _e(e){return e?(e.nodeName||"").toLowerCase():null}function qt(e){if(e==null)return window;if(e.toString()!=="[object Window]"){var t=e.ownerDocument;return t&&t.defaultView||window}return e}function rn(e){var t=qt(e).Element;return e instanceof t||e instanceof Element}function Qt(e){var t=qt(e).HTMLElement;return e instanceof t||e instanceof HTMLElement}function Yi(e){if(typeof ShadowRoot>"u")return!1;var t=qt(e).ShadowRoot;return e instanceof t||e instanceof ShadowRoot}function Mp(e){var t=e.state;Object.keys(t.elements).forEach(function(n){var s=t.styles[n]||{},r=t.attributes[n]||{},i=t.elements[n];!Qt(i)||!_e(i)||(Object.assign(i.style,s),Object.keys(r).forEach(function(o){var l=r[o];l===!1?i.removeAttribute(o):i.setAttribute(o,l===!0?"":l)}))})}function kp(e){var t=e.state,n={popper:{position:t.options.strategy,left:"0",top:"0",margin:"0"},arrow:{position:"absolute"},reference:{}};return Object.assign(t.elements.popper.style,n.popper),t.styles=n,t.elements.arrow&&Object.assign(t.elements.arrow.style,n.arrow),function(){Object.keys(t.elements).forEach(function(s){var r=t.elements[s],i=t.attributes[s]||{},o=Object.keys(t.styles.hasOwnProperty(s)?t.styles[s]:n[s]),l=o.reduce(function(a,u){return a[u]="",a},{});!Qt(r)||!_e(r)||(Object.assign(r.style,l),Object.keys(i).forEach(function(a){r.removeAttribute(a)}))})}}const qi={name:"applyStyles",enabled:!0,phase:"write",fn:Mp,effect:kp,requires:["computeStyles"]};function he(e){return e.split("-")[0]}var Ze=Math.max,sr=Math.min,Dn=Math.round;function _i(){var e=navigator.userAgentData;return e!=null&&e.brands&&Array.isArray(e.brands)?e.brands.map(function(t){return t.brand+"/"+t.version}).join(" "):navigator.userAgent}function wc(){return!/^((?!chrome|android).)*safari/i.test(_i())}function Rn(e,t,n){t===void 0&&(t=!1),n===void 0&&(n=!1);var s=e.getBoundingClientRect(),r=1,i=1;t&&Qt(e)&&(r=e.offsetWidth>0&&Dn(s.width)/e.offsetWidth||1,i=e.offsetHeight>0&&Dn(s.height)/e.offsetHeight||1);var o=rn(e)?qt(e):window,l=o.visualViewport,a=!wc()&&n,u=(s.left+(a&&l?l.offsetLeft:0))/r,c=(s.top+(a&&l?l.offsetTop:0))/i,f=s.width/r,m=s.height/i;return{width:f,height:m,top:c,right:u+f,bottom:c+m,left:u,x:u,y:c}}function Gi(e){var t=Rn(e),n=e.offsetWidth,s=e.offsetHeight;return Math.abs(t.width-n)<=1&&(n=t.width),Math.abs(t.height-s)<=1&&(s=t.height),{x:e.offsetLeft,y:e.offsetTop,width:n,height:s}}function Ac(e,t){var n=t.getRootNode&&t.getRootNode();if(e.contains(t))return!0;if(n&&Yi(n)){var s=t;do{if(s&&e.isSameNode(s))return!0;s=s.parentNode||s.host}while(s)}return!1}function Ne(e){return qt(e).getComputedStyle(e)}function Hp(e){return["table","td","th"].indexOf(_e(e))>=0}function Be(e){return((rn(e)?e.ownerDocument:e.document)||window.document).documentElement}function vr(e){return _e(e)==="html"?e:e.assignedSlot||e.parentNode||(Yi(e)?e.host:null)||Be(e)}function ll(e){return!Qt(e)||Ne(e).position==="fixed"?null:e.offsetParent}function Vp(e){var t=/firefox/i.test(_i()),n=/Trident/i.test(_i());if(n&&Qt(e)){var s=Ne(e);if(s.position==="fixed")return null}var r=vr(e);for(Yi(r)&&(r=r.host);Qt(r)&&["html","body"].indexOf(_e(r))<0;){var i=Ne(r);if(i.transform!=="none"||i.perspective!=="none"||i.contain==="paint"||["transform","perspective"].indexOf(i.willChange)!==-1||t&&i.willChange==="filter"||t&&i.filter&&i.filter!=="none")return r;r=r.parentNode}return null}function ys(e){for(var t=qt(e),n=ll(e);n&&Hp(n)&&Ne(n).position==="static";)n=ll(n);return n&&(_e(n)==="html"||_e(n)==="body"&&Ne(n).position==="static")?t:n||Vp(e)||t}function zi(e){return["top","bottom"].indexOf(e)>=0?"x":"y"}function is(e,t,n){return Ze(e,sr(t,n))}function Fp(e,t,n){var s=is(e,t,n);return s>n?n:s}function Tc(){return{top:0,right:0,bottom:0,left:0}}function Cc(e){return Object.assign({},Tc(),e)}function Sc(e,t){return t.reduce(function(n,s){return n[s]=e,n},{})}var jp=function(t,n){return t=typeof t=="function"?t(Object.assign({},n.rects,{placement:n.placement})):t,Cc(typeof t!="number"?t:Sc(t,Vn))};function Wp(e){var t,n=e.state,s=e.name,r=e.options,i=n.elements.arrow,o=n.modifiersData.popperOffsets,l=he(n.placement),a=zi(l),u=[Pt,Yt].indexOf(l)>=0,c=u?"height":"width";if(!(!i||!o)){var f=jp(r.padding,n),m=Gi(i),p=a==="y"?$t:Pt,y=a==="y"?Ut:Yt,v=n.rects.reference[c]+n.rects.reference[a]-o[a]-n.rects.popper[c],x=o[a]-n.rects.reference[a],S=ys(i),$=S?a==="y"?S.clientHeight||0:S.clientWidth||0:0,L=v/2-x/2,C=f[p],V=$-m[c]-f[y],K=$/2-m[c]/2+L,U=is(C,K,V),rt=a;n.modifiersData[s]=(t={},t[rt]=U,t.centerOffset=U-K,t)}}function Bp(e){var t=e.state,n=e.options,s=n.element,r=s===void 0?"[data-popper-arrow]":s;r!=null&&(typeof r=="string"&&(r=t.elements.popper.querySelector(r),!r)||Ac(t.elements.popper,r)&&(t.elements.arrow=r))}const Oc={name:"arrow",enabled:!0,phase:"main",fn:Wp,effect:Bp,requires:["popperOffsets"],requiresIfExists:["preventOverflow"]};function In(e){return e.split("-")[1]}var Kp={top:"auto",right:"auto",bottom:"auto",left:"auto"};function Up(e,t){var n=e.x,s=e.y,r=t.devicePixelRatio||1;return{x:Dn(n*r)/r||0,y:Dn(s*r)/r||0}}function al(e){var t,n=e.popper,s=e.popperRect,r=e.placement,i=e.variation,o=e.offsets,l=e.position,a=e.gpuAcceleration,u=e.adaptive,c=e.roundOffsets,f=e.isFixed,m=o.x,p=m===void 0?0:m,y=o.y,v=y===void 0?0:y,x=typeof c=="function"?c({x:p,y:v}):{x:p,y:v};p=x.x,v=x.y;var S=o.hasOwnProperty("x"),$=o.hasOwnProperty("y"),L=Pt,C=$t,V=window;if(u){var K=ys(n),U="clientHeight",rt="clientWidth";if(K===qt(n)&&(K=Be(n),Ne(K).position!=="static"&&l==="absolute"&&(U="scrollHeight",rt="scrollWidth")),K=K,r===$t||(r===Pt||r===Yt)&&i===xn){C=Ut;var it=f&&K===V&&V.visualViewport?V.visualViewport.height:K[U];v-=it-s.height,v*=a?1:-1}if(r===Pt||(r===$t||r===Ut)&&i===xn){L=Yt;var J=f&&K===V&&V.visualViewport?V.visualViewport.width:K[rt];p-=J-s.width,p*=a?1:-1}}var ut=Object.assign({position:l},u&&Kp),mt=c===!0?Up({x:p,y:v},qt(n)):{x:p,y:v};if(p=mt.x,v=mt.y,a){var lt;return Object.assign({},ut,(lt={},lt[C]=$?"0":"",lt[L]=S?"0":"",lt.transform=(V.devicePixelRatio||1)<=1?"translate("+p+"px, "+v+"px)":"translate3d("+p+"px, "+v+"px, 0)",lt))}return Object.assign({},ut,(t={},t[C]=$?v+"px":"",t[L]=S?p+"px":"",t.transform="",t))}function Yp(e){var t=e.state,n=e.options,s=n.gpuAcceleration,r=s===void 0?!0:s,i=n.adaptive,o=i===void 0?!0:i,l=n.roundOffsets,a=l===void 0?!0:l,u={placement:he(t.placement),variation:In(t.placement),popper:t.elements.popper,popperRect:t.rects.popper,gpuAcceleration:r,isFixed:t.options.strategy==="fixed"};t.modifiersData.popperOffsets!=null&&(t.styles.popper=Object.assign({},t.styles.popper,al(Object.assign({},u,{offsets:t.modifiersData.popperOffsets,position:t.options.strategy,adaptive:o,roundOffsets:a})))),t.modifiersData.arrow!=null&&(t.styles.arrow=Object.assign({},t.styles.arrow,al(Object.assign({},u,{offsets:t.modifiersData.arrow,position:"absolute",adaptive:!1,roundOffsets:a})))),t.attributes.popper=Object.assign({},t.attributes.popper,{"data-popper-placement":t.placement})}const Xi={name:"computeStyles",enabled:!0,phase:"beforeWrite",fn:Yp,data:{}};var Ps={passive:!0};function qp(e){var t=e.state,n=e.instance,s=e.options,r=s.scroll,i=r===void 0?!0:r,o=s.resize,l=o===void 0?!0:o,a=qt(t.elements.popper),u=[].concat(t.scrollParents.reference,t.scrollParents.popper);return i&&u.forEach(function(c){c.addEventListener("scroll",n.update,Ps)}),l&&a.addEventListener("resize",n.update,Ps),function(){i&&u.forEach(function(c){c.removeEventListener("scroll",n.update,Ps)}),l&&a.removeEventListener("resize",n.update,Ps)}}const Qi={name:"eventListeners",enabled:!0,phase:"write",fn:function(){},effect:qp,data:{}};var Gp={left:"right",right:"left",bottom:"top",top:"bottom"};function Ks(e){return e.replace(/left|right|bottom|top/g,function(t){return Gp[t]})}var zp={start:"end",end:"start"};function cl(e){return e.replace(/start|end/g,function(t){return zp[t]})}function Ji(e){var t=qt(e),n=t.pageXOffset,s=t.pageYOffset;return{scrollLeft:n,scrollTop:s}}function Zi(e){return Rn(Be(e)).left+Ji(e).scrollLeft}function Xp(e,t){var n=qt(e),s=Be(e),r=n.visualViewport,i=s.clientWidth,o=s.clientHeight,l=0,a=0;if(r){i=r.width,o=r.height;var u=wc();(u||!u&&t==="fixed")&&(l=r.offsetLeft,a=r.offsetTop)}return{width:i,height:o,x:l+Zi(e),y:a}}function Qp(e){var t,n=Be(e),s=Ji(e),r=(t=e.ownerDocument)==null?void 0:t.body,i=Ze(n.scrollWidth,n.clientWidth,r?r.scrollWidth:0,r?r.clientWidth:0),o=Ze(n.scrollHeight,n.clientHeight,r?r.scrollHeight:0,r?r.clientHeight:0),l=-s.scrollLeft+Zi(e),a=-s.scrollTop;return Ne(r||n).direction==="rtl"&&(l+=Ze(n.clientWidth,r?r.clientWidth:0)-i),{width:i,height:o,x:l,y:a}}function to(e){var t=Ne(e),n=t.overflow,s=t.overflowX,r=t.overflowY;return/auto|scroll|overlay|hidden/.test(n+r+s)}function Nc(e){return["html","body","#document"].indexOf(_e(e))>=0?e.ownerDocument.body:Qt(e)&&to(e)?e:Nc(vr(e))}function os(e,t){var n;t===void 0&&(t=[]);var s=Nc(e),r=s===((n=e.ownerDocument)==null?void 0:n.body),i=qt(s),o=r?[i].concat(i.visualViewport||[],to(s)?s:[]):s,l=t.concat(o);return r?l:l.concat(os(vr(o)))}function bi(e){return Object.assign({},e,{left:e.x,top:e.y,right:e.x+e.width,bottom:e.y+e.height})}function Jp(e,t){var n=Rn(e,!1,t==="fixed");return n.top=n.top+e.clientTop,n.left=n.left+e.clientLeft,n.bottom=n.top+e.clientHeight,n.right=n.left+e.clientWidth,n.width=e.clientWidth,n.height=e.clientHeight,n.x=n.left,n.y=n.top,n}function ul(e,t,n){return t===Ki?bi(Xp(e,n)):rn(t)?Jp(t,n):bi(Qp(Be(e)))}function Zp(e){var t=os(vr(e)),n=["absolute","fixed"].indexOf(Ne(e).position)>=0,s=n&&Qt(e)?ys(e):e;return rn(s)?t.filter(function(r){return rn(r)&&Ac(r,s)&&_e(r)!=="body"}):[]}function tm(e,t,n,s){var r=t==="clippingParents"?Zp(e):[].concat(t),i=[].concat(r,[n]),o=i[0],l=i.reduce(function(a,u){var c=ul(e,u,s);return a.top=Ze(c.top,a.top),a.right=sr(c.right,a.right),a.bottom=sr(c.bottom,a.bottom),a.left=Ze(c.left,a.left),a},ul(e,o,s));return l.width=l.right-l.left,l.height=l.bottom-l.top,l.x=l.left,l.y=l.top,l}function $c(e){var t=e.reference,n=e.element,s=e.placement,r=s?he(s):null,i=s?In(s):null,o=t.x+t.width/2-n.width/2,l=t.y+t.height/2-n.height/2,a;switch(r){case $t:a={x:o,y:t.y-n.height};break;case Ut:a={x:o,y:t.y+t.height};break;case Yt:a={x:t.x+t.width,y:l};break;case Pt:a={x:t.x-n.width,y:l};break;default:a={x:t.x,y:t.y}}var u=r?zi(r):null;if(u!=null){var c=u==="y"?"height":"width";switch(i){case sn:a[u]=a[u]-(t[c]/2-n[c]/2);break;case xn:a[u]=a[u]+(t[c]/2-n[c]/2);break}}return a}function Ln(e,t){t===void 0&&(t={});var n=t,s=n.placement,r=s===void 0?e.placement:s,i=n.strategy,o=i===void 0?e.strategy:i,l=n.boundary,a=l===void 0?uc:l,u=n.rootBoundary,c=u===void 0?Ki:u,f=n.elementContext,m=f===void 0?mn:f,p=n.altBoundary,y=p===void 0?!1:p,v=n.padding,x=v===void 0?0:v,S=Cc(typeof x!="number"?x:Sc(x,Vn)),$=m===mn?fc:mn,L=e.rects.popper,C=e.elements[y?$:m],V=tm(rn(C)?C:C.contextElement||Be(e.elements.popper),a,c,o),K=Rn(e.elements.reference),U=$c({reference:K,element:L,strategy:"absolute",placement:r}),rt=bi(Object.assign({},L,U)),it=m===mn?rt:K,J={top:V.top-it.top+S.top,bottom:it.bottom-V.bottom+S.bottom,left:V.left-it.left+S.left,right:it.right-V.right+S.right},ut=e.modifiersData.offset;if(m===mn&&ut){var mt=ut[r];Object.keys(J).forEach(function(lt){var It=[Yt,Ut].indexOf(lt)>=0?1:-1,xt=[$t,Ut].indexOf(lt)>=0?"y":"x";J[lt]+=mt[xt]*It})}return J}function em(e,t){t===void 0&&(t={});var n=t,s=n.placement,r=n.boundary,i=n.rootBoundary,o=n.padding,l=n.flipVariations,a=n.allowedAutoPlacements,u=a===void 0?Ui:a,c=In(s),f=c?l?gi:gi.filter(function(y){return In(y)===c}):Vn,m=f.filter(function(y){return u.indexOf(y)>=0});m.length===0&&(m=f);var p=m.reduce(function(y,v){return y[v]=Ln(e,{placement:v,boundary:r,rootBoundary:i,padding:o})[he(v)],y},{});return Object.keys(p).sort(function(y,v){return p[y]-p[v]})}function nm(e){if(he(e)===br)return[];var t=Ks(e);return[cl(e),t,cl(t)]}function sm(e){var t=e.state,n=e.options,s=e.name;if(!t.modifiersData[s]._skip){for(var r=n.mainAxis,i=r===void 0?!0:r,o=n.altAxis,l=o===void 0?!0:o,a=n.fallbackPlacements,u=n.padding,c=n.boundary,f=n.rootBoundary,m=n.altBoundary,p=n.flipVariations,y=p===void 0?!0:p,v=n.allowedAutoPlacements,x=t.options.placement,S=he(x),$=S===x,L=a||($||!y?[Ks(x)]:nm(x)),C=[x].concat(L).reduce(function(Mt,kt){return Mt.concat(he(kt)===br?em(t,{placement:kt,boundary:c,rootBoundary:f,padding:u,flipVariations:y,allowedAutoPlacements:v}):kt)},[]),V=t.rects.reference,K=t.rects.popper,U=new Map,rt=!0,it=C[0],J=0;J<C.length;J++){var ut=C[J],mt=he(ut),lt=In(ut)===sn,It=[$t,Ut].indexOf(mt)>=0,xt=It?"width":"height",Q=Ln(t,{placement:ut,boundary:c,rootBoundary:f,altBoundary:m,padding:u}),q=It?lt?Yt:Pt:lt?Ut:$t;V[xt]>K[xt]&&(q=Ks(q));var z=Ks(q),bt=[];if(i&&bt.push(Q[mt]<=0),l&&bt.push(Q[q]<=0,Q[z]<=0),bt.every(function(Mt){return Mt})){it=ut,rt=!1;break}U.set(ut,bt)}if(rt)for(var Lt=y?3:1,Dt=function(kt){var gt=C.find(function(b){var R=U.get(b);if(R)return R.slice(0,kt).every(function(P){return P})});if(gt)return it=gt,"break"},dt=Lt;dt>0;dt--){var ne=Dt(dt);if(ne==="break")break}t.placement!==it&&(t.modifiersData[s]._skip=!0,t.placement=it,t.reset=!0)}}const Pc={name:"flip",enabled:!0,phase:"main",fn:sm,requiresIfExists:["offset"],data:{_skip:!1}};function fl(e,t,n){return n===void 0&&(n={x:0,y:0}),{top:e.top-t.height-n.y,right:e.right-t.width+n.x,bottom:e.bottom-t.height+n.y,left:e.left-t.width-n.x}}function dl(e){return[$t,Yt,Ut,Pt].some(function(t){return e[t]>=0})}function rm(e){var t=e.state,n=e.name,s=t.rects.reference,r=t.rects.popper,i=t.modifiersData.preventOverflow,o=Ln(t,{elementContext:"reference"}),l=Ln(t,{altBoundary:!0}),a=fl(o,s),u=fl(l,r,i),c=dl(a),f=dl(u);t.modifiersData[n]={referenceClippingOffsets:a,popperEscapeOffsets:u,isReferenceHidden:c,hasPopperEscaped:f},t.attributes.popper=Object.assign({},t.attributes.popper,{"data-popper-reference-hidden":c,"data-popper-escaped":f})}const xc={name:"hide",enabled:!0,phase:"main",requiresIfExists:["preventOverflow"],fn:rm};function im(e,t,n){var s=he(e),r=[Pt,$t].indexOf(s)>=0?-1:1,i=typeof n=="function"?n(Object.assign({},t,{placement:e})):n,o=i[0],l=i[1];return o=o||0,l=(l||0)*r,[Pt,Yt].indexOf(s)>=0?{x:l,y:o}:{x:o,y:l}}function om(e){var t=e.state,n=e.options,s=e.name,r=n.offset,i=r===void 0?[0,0]:r,o=Ui.reduce(function(c,f){return c[f]=im(f,t.rects,i),c},{}),l=o[t.placement],a=l.x,u=l.y;t.modifiersData.popperOffsets!=null&&(t.modifiersData.popperOffsets.x+=a,t.modifiersData.popperOffsets.y+=u),t.modifiersData[s]=o}const Dc={name:"offset",enabled:!0,phase:"main",requires:["popperOffsets"],fn:om};function lm(e){var t=e.state,n=e.name;t.modifiersData[n]=$c({reference:t.rects.reference,element:t.rects.popper,strategy:"absolute",placement:t.placement})}const eo={name:"popperOffsets",enabled:!0,phase:"read",fn:lm,data:{}};function am(e){return e==="x"?"y":"x"}function cm(e){var t=e.state,n=e.options,s=e.name,r=n.mainAxis,i=r===void 0?!0:r,o=n.altAxis,l=o===void 0?!1:o,a=n.boundary,u=n.rootBoundary,c=n.altBoundary,f=n.padding,m=n.tether,p=m===void 0?!0:m,y=n.tetherOffset,v=y===void 0?0:y,x=Ln(t,{boundary:a,rootBoundary:u,padding:f,altBoundary:c}),S=he(t.placement),$=In(t.placement),L=!$,C=zi(S),V=am(C),K=t.modifiersData.popperOffsets,U=t.rects.reference,rt=t.rects.popper,it=typeof v=="function"?v(Object.assign({},t.rects,{placement:t.placement})):v,J=typeof it=="number"?{mainAxis:it,altAxis:it}:Object.assign({mainAxis:0,altAxis:0},it),ut=t.modifiersData.offset?t.modifiersData.offset[t.placement]:null,mt={x:0,y:0};if(K){if(i){var lt,It=C==="y"?$t:Pt,xt=C==="y"?Ut:Yt,Q=C==="y"?"height":"width",q=K[C],z=q+x[It],bt=q-x[xt],Lt=p?-rt[Q]/2:0,Dt=$===sn?U[Q]:rt[Q],dt=$===sn?-rt[Q]:-U[Q],ne=t.elements.arrow,Mt=p&&ne?Gi(ne):{width:0,height:0},kt=t.modifiersData["arrow#persistent"]?t.modifiersData["arrow#persistent"].padding:Tc(),gt=kt[It],b=kt[xt],R=is(0,U[Q],Mt[Q]),P=L?U[Q]/2-Lt-R-gt-J.mainAxis:Dt-R-gt-J.mainAxis,k=L?-U[Q]/2+Lt+R+b+J.mainAxis:dt+R+b+J.mainAxis,X=t.elements.arrow&&ys(t.elements.arrow),ft=X?C==="y"?X.clientTop||0:X.clientLeft||0:0,d=(lt=ut==null?void 0:ut[C])!=null?lt:0,h=q+P-d-ft,g=q+k-d,E=is(p?sr(z,h):z,q,p?Ze(bt,g):bt);K[C]=E,mt[C]=E-q}if(l){var _,A=C==="x"?$t:Pt,D=C==="x"?Ut:Yt,O=K[V],N=V==="y"?"height":"width",T=O+x[A],j=O-x[D],I=[$t,Pt].indexOf(S)!==-1,H=(_=ut==null?void 0:ut[V])!=null?_:0,B=I?T:O-U[N]-rt[N]-H+J.altAxis,G=I?O+U[N]+rt[N]-H-J.altAxis:j,et=p&&I?Fp(B,O,G):is(p?B:T,O,p?G:j);K[V]=et,mt[V]=et-O}t.modifiersData[s]=mt}}const Rc={name:"preventOverflow",enabled:!0,phase:"main",fn:cm,requiresIfExists:["offset"]};function um(e){return{scrollLeft:e.scrollLeft,scrollTop:e.scrollTop}}function fm(e){return e===qt(e)||!Qt(e)?Ji(e):um(e)}function dm(e){var t=e.getBoundingClientRect(),n=Dn(t.width)/e.offsetWidth||1,s=Dn(t.height)/e.offsetHeight||1;return n!==1||s!==1}function hm(e,t,n){n===void 0&&(n=!1);var s=Qt(t),r=Qt(t)&&dm(t),i=Be(t),o=Rn(e,r,n),l={scrollLeft:0,scrollTop:0},a={x:0,y:0};return(s||!s&&!n)&&((_e(t)!=="body"||to(i))&&(l=fm(t)),Qt(t)?(a=Rn(t,!0),a.x+=t.clientLeft,a.y+=t.clientTop):i&&(a.x=Zi(i))),{x:o.left+l.scrollLeft-a.x,y:o.top+l.scrollTop-a.y,width:o.width,height:o.height}}function pm(e){var t=new Map,n=new Set,s=[];e.forEach(function(i){t.set(i.name,i)});function r(i){n.add(i.name);var o=[].concat(i.requires||[],i.requiresIfExists||[]);o.forEach(function(l){if(!n.has(l)){var a=t.get(l);a&&r(a)}}),s.push(i)}return e.forEach(function(i){n.has(i.name)||r(i)}),s}function mm(e){var t=pm(e);return yc.reduce(function(n,s){return n.concat(t.filter(function(r){return r.phase===s}))},[])}function gm(e){var t;return function(){return t||(t=new Promise(function(n){Promise.resolve().then(function(){t=void 0,n(e())})})),t}}function _m(e){var t=e.reduce(function(n,s){var r=n[s.name];return n[s.name]=r?Object.assign({},r,s,{options:Object.assign({},r.options,s.options),data:Object.assign({},r.data,s.data)}):s,n},{});return Object.keys(t).map(function(n){return t[n]})}var hl={placement:"bottom",modifiers:[],strategy:"absolute"};function pl(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return!t.some(function(s){return!(s&&typeof s.getBoundingClientRect=="function")})}function Er(e){e===void 0&&(e={});var t=e,n=t.defaultModifiers,s=n===void 0?[]:n,r=t.defaultOptions,i=r===void 0?hl:r;return function(l,a,u){u===void 0&&(u=i);var c={placement:"bottom",orderedModifiers:[],options:Object.assign({},hl,i),modifiersData:{},elements:{reference:l,popper:a},attributes:{},styles:{}},f=[],m=!1,p={state:c,setOptions:function(S){var $=typeof S=="function"?S(c.options):S;v(),c.options=Object.assign({},i,c.options,$),c.scrollParents={reference:rn(l)?os(l):l.contextElement?os(l.contextElement):[],popper:os(a)};var L=mm(_m([].concat(s,c.options.modifiers)));return c.orderedModifiers=L.filter(function(C){return C.enabled}),y(),p.update()},forceUpdate:function(){if(!m){var S=c.elements,$=S.reference,L=S.popper;if(pl($,L)){c.rects={reference:hm($,ys(L),c.options.strategy==="fixed"),popper:Gi(L)},c.reset=!1,c.placement=c.options.placement,c.orderedModifiers.forEach(function(J){return c.modifiersData[J.name]=Object.assign({},J.data)});for(var C=0;C<c.orderedModifiers.length;C++){if(c.reset===!0){c.reset=!1,C=-1;continue}var V=c.orderedModifiers[C],K=V.fn,U=V.options,rt=U===void 0?{}:U,it=V.name;typeof K=="function"&&(c=K({state:c,options:rt,name:it,instance:p})||c)}}}},update:gm(function(){return new Promise(function(x){p.forceUpdate(),x(c)})}),destroy:function(){v(),m=!0}};if(!pl(l,a))return p;p.setOptions(u).then(function(x){!m&&u.onFirstUpdate&&u.onFirstUpdate(x)});function y(){c.orderedModifiers.forEach(function(x){var S=x.name,$=x.options,L=$===void 0?{}:$,C=x.effect;if(typeof C=="function"){var V=C({state:c,name:S,instance:p,options:L}),K=function(){};f.push(V||K)}})}function v(){f.forEach(function(x){return x()}),f=[]}return p}}var bm=Er(),vm=[Qi,eo,Xi,qi],Em=Er({defaultModifiers:vm}),ym=[Qi,eo,Xi,qi,Dc,Pc,Rc,Oc,xc],no=Er({defaultModifiers:ym});const Ic=Object.freeze(Object.defineProperty({__proto__:null,afterMain:_c,afterRead:pc,afterWrite:Ec,applyStyles:qi,arrow:Oc,auto:br,basePlacements:Vn,beforeMain:mc,beforeRead:dc,beforeWrite:bc,bottom:Ut,clippingParents:uc,computeStyles:Xi,createPopper:no,createPopperBase:bm,createPopperLite:Em,detectOverflow:Ln,end:xn,eventListeners:Qi,flip:Pc,hide:xc,left:Pt,main:gc,modifierPhases:yc,offset:Dc,placements:Ui,popper:mn,popperGenerator:Er,popperOffsets:eo,preventOverflow:Rc,read:hc,reference:fc,right:Yt,start:sn,top:$t,variationPlacements:gi,viewport:Ki,write:vc},Symbol.toStringTag,{value:"Module"}));/*!
+  */const pn=typeof document<"u";function Ga(e){return typeof e=="object"||"displayName"in e||"props"in e||"__vccOpts"in e}function kd(e){return e.__esModule||e[Symbol.toStringTag]==="Module"||e.default&&Ga(e.default)}const st=Object.assign;function kr(e,t){const n={};for(const s in t){const r=t[s];n[s]=oe(r)?r.map(e):e(r)}return n}const ss=()=>{},oe=Array.isArray,za=/#/g,Hd=/&/g,Vd=/\//g,Fd=/=/g,jd=/\?/g,Xa=/\+/g,Wd=/%5B/g,Bd=/%5D/g,Qa=/%5E/g,Kd=/%60/g,Ja=/%7B/g,Ud=/%7C/g,Za=/%7D/g,Yd=/%20/g;function Wi(e){return encodeURI(""+e).replace(Ud,"|").replace(Wd,"[").replace(Bd,"]")}function qd(e){return Wi(e).replace(Ja,"{").replace(Za,"}").replace(Qa,"^")}function hi(e){return Wi(e).replace(Xa,"%2B").replace(Yd,"+").replace(za,"%23").replace(Hd,"%26").replace(Kd,"`").replace(Ja,"{").replace(Za,"}").replace(Qa,"^")}function Gd(e){return hi(e).replace(Fd,"%3D")}function zd(e){return Wi(e).replace(za,"%23").replace(jd,"%3F")}function Xd(e){return e==null?"":zd(e).replace(Vd,"%2F")}function hs(e){try{return decodeURIComponent(""+e)}catch{}return""+e}const Qd=/\/$/,Jd=e=>e.replace(Qd,"");function Hr(e,t,n="/"){let s,r={},i="",o="";const l=t.indexOf("#");let a=t.indexOf("?");return l<a&&l>=0&&(a=-1),a>-1&&(s=t.slice(0,a),i=t.slice(a+1,l>-1?l:t.length),r=e(i)),l>-1&&(s=s||t.slice(0,l),o=t.slice(l,t.length)),s=nh(s??t,n),{fullPath:s+(i&&"?")+i+o,path:s,query:r,hash:hs(o)}}function Zd(e,t){const n=t.query?e(t.query):"";return t.path+(n&&"?")+n+(t.hash||"")}function Ko(e,t){return!t||!e.toLowerCase().startsWith(t.toLowerCase())?e:e.slice(t.length)||"/"}function th(e,t,n){const s=t.matched.length-1,r=n.matched.length-1;return s>-1&&s===r&&$n(t.matched[s],n.matched[r])&&tc(t.params,n.params)&&e(t.query)===e(n.query)&&t.hash===n.hash}function $n(e,t){return(e.aliasOf||e)===(t.aliasOf||t)}function tc(e,t){if(Object.keys(e).length!==Object.keys(t).length)return!1;for(const n in e)if(!eh(e[n],t[n]))return!1;return!0}function eh(e,t){return oe(e)?Uo(e,t):oe(t)?Uo(t,e):e===t}function Uo(e,t){return oe(t)?e.length===t.length&&e.every((n,s)=>n===t[s]):e.length===1&&e[0]===t}function nh(e,t){if(e.startsWith("/"))return e;if(!e)return t;const n=t.split("/"),s=e.split("/"),r=s[s.length-1];(r===".."||r===".")&&s.push("");let i=n.length-1,o,l;for(o=0;o<s.length;o++)if(l=s[o],l!==".")if(l==="..")i>1&&i--;else break;return n.slice(0,i).join("/")+"/"+s.slice(o).join("/")}const xe={path:"/",name:void 0,params:{},query:{},hash:"",fullPath:"/",matched:[],meta:{},redirectedFrom:void 0};var ps;(function(e){e.pop="pop",e.push="push"})(ps||(ps={}));var rs;(function(e){e.back="back",e.forward="forward",e.unknown=""})(rs||(rs={}));function sh(e){if(!e)if(pn){const t=document.querySelector("base");e=t&&t.getAttribute("href")||"/",e=e.replace(/^\w+:\/\/[^\/]+/,"")}else e="/";return e[0]!=="/"&&e[0]!=="#"&&(e="/"+e),Jd(e)}const rh=/^[^#]+#/;function ih(e,t){return e.replace(rh,"#")+t}function oh(e,t){const n=document.documentElement.getBoundingClientRect(),s=e.getBoundingClientRect();return{behavior:t.behavior,left:s.left-n.left-(t.left||0),top:s.top-n.top-(t.top||0)}}const _r=()=>({left:window.scrollX,top:window.scrollY});function lh(e){let t;if("el"in e){const n=e.el,s=typeof n=="string"&&n.startsWith("#"),r=typeof n=="string"?s?document.getElementById(n.slice(1)):document.querySelector(n):n;if(!r)return;t=oh(r,e)}else t=e;"scrollBehavior"in document.documentElement.style?window.scrollTo(t):window.scrollTo(t.left!=null?t.left:window.scrollX,t.top!=null?t.top:window.scrollY)}function Yo(e,t){return(history.state?history.state.position-t:-1)+e}const pi=new Map;function ah(e,t){pi.set(e,t)}function ch(e){const t=pi.get(e);return pi.delete(e),t}let uh=()=>location.protocol+"//"+location.host;function ec(e,t){const{pathname:n,search:s,hash:r}=t,i=e.indexOf("#");if(i>-1){let l=r.includes(e.slice(i))?e.slice(i).length:1,a=r.slice(l);return a[0]!=="/"&&(a="/"+a),Ko(a,"")}return Ko(n,e)+s+r}function fh(e,t,n,s){let r=[],i=[],o=null;const l=({state:m})=>{const p=ec(e,location),y=n.value,v=t.value;let x=0;if(m){if(n.value=p,t.value=m,o&&o===y){o=null;return}x=v?m.position-v.position:0}else s(p);r.forEach(S=>{S(n.value,y,{delta:x,type:ps.pop,direction:x?x>0?rs.forward:rs.back:rs.unknown})})};function a(){o=n.value}function u(m){r.push(m);const p=()=>{const y=r.indexOf(m);y>-1&&r.splice(y,1)};return i.push(p),p}function c(){const{history:m}=window;m.state&&m.replaceState(st({},m.state,{scroll:_r()}),"")}function f(){for(const m of i)m();i=[],window.removeEventListener("popstate",l),window.removeEventListener("beforeunload",c)}return window.addEventListener("popstate",l),window.addEventListener("beforeunload",c,{passive:!0}),{pauseListeners:a,listen:u,destroy:f}}function qo(e,t,n,s=!1,r=!1){return{back:e,current:t,forward:n,replaced:s,position:window.history.length,scroll:r?_r():null}}function dh(e){const{history:t,location:n}=window,s={value:ec(e,n)},r={value:t.state};r.value||i(s.value,{back:null,current:s.value,forward:null,position:t.length-1,replaced:!0,scroll:null},!0);function i(a,u,c){const f=e.indexOf("#"),m=f>-1?(n.host&&document.querySelector("base")?e:e.slice(f))+a:uh()+e+a;try{t[c?"replaceState":"pushState"](u,"",m),r.value=u}catch(p){console.error(p),n[c?"replace":"assign"](m)}}function o(a,u){const c=st({},t.state,qo(r.value.back,a,r.value.forward,!0),u,{position:r.value.position});i(a,c,!0),s.value=a}function l(a,u){const c=st({},r.value,t.state,{forward:a,scroll:_r()});i(c.current,c,!0);const f=st({},qo(s.value,a,null),{position:c.position+1},u);i(a,f,!1),s.value=a}return{location:s,state:r,push:l,replace:o}}function hh(e){e=sh(e);const t=dh(e),n=fh(e,t.state,t.location,t.replace);function s(i,o=!0){o||n.pauseListeners(),history.go(i)}const r=st({location:"",base:e,go:s,createHref:ih.bind(null,e)},t,n);return Object.defineProperty(r,"location",{enumerable:!0,get:()=>t.location.value}),Object.defineProperty(r,"state",{enumerable:!0,get:()=>t.state.value}),r}function ph(e){return typeof e=="string"||e&&typeof e=="object"}function nc(e){return typeof e=="string"||typeof e=="symbol"}const sc=Symbol("");var Go;(function(e){e[e.aborted=4]="aborted",e[e.cancelled=8]="cancelled",e[e.duplicated=16]="duplicated"})(Go||(Go={}));function Pn(e,t){return st(new Error,{type:e,[sc]:!0},t)}function ve(e,t){return e instanceof Error&&sc in e&&(t==null||!!(e.type&t))}const zo="[^/]+?",mh={sensitive:!1,strict:!1,start:!0,end:!0},gh=/[.+*?^${}()[\]/\\]/g;function _h(e,t){const n=st({},mh,t),s=[];let r=n.start?"^":"";const i=[];for(const u of e){const c=u.length?[]:[90];n.strict&&!u.length&&(r+="/");for(let f=0;f<u.length;f++){const m=u[f];let p=40+(n.sensitive?.25:0);if(m.type===0)f||(r+="/"),r+=m.value.replace(gh,"\\$&"),p+=40;else if(m.type===1){const{value:y,repeatable:v,optional:x,regexp:S}=m;i.push({name:y,repeatable:v,optional:x});const $=S||zo;if($!==zo){p+=10;try{new RegExp(`(${$})`)}catch(C){throw new Error(`Invalid custom RegExp for param "${y}" (${$}): `+C.message)}}let L=v?`((?:${$})(?:/(?:${$}))*)`:`(${$})`;f||(L=x&&u.length<2?`(?:/${L})`:"/"+L),x&&(L+="?"),r+=L,p+=20,x&&(p+=-8),v&&(p+=-20),$===".*"&&(p+=-50)}c.push(p)}s.push(c)}if(n.strict&&n.end){const u=s.length-1;s[u][s[u].length-1]+=.7000000000000001}n.strict||(r+="/?"),n.end?r+="$":n.strict&&(r+="(?:/|$)");const o=new RegExp(r,n.sensitive?"":"i");function l(u){const c=u.match(o),f={};if(!c)return null;for(let m=1;m<c.length;m++){const p=c[m]||"",y=i[m-1];f[y.name]=p&&y.repeatable?p.split("/"):p}return f}function a(u){let c="",f=!1;for(const m of e){(!f||!c.endsWith("/"))&&(c+="/"),f=!1;for(const p of m)if(p.type===0)c+=p.value;else if(p.type===1){const{value:y,repeatable:v,optional:x}=p,S=y in u?u[y]:"";if(oe(S)&&!v)throw new Error(`Provided param "${y}" is an array but it is not repeatable (* or + modifiers)`);const $=oe(S)?S.join("/"):S;if(!$)if(x)m.length<2&&(c.endsWith("/")?c=c.slice(0,-1):f=!0);else throw new Error(`Missing required param "${y}"`);c+=$}}return c||"/"}return{re:o,score:s,keys:i,parse:l,stringify:a}}function bh(e,t){let n=0;for(;n<e.length&&n<t.length;){const s=t[n]-e[n];if(s)return s;n++}return e.length<t.length?e.length===1&&e[0]===80?-1:1:e.length>t.length?t.length===1&&t[0]===80?1:-1:0}function rc(e,t){let n=0;const s=e.score,r=t.score;for(;n<s.length&&n<r.length;){const i=bh(s[n],r[n]);if(i)return i;n++}if(Math.abs(r.length-s.length)===1){if(Xo(s))return 1;if(Xo(r))return-1}return r.length-s.length}function Xo(e){const t=e[e.length-1];return e.length>0&&t[t.length-1]<0}const vh={type:0,value:""},Eh=/[a-zA-Z0-9_]/;function yh(e){if(!e)return[[]];if(e==="/")return[[vh]];if(!e.startsWith("/"))throw new Error(`Invalid path "${e}"`);function t(p){throw new Error(`ERR (${n})/"${u}": ${p}`)}let n=0,s=n;const r=[];let i;function o(){i&&r.push(i),i=[]}let l=0,a,u="",c="";function f(){u&&(n===0?i.push({type:0,value:u}):n===1||n===2||n===3?(i.length>1&&(a==="*"||a==="+")&&t(`A repeatable param (${u}) must be alone in its segment. eg: '/:ids+.`),i.push({type:1,value:u,regexp:c,repeatable:a==="*"||a==="+",optional:a==="*"||a==="?"})):t("Invalid state to consume buffer"),u="")}function m(){u+=a}for(;l<e.length;){if(a=e[l++],a==="\\"&&n!==2){s=n,n=4;continue}switch(n){case 0:a==="/"?(u&&f(),o()):a===":"?(f(),n=1):m();break;case 4:m(),n=s;break;case 1:a==="("?n=2:Eh.test(a)?m():(f(),n=0,a!=="*"&&a!=="?"&&a!=="+"&&l--);break;case 2:a===")"?c[c.length-1]=="\\"?c=c.slice(0,-1)+a:n=3:c+=a;break;case 3:f(),n=0,a!=="*"&&a!=="?"&&a!=="+"&&l--,c="";break;default:t("Unknown state");break}}return n===2&&t(`Unfinished custom RegExp for param "${u}"`),f(),o(),r}function wh(e,t,n){const s=_h(yh(e.path),n),r=st(s,{record:e,parent:t,children:[],alias:[]});return t&&!r.record.aliasOf==!t.record.aliasOf&&t.children.push(r),r}function Ah(e,t){const n=[],s=new Map;t=tl({strict:!1,end:!0,sensitive:!1},t);function r(f){return s.get(f)}function i(f,m,p){const y=!p,v=Jo(f);v.aliasOf=p&&p.record;const x=tl(t,f),S=[v];if("alias"in f){const C=typeof f.alias=="string"?[f.alias]:f.alias;for(const V of C)S.push(Jo(st({},v,{components:p?p.record.components:v.components,path:V,aliasOf:p?p.record:v})))}let $,L;for(const C of S){const{path:V}=C;if(m&&V[0]!=="/"){const K=m.record.path,U=K[K.length-1]==="/"?"":"/";C.path=m.record.path+(V&&U+V)}if($=wh(C,m,x),p?p.alias.push($):(L=L||$,L!==$&&L.alias.push($),y&&f.name&&!Zo($)&&o(f.name)),ic($)&&a($),v.children){const K=v.children;for(let U=0;U<K.length;U++)i(K[U],$,p&&p.children[U])}p=p||$}return L?()=>{o(L)}:ss}function o(f){if(nc(f)){const m=s.get(f);m&&(s.delete(f),n.splice(n.indexOf(m),1),m.children.forEach(o),m.alias.forEach(o))}else{const m=n.indexOf(f);m>-1&&(n.splice(m,1),f.record.name&&s.delete(f.record.name),f.children.forEach(o),f.alias.forEach(o))}}function l(){return n}function a(f){const m=Sh(f,n);n.splice(m,0,f),f.record.name&&!Zo(f)&&s.set(f.record.name,f)}function u(f,m){let p,y={},v,x;if("name"in f&&f.name){if(p=s.get(f.name),!p)throw Pn(1,{location:f});x=p.record.name,y=st(Qo(m.params,p.keys.filter(L=>!L.optional).concat(p.parent?p.parent.keys.filter(L=>L.optional):[]).map(L=>L.name)),f.params&&Qo(f.params,p.keys.map(L=>L.name))),v=p.stringify(y)}else if(f.path!=null)v=f.path,p=n.find(L=>L.re.test(v)),p&&(y=p.parse(v),x=p.record.name);else{if(p=m.name?s.get(m.name):n.find(L=>L.re.test(m.path)),!p)throw Pn(1,{location:f,currentLocation:m});x=p.record.name,y=st({},m.params,f.params),v=p.stringify(y)}const S=[];let $=p;for(;$;)S.unshift($.record),$=$.parent;return{name:x,path:v,params:y,matched:S,meta:Ch(S)}}e.forEach(f=>i(f));function c(){n.length=0,s.clear()}return{addRoute:i,resolve:u,removeRoute:o,clearRoutes:c,getRoutes:l,getRecordMatcher:r}}function Qo(e,t){const n={};for(const s of t)s in e&&(n[s]=e[s]);return n}function Jo(e){const t={path:e.path,redirect:e.redirect,name:e.name,meta:e.meta||{},aliasOf:e.aliasOf,beforeEnter:e.beforeEnter,props:Th(e),children:e.children||[],instances:{},leaveGuards:new Set,updateGuards:new Set,enterCallbacks:{},components:"components"in e?e.components||null:e.component&&{default:e.component}};return Object.defineProperty(t,"mods",{value:{}}),t}function Th(e){const t={},n=e.props||!1;if("component"in e)t.default=n;else for(const s in e.components)t[s]=typeof n=="object"?n[s]:n;return t}function Zo(e){for(;e;){if(e.record.aliasOf)return!0;e=e.parent}return!1}function Ch(e){return e.reduce((t,n)=>st(t,n.meta),{})}function tl(e,t){const n={};for(const s in e)n[s]=s in t?t[s]:e[s];return n}function Sh(e,t){let n=0,s=t.length;for(;n!==s;){const i=n+s>>1;rc(e,t[i])<0?s=i:n=i+1}const r=Oh(e);return r&&(s=t.lastIndexOf(r,s-1)),s}function Oh(e){let t=e;for(;t=t.parent;)if(ic(t)&&rc(e,t)===0)return t}function ic({record:e}){return!!(e.name||e.components&&Object.keys(e.components).length||e.redirect)}function Nh(e){const t={};if(e===""||e==="?")return t;const s=(e[0]==="?"?e.slice(1):e).split("&");for(let r=0;r<s.length;++r){const i=s[r].replace(Xa," "),o=i.indexOf("="),l=hs(o<0?i:i.slice(0,o)),a=o<0?null:hs(i.slice(o+1));if(l in t){let u=t[l];oe(u)||(u=t[l]=[u]),u.push(a)}else t[l]=a}return t}function el(e){let t="";for(let n in e){const s=e[n];if(n=Gd(n),s==null){s!==void 0&&(t+=(t.length?"&":"")+n);continue}(oe(s)?s.map(i=>i&&hi(i)):[s&&hi(s)]).forEach(i=>{i!==void 0&&(t+=(t.length?"&":"")+n,i!=null&&(t+="="+i))})}return t}function $h(e){const t={};for(const n in e){const s=e[n];s!==void 0&&(t[n]=oe(s)?s.map(r=>r==null?null:""+r):s==null?s:""+s)}return t}const Ph=Symbol(""),nl=Symbol(""),Bi=Symbol(""),oc=Symbol(""),mi=Symbol("");function Yn(){let e=[];function t(s){return e.push(s),()=>{const r=e.indexOf(s);r>-1&&e.splice(r,1)}}function n(){e=[]}return{add:t,list:()=>e.slice(),reset:n}}function Le(e,t,n,s,r,i=o=>o()){const o=s&&(s.enterCallbacks[r]=s.enterCallbacks[r]||[]);return()=>new Promise((l,a)=>{const u=m=>{m===!1?a(Pn(4,{from:n,to:t})):m instanceof Error?a(m):ph(m)?a(Pn(2,{from:t,to:m})):(o&&s.enterCallbacks[r]===o&&typeof m=="function"&&o.push(m),l())},c=i(()=>e.call(s&&s.instances[r],t,n,u));let f=Promise.resolve(c);e.length<3&&(f=f.then(u)),f.catch(m=>a(m))})}function Vr(e,t,n,s,r=i=>i()){const i=[];for(const o of e)for(const l in o.components){let a=o.components[l];if(!(t!=="beforeRouteEnter"&&!o.instances[l]))if(Ga(a)){const c=(a.__vccOpts||a)[t];c&&i.push(Le(c,n,s,o,l,r))}else{let u=a();i.push(()=>u.then(c=>{if(!c)throw new Error(`Couldn't resolve component "${l}" at "${o.path}"`);const f=kd(c)?c.default:c;o.mods[l]=c,o.components[l]=f;const p=(f.__vccOpts||f)[t];return p&&Le(p,n,s,o,l,r)()}))}}return i}function sl(e){const t=Ce(Bi),n=Ce(oc),s=re(()=>{const a=Tn(e.to);return t.resolve(a)}),r=re(()=>{const{matched:a}=s.value,{length:u}=a,c=a[u-1],f=n.matched;if(!c||!f.length)return-1;const m=f.findIndex($n.bind(null,c));if(m>-1)return m;const p=rl(a[u-2]);return u>1&&rl(c)===p&&f[f.length-1].path!==p?f.findIndex($n.bind(null,a[u-2])):m}),i=re(()=>r.value>-1&&Ih(n.params,s.value.params)),o=re(()=>r.value>-1&&r.value===n.matched.length-1&&tc(n.params,s.value.params));function l(a={}){return Rh(a)?t[Tn(e.replace)?"replace":"push"](Tn(e.to)).catch(ss):Promise.resolve()}return{route:s,href:re(()=>s.value.href),isActive:i,isExactActive:o,navigate:l}}const xh=ln({name:"RouterLink",compatConfig:{MODE:3},props:{to:{type:[String,Object],required:!0},replace:Boolean,activeClass:String,exactActiveClass:String,custom:Boolean,ariaCurrentValue:{type:String,default:"page"}},useLink:sl,setup(e,{slots:t}){const n=_s(sl(e)),{options:s}=Ce(Bi),r=re(()=>({[il(e.activeClass,s.linkActiveClass,"router-link-active")]:n.isActive,[il(e.exactActiveClass,s.linkExactActiveClass,"router-link-exact-active")]:n.isExactActive}));return()=>{const i=t.default&&t.default(n);return e.custom?i:Ka("a",{"aria-current":n.isExactActive?e.ariaCurrentValue:null,href:n.href,onClick:n.navigate,class:r.value},i)}}}),Dh=xh;function Rh(e){if(!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)&&!e.defaultPrevented&&!(e.button!==void 0&&e.button!==0)){if(e.currentTarget&&e.currentTarget.getAttribute){const t=e.currentTarget.getAttribute("target");if(/\b_blank\b/i.test(t))return}return e.preventDefault&&e.preventDefault(),!0}}function Ih(e,t){for(const n in t){const s=t[n],r=e[n];if(typeof s=="string"){if(s!==r)return!1}else if(!oe(r)||r.length!==s.length||s.some((i,o)=>i!==r[o]))return!1}return!0}function rl(e){return e?e.aliasOf?e.aliasOf.path:e.path:""}const il=(e,t,n)=>e??t??n,Lh=ln({name:"RouterView",inheritAttrs:!1,props:{name:{type:String,default:"default"},route:Object},compatConfig:{MODE:3},setup(e,{attrs:t,slots:n}){const s=Ce(mi),r=re(()=>e.route||s.value),i=Ce(nl,0),o=re(()=>{let u=Tn(i);const{matched:c}=r.value;let f;for(;(f=c[u])&&!f.components;)u++;return u}),l=re(()=>r.value.matched[o.value]);Vs(nl,re(()=>o.value+1)),Vs(Ph,l),Vs(mi,r);const a=yt();return Fs(()=>[a.value,l.value,e.name],([u,c,f],[m,p,y])=>{c&&(c.instances[f]=u,p&&p!==c&&u&&u===m&&(c.leaveGuards.size||(c.leaveGuards=p.leaveGuards),c.updateGuards.size||(c.updateGuards=p.updateGuards))),u&&c&&(!p||!$n(c,p)||!m)&&(c.enterCallbacks[f]||[]).forEach(v=>v(u))},{flush:"post"}),()=>{const u=r.value,c=e.name,f=l.value,m=f&&f.components[c];if(!m)return ol(n.default,{Component:m,route:u});const p=f.props[c],y=p?p===!0?u.params:typeof p=="function"?p(u):p:null,x=Ka(m,st({},y,t,{onVnodeUnmounted:S=>{S.component.isUnmounted&&(f.instances[c]=null)},ref:a}));return ol(n.default,{Component:x,route:u})||x}}});function ol(e,t){if(!e)return null;const n=e(t);return n.length===1?n[0]:n}const lc=Lh;function Mh(e){const t=Ah(e.routes,e),n=e.parseQuery||Nh,s=e.stringifyQuery||el,r=e.history,i=Yn(),o=Yn(),l=Yn(),a=Ku(xe);let u=xe;pn&&e.scrollBehavior&&"scrollRestoration"in history&&(history.scrollRestoration="manual");const c=kr.bind(null,b=>""+b),f=kr.bind(null,Xd),m=kr.bind(null,hs);function p(b,R){let P,k;return nc(b)?(P=t.getRecordMatcher(b),k=R):k=b,t.addRoute(k,P)}function y(b){const R=t.getRecordMatcher(b);R&&t.removeRoute(R)}function v(){return t.getRoutes().map(b=>b.record)}function x(b){return!!t.getRecordMatcher(b)}function S(b,R){if(R=st({},R||a.value),typeof b=="string"){const h=Hr(n,b,R.path),g=t.resolve({path:h.path},R),E=r.createHref(h.fullPath);return st(h,g,{params:m(g.params),hash:hs(h.hash),redirectedFrom:void 0,href:E})}let P;if(b.path!=null)P=st({},b,{path:Hr(n,b.path,R.path).path});else{const h=st({},b.params);for(const g in h)h[g]==null&&delete h[g];P=st({},b,{params:f(h)}),R.params=f(R.params)}const k=t.resolve(P,R),X=b.hash||"";k.params=c(m(k.params));const ft=Zd(s,st({},b,{hash:qd(X),path:k.path})),d=r.createHref(ft);return st({fullPath:ft,hash:X,query:s===el?$h(b.query):b.query||{}},k,{redirectedFrom:void 0,href:d})}function $(b){return typeof b=="string"?Hr(n,b,a.value.path):st({},b)}function L(b,R){if(u!==b)return Pn(8,{from:R,to:b})}function C(b){return U(b)}function V(b){return C(st($(b),{replace:!0}))}function K(b){const R=b.matched[b.matched.length-1];if(R&&R.redirect){const{redirect:P}=R;let k=typeof P=="function"?P(b):P;return typeof k=="string"&&(k=k.includes("?")||k.includes("#")?k=$(k):{path:k},k.params={}),st({query:b.query,hash:b.hash,params:k.path!=null?{}:b.params},k)}}function U(b,R){const P=u=S(b),k=a.value,X=b.state,ft=b.force,d=b.replace===!0,h=K(P);if(h)return U(st($(h),{state:typeof h=="object"?st({},X,h.state):X,force:ft,replace:d}),R||P);const g=P;g.redirectedFrom=R;let E;return!ft&&th(s,k,P)&&(E=Pn(16,{to:g,from:k}),Dt(k,k,!0,!1)),(E?Promise.resolve(E):J(g,k)).catch(_=>ve(_)?ve(_,2)?_:Lt(_):z(_,g,k)).then(_=>{if(_){if(ve(_,2))return U(st({replace:d},$(_.to),{state:typeof _.to=="object"?st({},X,_.to.state):X,force:ft}),R||g)}else _=mt(g,k,!0,d,X);return ut(g,k,_),_})}function rt(b,R){const P=L(b,R);return P?Promise.reject(P):Promise.resolve()}function it(b){const R=Mt.values().next().value;return R&&typeof R.runWithContext=="function"?R.runWithContext(b):b()}function J(b,R){let P;const[k,X,ft]=kh(b,R);P=Vr(k.reverse(),"beforeRouteLeave",b,R);for(const h of k)h.leaveGuards.forEach(g=>{P.push(Le(g,b,R))});const d=rt.bind(null,b,R);return P.push(d),gt(P).then(()=>{P=[];for(const h of i.list())P.push(Le(h,b,R));return P.push(d),gt(P)}).then(()=>{P=Vr(X,"beforeRouteUpdate",b,R);for(const h of X)h.updateGuards.forEach(g=>{P.push(Le(g,b,R))});return P.push(d),gt(P)}).then(()=>{P=[];for(const h of ft)if(h.beforeEnter)if(oe(h.beforeEnter))for(const g of h.beforeEnter)P.push(Le(g,b,R));else P.push(Le(h.beforeEnter,b,R));return P.push(d),gt(P)}).then(()=>(b.matched.forEach(h=>h.enterCallbacks={}),P=Vr(ft,"beforeRouteEnter",b,R,it),P.push(d),gt(P))).then(()=>{P=[];for(const h of o.list())P.push(Le(h,b,R));return P.push(d),gt(P)}).catch(h=>ve(h,8)?h:Promise.reject(h))}function ut(b,R,P){l.list().forEach(k=>it(()=>k(b,R,P)))}function mt(b,R,P,k,X){const ft=L(b,R);if(ft)return ft;const d=R===xe,h=pn?history.state:{};P&&(k||d?r.replace(b.fullPath,st({scroll:d&&h&&h.scroll},X)):r.push(b.fullPath,X)),a.value=b,Dt(b,R,P,d),Lt()}let lt;function It(){lt||(lt=r.listen((b,R,P)=>{if(!kt.listening)return;const k=S(b),X=K(k);if(X){U(st(X,{replace:!0}),k).catch(ss);return}u=k;const ft=a.value;pn&&ah(Yo(ft.fullPath,P.delta),_r()),J(k,ft).catch(d=>ve(d,12)?d:ve(d,2)?(U(d.to,k).then(h=>{ve(h,20)&&!P.delta&&P.type===ps.pop&&r.go(-1,!1)}).catch(ss),Promise.reject()):(P.delta&&r.go(-P.delta,!1),z(d,k,ft))).then(d=>{d=d||mt(k,ft,!1),d&&(P.delta&&!ve(d,8)?r.go(-P.delta,!1):P.type===ps.pop&&ve(d,20)&&r.go(-1,!1)),ut(k,ft,d)}).catch(ss)}))}let xt=Yn(),Q=Yn(),q;function z(b,R,P){Lt(b);const k=Q.list();return k.length?k.forEach(X=>X(b,R,P)):console.error(b),Promise.reject(b)}function bt(){return q&&a.value!==xe?Promise.resolve():new Promise((b,R)=>{xt.add([b,R])})}function Lt(b){return q||(q=!b,It(),xt.list().forEach(([R,P])=>b?P(b):R()),xt.reset()),b}function Dt(b,R,P,k){const{scrollBehavior:X}=e;if(!pn||!X)return Promise.resolve();const ft=!P&&ch(Yo(b.fullPath,0))||(k||!P)&&history.state&&history.state.scroll||null;return Li().then(()=>X(b,R,ft)).then(d=>d&&lh(d)).catch(d=>z(d,b,R))}const dt=b=>r.go(b);let ne;const Mt=new Set,kt={currentRoute:a,listening:!0,addRoute:p,removeRoute:y,clearRoutes:t.clearRoutes,hasRoute:x,getRoutes:v,resolve:S,options:e,push:C,replace:V,go:dt,back:()=>dt(-1),forward:()=>dt(1),beforeEach:i.add,beforeResolve:o.add,afterEach:l.add,onError:Q.add,isReady:bt,install(b){const R=this;b.component("RouterLink",Dh),b.component("RouterView",lc),b.config.globalProperties.$router=R,Object.defineProperty(b.config.globalProperties,"$route",{enumerable:!0,get:()=>Tn(a)}),pn&&!ne&&a.value===xe&&(ne=!0,C(r.location).catch(X=>{}));const P={};for(const X in xe)Object.defineProperty(P,X,{get:()=>a.value[X],enumerable:!0});b.provide(Bi,R),b.provide(oc,ua(P)),b.provide(mi,a);const k=b.unmount;Mt.add(b),b.unmount=function(){Mt.delete(b),Mt.size<1&&(u=xe,lt&&lt(),lt=null,a.value=xe,ne=!1,q=!1),k()}}};function gt(b){return b.reduce((R,P)=>R.then(()=>it(P)),Promise.resolve())}return kt}function kh(e,t){const n=[],s=[],r=[],i=Math.max(t.matched.length,e.matched.length);for(let o=0;o<i;o++){const l=t.matched[o];l&&(e.matched.find(u=>$n(u,l))?s.push(l):n.push(l));const a=e.matched[o];a&&(t.matched.find(u=>$n(u,a))||r.push(a))}return[n,s,r]}const Hh=ln({components:{RouterView:lc}}),Es=(e,t)=>{const n=e.__vccOpts||e;for(const[s,r]of t)n[s]=r;return n},Vh={class:"container py-5"},Fh={class:"d-flex justify-content-between align-items-center bg-main text-light p-4 rounded-lg shadow-lg mb-4"},jh={class:"nav"},Wh={class:"nav-item"},Bh={class:"nav-item"};function Kh(e,t,n,s,r,i){const o=Js("router-link"),l=Js("RouterView");return Et(),Ot("main",Vh,[M("div",Fh,[ht(o,{to:"/dashboard",class:"h2 m-0 text-decoration-none text-light"},{default:Hs(()=>t[0]||(t[0]=[ns("Dashboard")])),_:1}),M("nav",null,[M("ul",jh,[M("li",Wh,[ht(o,{to:"/profile",class:"nav-link text-light"},{default:Hs(()=>t[1]||(t[1]=[ns("Profile")])),_:1})]),M("li",Bh,[ht(o,{to:"/hobbies",class:"nav-link text-light"},{default:Hs(()=>t[2]||(t[2]=[ns("Hobbies")])),_:1})]),t[3]||(t[3]=M("li",{class:"nav-item"},[M("a",{href:"/logout",class:"nav-link text-light"},"Logout")],-1))])])]),ht(l,{class:"flex-shrink-0"})])}const Uh=Es(Hh,[["render",Kh],["__scopeId","data-v-3622d4cf"]]),Yh=ln({name:"Dashboard",setup(){const e=yt(""),t=async()=>{try{const n=await fetch("/api/profile",{method:"GET",headers:{"Content-Type":"application/json"}});if(n.ok){const s=await n.json();e.value=s.name}else console.error("Failed to fetch username:",n.status),e.value=""}catch(n){console.error("Error fetching username:",n),e.value=""}};return Hi(()=>{t()}),{userName:e}}}),qh={class:"mt-4"};function Gh(e,t,n,s,r,i){return Et(),Ot(Gt,null,[M("div",qh,[M("h3",null,"Hello "+wn(e.userName),1)]),t[0]||(t[0]=zf('<div class="row mt-5" data-v-11611174><div class="col-md-4" data-v-11611174><div class="box p-4 text-white bg-info rounded-lg shadow-lg" data-v-11611174><h4 data-v-11611174>Friend Requests</h4></div></div><div class="col-md-4" data-v-11611174><div class="box p-4 text-white bg-teal rounded-lg shadow-lg" data-v-11611174><h4 data-v-11611174>Friends</h4></div></div><div class="col-md-4" data-v-11611174><div class="box p-4 text-white bg-lightTeal rounded-lg shadow-lg" data-v-11611174><h4 data-v-11611174>Pending Requests</h4></div></div></div>',1))],64)}const zh=Es(Yh,[["render",Gh],["__scopeId","data-v-11611174"]]),Xh=ln({name:"ChangePassword",setup(e,{emit:t}){const n=yt(""),s=yt(""),r=yt(""),i=yt(""),o=yt(!1),l=yt(!1),a=yt(!1),u=()=>{t("close")},c=()=>{o.value=!o.value},f=()=>{l.value=!l.value},m=()=>{a.value=!a.value},p=yt({length:!1,nonNumeric:!1}),y=()=>{const S=s.value;p.value.length=S.length>=8,p.value.nonNumeric=!/^\d+$/.test(S)&&/[a-zA-Z!@#$%^&*(),.?":{}|<>]/.test(S)},v=async()=>{if(s.value!==r.value){i.value="Passwords do not match!";return}try{const S=await fetch("/api/update-password",{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":x()},body:JSON.stringify({current_password:n.value,new_password:s.value})}),$=await S.json();S.ok?alert("Password changed successfully!"):i.value=$.error||"An error occurred."}catch{i.value="An error occurred. Please try again."}},x=()=>{const S=document.cookie.match(/csrftoken=([^;]+)/);return S?S[1]:""};return{currentPassword:n,newPassword:s,confirmPassword:r,errorMessage:i,passwordRequirements:p,submitForm:v,checkPasswordRequirements:y,showCurrentPassword:o,showNewPassword:l,showConfirmPassword:a,toggleShowCurrentPassword:c,toggleShowNewPassword:f,toggleShowConfirmPassword:m,closeModal:u}}}),Qh={class:"container mt-5",style:{"background-color":"white","border-radius":"8px",padding:"30px"}},Jh={class:"mb-3"},Zh={class:"input-group"},tp=["type"],ep={class:"mb-3"},np={class:"input-group"},sp=["type"],rp={class:"mt-3",style:{"list-style-type":"none","padding-left":"0"}},ip={class:"mb-3"},op={class:"input-group"},lp=["type"],ap={key:0,class:"alert alert-danger",role:"alert",style:{"background-color":"#ff6b6b",color:"#feffff"}},cp={class:"text-center"};function up(e,t,n,s,r,i){return Et(),Ot("div",Qh,[t[13]||(t[13]=M("h1",{class:"mb-4",style:{color:"#17252A"}},"Change Password",-1)),M("form",{onSubmit:t[8]||(t[8]=di((...o)=>e.submitForm&&e.submitForm(...o),["prevent"])),class:"needs-validation",novalidate:""},[M("div",Jh,[t[9]||(t[9]=M("label",{for:"current_password",class:"form-label",style:{color:"#17252A"}},"Current Password",-1)),M("div",Zh,[Te(M("input",{type:e.showCurrentPassword?"text":"password",id:"current_password","onUpdate:modelValue":t[0]||(t[0]=o=>e.currentPassword=o),class:"form-control",required:"",style:{"background-color":"#feffff",border:"1px solid #2b7a78",color:"#17252A"}},null,8,tp),[[Mr,e.currentPassword]]),M("button",{type:"button",class:"btn btn-outline-secondary",onClick:t[1]||(t[1]=(...o)=>e.toggleShowCurrentPassword&&e.toggleShowCurrentPassword(...o)),style:{"background-color":"#0dcaf0",color:"#feffff",border:"none"}},[M("i",{class:yn(["bi",e.showCurrentPassword?"bi-eye":"bi-eye-slash"])},null,2)])])]),M("div",ep,[t[10]||(t[10]=M("label",{for:"new_password",class:"form-label",style:{color:"#17252A"}},"New Password",-1)),M("div",np,[Te(M("input",{type:e.showNewPassword?"text":"password",id:"new_password","onUpdate:modelValue":t[2]||(t[2]=o=>e.newPassword=o),onInput:t[3]||(t[3]=(...o)=>e.checkPasswordRequirements&&e.checkPasswordRequirements(...o)),class:"form-control",required:"",style:{"background-color":"#feffff",border:"1px solid #2b7a78",color:"#17252A"}},null,40,sp),[[Mr,e.newPassword]]),M("button",{type:"button",class:"btn btn-outline-secondary",onClick:t[4]||(t[4]=(...o)=>e.toggleShowNewPassword&&e.toggleShowNewPassword(...o)),style:{"background-color":"#0dcaf0",color:"#feffff",border:"none"}},[M("i",{class:yn(["bi",e.showCurrentPassword?"bi-eye":"bi-eye-slash"])},null,2)])]),M("ul",rp,[M("li",{style:ls({color:e.passwordRequirements.length?"green":"red"})}," Minimum 8 characters ",4),M("li",{style:ls({color:e.passwordRequirements.nonNumeric?"green":"red"})}," Password should not be entirely numeric ",4)])]),M("div",ip,[t[11]||(t[11]=M("label",{for:"confirm_password",class:"form-label",style:{color:"#17252A"}},"Confirm New Password",-1)),M("div",op,[Te(M("input",{type:e.showConfirmPassword?"text":"password",id:"confirm_password","onUpdate:modelValue":t[5]||(t[5]=o=>e.confirmPassword=o),class:"form-control",required:"",style:{"background-color":"#feffff",border:"1px solid #2b7a78",color:"#17252A"}},null,8,lp),[[Mr,e.confirmPassword]]),M("button",{type:"button",class:"btn btn-outline-secondary",onClick:t[6]||(t[6]=(...o)=>e.toggleShowConfirmPassword&&e.toggleShowConfirmPassword(...o)),style:{"background-color":"#0dcaf0",color:"#feffff",border:"none"}},[M("i",{class:yn(["bi",e.showCurrentPassword?"bi-eye":"bi-eye-slash"])},null,2)])])]),e.errorMessage?(Et(),Ot("div",ap,wn(e.errorMessage),1)):er("",!0),M("div",cp,[t[12]||(t[12]=M("button",{type:"submit",class:"btn",style:{"background-color":"#0dcaf0",color:"#feffff",border:"none"}},"Change Password",-1)),M("button",{type:"button",class:"btn btn-outline-danger",onClick:t[7]||(t[7]=(...o)=>e.closeModal&&e.closeModal(...o))},"Cancel")])],32)])}const ac=Es(Xh,[["render",up],["__scopeId","data-v-e4f38635"]]),fp=ln({name:"UserHobbies",setup(){const e=yt([]),t=yt([]),n=yt(""),s=yt(""),r=yt(null),d=async f=>{const m=[];for(;f;){const p=await fetch(f);if(!p.ok)return null;m.push(...await p.json());const y=p.headers.get("Link")?.match(/<([^>]+)>;\s*rel="next"/);f=y?y[1]:null}return m},i=async()=>{try{const f=await d("/api/hobbies/");if(!f)throw new Error("Failed to fetch hobbies");e.value=f.sort((m,p)=>m.name.localeCompare(p.name))}catch(f){console.error("Error fetching hobbies:",f)}},o=async()=>{try{const f=await d("/api/all-hobbies/");if(!f)throw new Error("Failed to fetch all hobbies");t.value=f}catch(f){console.error("Error fetching all hobbies:",f)}};function l(){const f=document.cookie.match(/csrftoken=([^;]+)/);return f?f[1]:""}const a=async()=>{let f=n.value;const m=e.value.find(p=>p.id===Number(f)||p.name===s.value);if(m){r.value=`You already have the hobby "${m.name}"!`,setTimeout(()=>{r.value=null},5e3);return}if(f==="other"&&s.value)try{const p=await fetch("/api/hobbies/create/",{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":l()},body:JSON.stringify({name:s.value})});if(!p.ok)throw new Error("Failed to create new hobby");const y=await p.json();if(t.value.push(y),n.value=y.id.toString(),!(await fetch("/api/hobbies/add/",{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":l()},body:JSON.stringify({hobby_id:y.id})})).ok)throw new Error("Failed to add hobby to user");i(),n.value="",s.value="",r.value="Hobby has been added!",setTimeout(()=>{r.value=null},5e3)}catch(p){console.error("Error adding hobby:",p)}else try{if(!(await fetch("/api/hobbies/add/",{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":l()},body:JSON.stringify({hobby_id:f})})).ok)throw new Error("Failed to add hobby to user");i(),n.value="",r.value="Hobby has been added!",setTimeout(()=>{r.value=null},5e3)}catch(p){console.error("Error adding hobby:",p)}},u=f=>{window.confirm(`Are you sure you want to delete the hobby "${f.name}"?`)&&c(f.id)},c=async f=>{try{const m=l();if(!(await fetch(`/api/hobbies/${f}/`,{method:"DELETE",headers:{"Content-Type":"application/json","X-CSRFToken":m}})).ok)throw new Error("Failed to delete hobby");e.value=e.value.filter(y=>y.id!==f)}catch(m){console.error("Error deleting hobby:",m)}};return Hi(()=>{i(),o()}),{hobbies:e,allHobbies:t,selectedHobbyId:n,newHobbyName:s,Message:r,addHobby:a,deleteHobby:c,confirmDelete:u}}}),dp={class:"hobbies-list container bg-def2f1 p-4 rounded"},hp={class:"mb-3"},pp=["value"],mp={key:0,class:"alert alert-success mt-3",role:"alert"},gp={key:0,class:"mb-3"},_p=["disabled"],bp={key:1,class:"list-group"},vp=["onClick"],Ep={key:2,class:"text-center text-2b7a78"};function yp(e,t,n,s,r,i){return Et(),Ot("div",dp,[t[7]||(t[7]=M("h1",{class:"text-center text-3aafa9 mb-4"},"Update Hobbies",-1)),t[8]||(t[8]=M("h2",{class:"text-17252A mb-3"},"Add Hobbies",-1)),M("div",hp,[t[5]||(t[5]=M("label",{for:"allHobbies",class:"form-label text-17252A"},null,-1)),Te(M("select",{id:"allHobbies","onUpdate:modelValue":t[0]||(t[0]=o=>e.selectedHobbyId=o),class:"form-select border-2b7a78"},[t[3]||(t[3]=M("option",{value:""},"--Select a hobby--",-1)),(Et(!0),Ot(Gt,null,_o(e.allHobbies,o=>(Et(),Ot("option",{key:o.id,value:o.id},wn(o.name),9,pp))),128)),t[4]||(t[4]=M("option",{value:"other"},"+Add A New Hobby",-1))],512),[[Ya,e.selectedHobbyId]]),e.Message?(Et(),Ot("div",mp,wn(e.Message),1)):er("",!0)]),e.selectedHobbyId==="other"?(Et(),Ot("div",gp,[Te(M("input",{type:"text","onUpdate:modelValue":t[1]||(t[1]=o=>e.newHobbyName=o),placeholder:"Enter your new hobby",class:"form-control border-2b7a78"},null,512),[[ze,e.newHobbyName]])])):er("",!0),M("button",{onClick:t[2]||(t[2]=(...o)=>e.addHobby&&e.addHobby(...o)),class:"btn btn-3aafa9 text-feffff w-100 mb-4",disabled:!e.selectedHobbyId||e.selectedHobbyId==="other"&&!e.newHobbyName},null,8,_p),t[9]||(t[9]=M("h2",{class:"text-17252A mb-3"},"Added Hobbies",-1)),e.hobbies.length>0?(Et(),Ot("ul",bp,[(Et(!0),Ot(Gt,null,_o(e.hobbies,o=>(Et(),Ot("li",{key:o.id,class:"list-group-item d-flex justify-content-between align-items-center bg-def2f1 text-17252A border-2b7a78"},[ns(wn(o.name)+" ",1),M("button",{onClick:l=>e.confirmDelete(o),class:"btn btn-danger btn-sm"},t[6]||(t[6]=[M("i",{class:"bi bi-trash"},null,-1)]),8,vp)]))),128))])):(Et(),Ot("p",Ep," No Hobbies Added "))])}const cc=Es(fp,[["render",yp],["__scopeId","data-v-75d18020"]]);function wp(){const e=document.cookie.match(/csrftoken=([^;]+)/);return e?e[1]:""}const Ap=ln({name:"Profile",components:{UpdatePassword:ac,UserHobbies:cc},setup(){const e=_s({username:"",name:"",email:"",date_of_birth:""}),t=yt(!1),n=()=>{t.value=!1},s=async()=>{try{const i=await fetch("/api/profile",{method:"GET",headers:{"Content-Type":"application/json"}});if(i.ok){const o=await i.json();Object.assign(e,o)}else console.error("Failed to fetch profile data")}catch(i){console.error("Error fetching profile:",i)}},r=async()=>{try{(await fetch("/api/profile",{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":wp()},body:JSON.stringify(e)})).ok?alert("Profile updated successfully"):console.error("Failed to update profile")}catch(i){console.error("Error updating profile:",i)}};return s(),{profile:e,updateProfile:r,showPasswordModal:t,closePasswordModal:n}}}),Tp={class:"container py-5"},Cp={class:"box p-5 rounded-lg shadow-lg"},Sp={class:"mb-4"},Op={class:"mb-4"},Np={class:"mb-4"},$p={class:"mb-4"},Pp={class:"mt-4 d-flex justify-content-center gap-3"},xp={class:"mt-5"};function Dp(e,t,n,s,r,i){const o=Js("user-hobbies"),l=Js("update-password");return Et(),Ot("div",Tp,[M("div",Cp,[M("form",{onSubmit:t[4]||(t[4]=di((...a)=>e.updateProfile&&e.updateProfile(...a),["prevent"]))},[M("div",Sp,[t[8]||(t[8]=M("label",{for:"username",class:"form-label fw-bold text-main"},"Username:",-1)),Te(M("input",{id:"username",type:"text",class:"form-control","onUpdate:modelValue":t[0]||(t[0]=a=>e.profile.username=a),disabled:!1},null,512),[[ze,e.profile.username]])]),M("div",Op,[t[9]||(t[9]=M("label",{for:"name",class:"form-label fw-bold text-main"},"Name:",-1)),Te(M("input",{id:"name",type:"text",class:"form-control","onUpdate:modelValue":t[1]||(t[1]=a=>e.profile.name=a)},null,512),[[ze,e.profile.name]])]),M("div",Np,[t[10]||(t[10]=M("label",{for:"email",class:"form-label fw-bold text-main"},"Email:",-1)),Te(M("input",{id:"email",type:"email",class:"form-control","onUpdate:modelValue":t[2]||(t[2]=a=>e.profile.email=a)},null,512),[[ze,e.profile.email]])]),M("div",$p,[t[11]||(t[11]=M("label",{for:"date_of_birth",class:"form-label fw-bold text-main"},"Date of Birth:",-1)),Te(M("input",{id:"date_of_birth",type:"date",class:"form-control","onUpdate:modelValue":t[3]||(t[3]=a=>e.profile.date_of_birth=a)},null,512),[[ze,e.profile.date_of_birth]])]),t[12]||(t[12]=M("div",{class:"text-center"},[M("button",{type:"submit",class:"btn btn-info text-white fw-bold"},"Update Profile")],-1))],32),M("div",Pp,[M("button",{onClick:t[5]||(t[5]=a=>e.showPasswordModal=!0),class:"btn btn-outline-danger fw-bold"},"Change Password")])]),M("div",xp,[ht(o)]),e.showPasswordModal?(Et(),Ot("div",{key:0,class:"modal-overlay",onClick:t[7]||(t[7]=(...a)=>e.closePasswordModal&&e.closePasswordModal(...a))},[M("div",{class:"modal-content",onClick:t[6]||(t[6]=di(()=>{},["stop"]))},[ht(l,{onClose:e.closePasswordModal},null,8,["onClose"])])])):er("",!0)])}const Rp=Es(Ap,[["render",Dp],["__scopeId","data-v-b75ea460"]]);let Ip="";const Lp=Mh({history:hh(Ip),routes:[{path:"/dashboard",name:"Dashboard",component:zh},{path:"/profile/",name:"profile",component:Rp},{path:"/updatepassword/",name:"Update Password",component:ac},{path:"/profile/",name:"Hobbies",component:cc}]});var $t="top",Ut="bottom",Yt="right",Pt="left",br="auto",Vn=[$t,Ut,Yt,Pt],sn="start",xn="end",uc="clippingParents",Ki="viewport",mn="popper",fc="reference",gi=Vn.reduce(function(e,t){return e.concat([t+"-"+sn,t+"-"+xn])},[]),Ui=[].concat(Vn,[br]).reduce(function(e,t){return e.concat([t,t+"-"+sn,t+"-"+xn])},[]),dc="beforeRead",hc="read",pc="afterRead",mc="beforeMain",gc="main",_c="afterMain",bc="beforeWrite",vc="write",Ec="afterWrite",yc=[dc,hc,pc,mc,gc,_c,bc,vc,Ec];function _e(e){return e?(e.nodeName||"").toLowerCase():null}function qt(e){if(e==null)return window;if(e.toString()!=="[object Window]"){var t=e.ownerDocument;return t&&t.defaultView||window}return e}function rn(e){var t=qt(e).Element;return e instanceof t||e instanceof Element}function Qt(e){var t=qt(e).HTMLElement;return e instanceof t||e instanceof HTMLElement}function Yi(e){if(typeof ShadowRoot>"u")return!1;var t=qt(e).ShadowRoot;return e instanceof t||e instanceof ShadowRoot}function Mp(e){var t=e.state;Object.keys(t.elements).forEach(function(n){var s=t.styles[n]||{},r=t.attributes[n]||{},i=t.elements[n];!Qt(i)||!_e(i)||(Object.assign(i.style,s),Object.keys(r).forEach(function(o){var l=r[o];l===!1?i.removeAttribute(o):i.setAttribute(o,l===!0?"":l)}))})}function kp(e){var t=e.state,n={popper:{position:t.options.strategy,left:"0",top:"0",margin:"0"},arrow:{position:"absolute"},reference:{}};return Object.assign(t.elements.popper.style,n.popper),t.styles=n,t.elements.arrow&&Object.assign(t.elements.arrow.style,n.arrow),function(){Object.keys(t.elements).forEach(function(s){var r=t.elements[s],i=t.attributes[s]||{},o=Object.keys(t.styles.hasOwnProperty(s)?t.styles[s]:n[s]),l=o.reduce(function(a,u){return a[u]="",a},{});!Qt(r)||!_e(r)||(Object.assign(r.style,l),Object.keys(i).forEach(function(a){r.removeAttribute(a)}))})}}const qi={name:"applyStyles",enabled:!0,phase:"write",fn:Mp,effect:kp,requires:["computeStyles"]};function he(e){return e.split("-")[0]}var Ze=Math.max,sr=Math.min,Dn=Math.round;function _i(){var e=navigator.userAgentData;return e!=null&&e.brands&&Array.isArray(e.brands)?e.brands.map(function(t){return t.brand+"/"+t.version}).join(" "):navigator.userAgent}function wc(){return!/^((?!chrome|android).)*safari/i.test(_i())}function Rn(e,t,n){t===void 0&&(t=!1),n===void 0&&(n=!1);var s=e.getBoundingClientRect(),r=1,i=1;t&&Qt(e)&&(r=e.offsetWidth>0&&Dn(s.width)/e.offsetWidth||1,i=e.offsetHeight>0&&Dn(s.height)/e.offsetHeight||1);var o=rn(e)?qt(e):window,l=o.visualViewport,a=!wc()&&n,u=(s.left+(a&&l?l.offsetLeft:0))/r,c=(s.top+(a&&l?l.offsetTop:0))/i,f=s.width/r,m=s.height/i;return{width:f,height:m,top:c,right:u+f,bottom:c+m,left:u,x:u,y:c}}function Gi(e){var t=Rn(e),n=e.offsetWidth,s=e.offsetHeight;return Math.abs(t.width-n)<=1&&(n=t.width),Math.abs(t.height-s)<=1&&(s=t.height),{x:e.offsetLeft,y:e.offsetTop,width:n,height:s}}function Ac(e,t){var n=t.getRootNode&&t.getRootNode();if(e.contains(t))return!0;if(n&&Yi(n)){var s=t;do{if(s&&e.isSameNode(s))return!0;s=s.parentNode||s.host}while(s)}return!1}function Ne(e){return qt(e).getComputedStyle(e)}function Hp(e){return["table","td","th"].indexOf(_e(e))>=0}function Be(e){return((rn(e)?e.ownerDocument:e.document)||window.document).documentElement}function vr(e){return _e(e)==="html"?e:e.assignedSlot||e.parentNode||(Yi(e)?e.host:null)||Be(e)}function ll(e){return!Qt(e)||Ne(e).position==="fixed"?null:e.offsetParent}function Vp(e){var t=/firefox/i.test(_i()),n=/Trident/i.test(_i());if(n&&Qt(e)){var s=Ne(e);if(s.position==="fixed")return null}var r=vr(e);for(Yi(r)&&(r=r.host);Qt(r)&&["html","body"].indexOf(_e(r))<0;){var i=Ne(r);if(i.transform!=="none"||i.perspective!=="none"||i.contain==="paint"||["transform","perspective"].indexOf(i.willChange)!==-1||t&&i.willChange==="filter"||t&&i.filter&&i.filter!=="none")return r;r=r.parentNode}return null}function ys(e){for(var t=qt(e),n=ll(e);n&&Hp(n)&&Ne(n).position==="static";)n=ll(n);return n&&(_e(n)==="html"||_e(n)==="body"&&Ne(n).position==="static")?t:n||Vp(e)||t}function zi(e){return["top","bottom"].indexOf(e)>=0?"x":"y"}function is(e,t,n){return Ze(e,sr(t,n))}function Fp(e,t,n){var s=is(e,t,n);return s>n?n:s}function Tc(){return{top:0,right:0,bottom:0,left:0}}function Cc(e){return Object.assign({},Tc(),e)}function Sc(e,t){return t.reduce(function(n,s){return n[s]=e,n},{})}var jp=function(t,n){return t=typeof t=="function"?t(Object.assign({},n.rects,{placement:n.placement})):t,Cc(typeof t!="number"?t:Sc(t,Vn))};function Wp(e){var t,n=e.state,s=e.name,r=e.options,i=n.elements.arrow,o=n.modifiersData.popperOffsets,l=he(n.placement),a=zi(l),u=[Pt,Yt].indexOf(l)>=0,c=u?"height":"width";if(!(!i||!o)){var f=jp(r.padding,n),m=Gi(i),p=a==="y"?$t:Pt,y=a==="y"?Ut:Yt,v=n.rects.reference[c]+n.rects.reference[a]-o[a]-n.rects.popper[c],x=o[a]-n.rects.reference[a],S=ys(i),$=S?a==="y"?S.clientHeight||0:S.clientWidth||0:0,L=v/2-x/2,C=f[p],V=$-m[c]-f[y],K=$/2-m[c]/2+L,U=is(C,K,V),rt=a;n.modifiersData[s]=(t={},t[rt]=U,t.centerOffset=U-K,t)}}function Bp(e){var t=e.state,n=e.options,s=n.element,r=s===void 0?"[data-popper-arrow]":s;r!=null&&(typeof r=="string"&&(r=t.elements.popper.querySelector(r),!r)||Ac(t.elements.popper,r)&&(t.elements.arrow=r))}const Oc={name:"arrow",enabled:!0,phase:"main",fn:Wp,effect:Bp,requires:["popperOffsets"],requiresIfExists:["preventOverflow"]};function In(e){return e.split("-")[1]}var Kp={top:"auto",right:"auto",bottom:"auto",left:"auto"};function Up(e,t){var n=e.x,s=e.y,r=t.devicePixelRatio||1;return{x:Dn(n*r)/r||0,y:Dn(s*r)/r||0}}function al(e){var t,n=e.popper,s=e.popperRect,r=e.placement,i=e.variation,o=e.offsets,l=e.position,a=e.gpuAcceleration,u=e.adaptive,c=e.roundOffsets,f=e.isFixed,m=o.x,p=m===void 0?0:m,y=o.y,v=y===void 0?0:y,x=typeof c=="function"?c({x:p,y:v}):{x:p,y:v};p=x.x,v=x.y;var S=o.hasOwnProperty("x"),$=o.hasOwnProperty("y"),L=Pt,C=$t,V=window;if(u){var K=ys(n),U="clientHeight",rt="clientWidth";if(K===qt(n)&&(K=Be(n),Ne(K).position!=="static"&&l==="absolute"&&(U="scrollHeight",rt="scrollWidth")),K=K,r===$t||(r===Pt||r===Yt)&&i===xn){C=Ut;var it=f&&K===V&&V.visualViewport?V.visualViewport.height:K[U];v-=it-s.height,v*=a?1:-1}if(r===Pt||(r===$t||r===Ut)&&i===xn){L=Yt;var J=f&&K===V&&V.visualViewport?V.visualViewport.width:K[rt];p-=J-s.width,p*=a?1:-1}}var ut=Object.assign({position:l},u&&Kp),mt=c===!0?Up({x:p,y:v},qt(n)):{x:p,y:v};if(p=mt.x,v=mt.y,a){var lt;return Object.assign({},ut,(lt={},lt[C]=$?"0":"",lt[L]=S?"0":"",lt.transform=(V.devicePixelRatio||1)<=1?"translate("+p+"px, "+v+"px)":"translate3d("+p+"px, "+v+"px, 0)",lt))}return Object.assign({},ut,(t={},t[C]=$?v+"px":"",t[L]=S?p+"px":"",t.transform="",t))}function Yp(e){var t=e.state,n=e.options,s=n.gpuAcceleration,r=s===void 0?!0:s,i=n.adaptive,o=i===void 0?!0:i,l=n.roundOffsets,a=l===void 0?!0:l,u={placement:he(t.placement),variation:In(t.placement),popper:t.elements.popper,popperRect:t.rects.popper,gpuAcceleration:r,isFixed:t.options.strategy==="fixed"};t.modifiersData.popperOffsets!=null&&(t.styles.popper=Object.assign({},t.styles.popper,al(Object.assign({},u,{offsets:t.modifiersData.popperOffsets,position:t.options.strategy,adaptive:o,roundOffsets:a})))),t.modifiersData.arrow!=null&&(t.styles.arrow=Object.assign({},t.styles.arrow,al(Object.assign({},u,{offsets:t.modifiersData.arrow,position:"absolute",adaptive:!1,roundOffsets:a})))),t.attributes.popper=Object.assign({},t.attributes.popper,{"data-popper-placement":t.placement})}const Xi={name:"computeStyles",enabled:!0,phase:"beforeWrite",fn:Yp,data:{}};var Ps={passive:!0};function qp(e){var t=e.state,n=e.instance,s=e.options,r=s.scroll,i=r===void 0?!0:r,o=s.resize,l=o===void 0?!0:o,a=qt(t.elements.popper),u=[].concat(t.scrollParents.reference,t.scrollParents.popper);return i&&u.forEach(function(c){c.addEventListener("scroll",n.update,Ps)}),l&&a.addEventListener("resize",n.update,Ps),function(){i&&u.forEach(function(c){c.removeEventListener("scroll",n.update,Ps)}),l&&a.removeEventListener("resize",n.update,Ps)}}const Qi={name:"eventListeners",enabled:!0,phase:"write",fn:function(){},effect:qp,data:{}};var Gp={left:"right",right:"left",bottom:"top",top:"bottom"};function Ks(e){return e.replace(/left|right|bottom|top/g,function(t){return Gp[t]})}var zp={start:"end",end:"start"};function cl(e){return e.replace(/start|end/g,function(t){return zp[t]})}function Ji(e){var t=qt(e),n=t.pageXOffset,s=t.pageYOffset;return{scrollLeft:n,scrollTop:s}}function Zi(e){return Rn(Be(e)).left+Ji(e).scrollLeft}function Xp(e,t){var n=qt(e),s=Be(e),r=n.visualViewport,i=s.clientWidth,o=s.clientHeight,l=0,a=0;if(r){i=r.width,o=r.height;var u=wc();(u||!u&&t==="fixed")&&(l=r.offsetLeft,a=r.offsetTop)}return{width:i,height:o,x:l+Zi(e),y:a}}function Qp(e){var t,n=Be(e),s=Ji(e),r=(t=e.ownerDocument)==null?void 0:t.body,i=Ze(n.scrollWidth,n.clientWidth,r?r.scrollWidth:0,r?r.clientWidth:0),o=Ze(n.scrollHeight,n.clientHeight,r?r.scrollHeight:0,r?r.clientHeight:0),l=-s.scrollLeft+Zi(e),a=-s.scrollTop;return Ne(r||n).direction==="rtl"&&(l+=Ze(n.clientWidth,r?r.clientWidth:0)-i),{width:i,height:o,x:l,y:a}}function to(e){var t=Ne(e),n=t.overflow,s=t.overflowX,r=t.overflowY;return/auto|scroll|overlay|hidden/.test(n+r+s)}function Nc(e){return["html","body","#document"].indexOf(_e(e))>=0?e.ownerDocument.body:Qt(e)&&to(e)?e:Nc(vr(e))}function os(e,t){var n;t===void 0&&(t=[]);var s=Nc(e),r=s===((n=e.ownerDocument)==null?void 0:n.body),i=qt(s),o=r?[i].concat(i.visualViewport||[],to(s)?s:[]):s,l=t.concat(o);return r?l:l.concat(os(vr(o)))}function bi(e){return Object.assign({},e,{left:e.x,top:e.y,right:e.x+e.width,bottom:e.y+e.height})}function Jp(e,t){var n=Rn(e,!1,t==="fixed");return n.top=n.top+e.clientTop,n.left=n.left+e.clientLeft,n.bottom=n.top+e.clientHeight,n.right=n.left+e.clientWidth,n.width=e.clientWidth,n.height=e.clientHeight,n.x=n.left,n.y=n.top,n}function ul(e,t,n){return t===Ki?bi(Xp(e,n)):rn(t)?Jp(t,n):bi(Qp(Be(e)))}function Zp(e){var t=os(vr(e)),n=["absolute","fixed"].indexOf(Ne(e).position)>=0,s=n&&Qt(e)?ys(e):e;return rn(s)?t.filter(function(r){return rn(r)&&Ac(r,s)&&_e(r)!=="body"}):[]}function tm(e,t,n,s){var r=t==="clippingParents"?Zp(e):[].concat(t),i=[].concat(r,[n]),o=i[0],l=i.reduce(function(a,u){var c=ul(e,u,s);return a.top=Ze(c.top,a.top),a.right=sr(c.right,a.right),a.bottom=sr(c.bottom,a.bottom),a.left=Ze(c.left,a.left),a},ul(e,o,s));return l.width=l.right-l.left,l.height=l.bottom-l.top,l.x=l.left,l.y=l.top,l}function $c(e){var t=e.reference,n=e.element,s=e.placement,r=s?he(s):null,i=s?In(s):null,o=t.x+t.width/2-n.width/2,l=t.y+t.height/2-n.height/2,a;switch(r){case $t:a={x:o,y:t.y-n.height};break;case Ut:a={x:o,y:t.y+t.height};break;case Yt:a={x:t.x+t.width,y:l};break;case Pt:a={x:t.x-n.width,y:l};break;default:a={x:t.x,y:t.y}}var u=r?zi(r):null;if(u!=null){var c=u==="y"?"height":"width";switch(i){case sn:a[u]=a[u]-(t[c]/2-n[c]/2);break;case xn:a[u]=a[u]+(t[c]/2-n[c]/2);break}}return a}function Ln(e,t){t===void 0&&(t={});var n=t,s=n.placement,r=s===void 0?e.placement:s,i=n.strategy,o=i===void 0?e.strategy:i,l=n.boundary,a=l===void 0?uc:l,u=n.rootBoundary,c=u===void 0?Ki:u,f=n.elementContext,m=f===void 0?mn:f,p=n.altBoundary,y=p===void 0?!1:p,v=n.padding,x=v===void 0?0:v,S=Cc(typeof x!="number"?x:Sc(x,Vn)),$=m===mn?fc:mn,L=e.rects.popper,C=e.elements[y?$:m],V=tm(rn(C)?C:C.contextElement||Be(e.elements.popper),a,c,o),K=Rn(e.elements.reference),U=$c({reference:K,element:L,strategy:"absolute",placement:r}),rt=bi(Object.assign({},L,U)),it=m===mn?rt:K,J={top:V.top-it.top+S.top,bottom:it.bottom-V.bottom+S.bottom,left:V.left-it.left+S.left,right:it.right-V.right+S.right},ut=e.modifiersData.offset;if(m===mn&&ut){var mt=ut[r];Object.keys(J).forEach(function(lt){var It=[Yt,Ut].indexOf(lt)>=0?1:-1,xt=[$t,Ut].indexOf(lt)>=0?"y":"x";J[lt]+=mt[xt]*It})}return J}function em(e,t){t===void 0&&(t={});var n=t,s=n.placement,r=n.boundary,i=n.rootBoundary,o=n.padding,l=n.flipVariations,a=n.allowedAutoPlacements,u=a===void 0?Ui:a,c=In(s),f=c?l?gi:gi.filter(function(y){return In(y)===c}):Vn,m=f.filter(function(y){return u.indexOf(y)>=0});m.length===0&&(m=f);var p=m.reduce(function(y,v){return y[v]=Ln(e,{placement:v,boundary:r,rootBoundary:i,padding:o})[he(v)],y},{});return Object.keys(p).sort(function(y,v){return p[y]-p[v]})}function nm(e){if(he(e)===br)return[];var t=Ks(e);return[cl(e),t,cl(t)]}function sm(e){var t=e.state,n=e.options,s=e.name;if(!t.modifiersData[s]._skip){for(var r=n.mainAxis,i=r===void 0?!0:r,o=n.altAxis,l=o===void 0?!0:o,a=n.fallbackPlacements,u=n.padding,c=n.boundary,f=n.rootBoundary,m=n.altBoundary,p=n.flipVariations,y=p===void 0?!0:p,v=n.allowedAutoPlacements,x=t.options.placement,S=he(x),$=S===x,L=a||($||!y?[Ks(x)]:nm(x)),C=[x].concat(L).reduce(function(Mt,kt){return Mt.concat(he(kt)===br?em(t,{placement:kt,boundary:c,rootBoundary:f,padding:u,flipVariations:y,allowedAutoPlacements:v}):kt)},[]),V=t.rects.reference,K=t.rects.popper,U=new Map,rt=!0,it=C[0],J=0;J<C.length;J++){var ut=C[J],mt=he(ut),lt=In(ut)===sn,It=[$t,Ut].indexOf(mt)>=0,xt=It?"width":"height",Q=Ln(t,{placement:ut,boundary:c,rootBoundary:f,altBoundary:m,padding:u}),q=It?lt?Yt:Pt:lt?Ut:$t;V[xt]>K[xt]&&(q=Ks(q));var z=Ks(q),bt=[];if(i&&bt.push(Q[mt]<=0),l&&bt.push(Q[q]<=0,Q[z]<=0),bt.every(function(Mt){return Mt})){it=ut,rt=!1;break}U.set(ut,bt)}if(rt)for(var Lt=y?3:1,Dt=function(kt){var gt=C.find(function(b){var R=U.get(b);if(R)return R.slice(0,kt).every(function(P){return P})});if(gt)return it=gt,"break"},dt=Lt;dt>0;dt--){var ne=Dt(dt);if(ne==="break")break}t.placement!==it&&(t.modifiersData[s]._skip=!0,t.placement=it,t.reset=!0)}}const Pc={name:"flip",enabled:!0,phase:"main",fn:sm,requiresIfExists:["offset"],data:{_skip:!1}};function fl(e,t,n){return n===void 0&&(n={x:0,y:0}),{top:e.top-t.height-n.y,right:e.right-t.width+n.x,bottom:e.bottom-t.height+n.y,left:e.left-t.width-n.x}}function dl(e){return[$t,Yt,Ut,Pt].some(function(t){return e[t]>=0})}function rm(e){var t=e.state,n=e.name,s=t.rects.reference,r=t.rects.popper,i=t.modifiersData.preventOverflow,o=Ln(t,{elementContext:"reference"}),l=Ln(t,{altBoundary:!0}),a=fl(o,s),u=fl(l,r,i),c=dl(a),f=dl(u);t.modifiersData[n]={referenceClippingOffsets:a,popperEscapeOffsets:u,isReferenceHidden:c,hasPopperEscaped:f},t.attributes.popper=Object.assign({},t.attributes.popper,{"data-popper-reference-hidden":c,"data-popper-escaped":f})}const xc={name:"hide",enabled:!0,phase:"main",requiresIfExists:["preventOverflow"],fn:rm};function im(e,t,n){var s=he(e),r=[Pt,$t].indexOf(s)>=0?-1:1,i=typeof n=="function"?n(Object.assign({},t,{placement:e})):n,o=i[0],l=i[1];return o=o||0,l=(l||0)*r,[Pt,Yt].indexOf(s)>=0?{x:l,y:o}:{x:o,y:l}}function om(e){var t=e.state,n=e.options,s=e.name,r=n.offset,i=r===void 0?[0,0]:r,o=Ui.reduce(function(c,f){return c[f]=im(f,t.rects,i),c},{}),l=o[t.placement],a=l.x,u=l.y;t.modifiersData.popperOffsets!=null&&(t.modifiersData.popperOffsets.x+=a,t.modifiersData.popperOffsets.y+=u),t.modifiersData[s]=o}const Dc={name:"offset",enabled:!0,phase:"main",requires:["popperOffsets"],fn:om};function lm(e){var t=e.state,n=e.name;t.modifiersData[n]=$c({reference:t.rects.reference,element:t.rects.popper,strategy:"absolute",placement:t.placement})}const eo={name:"popperOffsets",enabled:!0,phase:"read",fn:lm,data:{}};function am(e){return e==="x"?"y":"x"}function cm(e){var t=e.state,n=e.options,s=e.name,r=n.mainAxis,i=r===void 0?!0:r,o=n.altAxis,l=o===void 0?!1:o,a=n.boundary,u=n.rootBoundary,c=n.altBoundary,f=n.padding,m=n.tether,p=m===void 0?!0:m,y=n.tetherOffset,v=y===void 0?0:y,x=Ln(t,{boundary:a,rootBoundary:u,padding:f,altBoundary:c}),S=he(t.placement),$=In(t.placement),L=!$,C=zi(S),V=am(C),K=t.modifiersData.popperOffsets,U=t.rects.reference,rt=t.rects.popper,it=typeof v=="function"?v(Object.assign({},t.rects,{placement:t.placement})):v,J=typeof it=="number"?{mainAxis:it,altAxis:it}:Object.assign({mainAxis:0,altAxis:0},it),ut=t.modifiersData.offset?t.modifiersData.offset[t.placement]:null,mt={x:0,y:0};if(K){if(i){var lt,It=C==="y"?$t:Pt,xt=C==="y"?Ut:Yt,Q=C==="y"?"height":"width",q=K[C],z=q+x[It],bt=q-x[xt],Lt=p?-rt[Q]/2:0,Dt=$===sn?U[Q]:rt[Q],dt=$===sn?-rt[Q]:-U[Q],ne=t.elements.arrow,Mt=p&&ne?Gi(ne):{width:0,height:0},kt=t.modifiersData["arrow#persistent"]?t.modifiersData["arrow#persistent"].padding:Tc(),gt=kt[It],b=kt[xt],R=is(0,U[Q],Mt[Q]),P=L?U[Q]/2-Lt-R-gt-J.mainAxis:Dt-R-gt-J.mainAxis,k=L?-U[Q]/2+Lt+R+b+J.mainAxis:dt+R+b+J.mainAxis,X=t.elements.arrow&&ys(t.elements.arrow),ft=X?C==="y"?X.clientTop||0:X.clientLeft||0:0,d=(lt=ut==null?void 0:ut[C])!=null?lt:0,h=q+P-d-ft,g=q+k-d,E=is(p?sr(z,h):z,q,p?Ze(bt,g):bt);K[C]=E,mt[C]=E-q}if(l){var _,A=C==="x"?$t:Pt,D=C==="x"?Ut:Yt,O=K[V],N=V==="y"?"height":"width",T=O+x[A],j=O-x[D],I=[$t,Pt].indexOf(S)!==-1,H=(_=ut==null?void 0:ut[V])!=null?_:0,B=I?T:O-U[N]-rt[N]-H+J.altAxis,G=I?O+U[N]+rt[N]-H-J.altAxis:j,et=p&&I?Fp(B,O,G):is(p?B:T,O,p?G:j);K[V]=et,mt[V]=et-O}t.modifiersData[s]=mt}}const Rc={name:"preventOverflow",enabled:!0,phase:"main",fn:cm,requiresIfExists:["offset"]};function um(e){return{scrollLeft:e.scrollLeft,scrollTop:e.scrollTop}}function fm(e){return e===qt(e)||!Qt(e)?Ji(e):um(e)}function dm(e){var t=e.getBoundingClientRect(),n=Dn(t.width)/e.offsetWidth||1,s=Dn(t.height)/e.offsetHeight||1;return n!==1||s!==1}function hm(e,t,n){n===void 0&&(n=!1);var s=Qt(t),r=Qt(t)&&dm(t),i=Be(t),o=Rn(e,r,n),l={scrollLeft:0,scrollTop:0},a={x:0,y:0};return(s||!s&&!n)&&((_e(t)!=="body"||to(i))&&(l=fm(t)),Qt(t)?(a=Rn(t,!0),a.x+=t.clientLeft,a.y+=t.clientTop):i&&(a.x=Zi(i))),{x:o.left+l.scrollLeft-a.x,y:o.top+l.scrollTop-a.y,width:o.width,height:o.height}}function pm(e){var t=new Map,n=new Set,s=[];e.forEach(function(i){t.set(i.name,i)});function r(i){n.add(i.name);var o=[].concat(i.requires||[],i.requiresIfExists||[]);o.forEach(function(l){if(!n.has(l)){var a=t.get(l);a&&r(a)}}),s.push(i)}return e.forEach(function(i){n.has(i.name)||r(i)}),s}function mm(e){var t=pm(e);return yc.reduce(function(n,s){return n.concat(t.filter(function(r){return r.phase===s}))},[])}function gm(e){var t;return function(){return t||(t=new Promise(function(n){Promise.resolve().then(function(){t=void 0,n(e())})})),t}}function _m(e){var t=e.reduce(function(n,s){var r=n[s.name];return n[s.name]=r?Object.assign({},r,s,{options:Object.assign({},r.options,s.options),data:Object.assign({},r.data,s.data)}):s,n},{});return Object.keys(t).map(function(n){return t[n]})}var hl={placement:"bottom",modifiers:[],strategy:"absolute"};function pl(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return!t.some(function(s){return!(s&&typeof s.getBoundingClientRect=="function")})}function Er(e){e===void 0&&(e={});var t=e,n=t.defaultModifiers,s=n===void 0?[]:n,r=t.defaultOptions,i=r===void 0?hl:r;return function(l,a,u){u===void 0&&(u=i);var c={placement:"bottom",orderedModifiers:[],options:Object.assign({},hl,i),modifiersData:{},elements:{reference:l,popper:a},attributes:{},styles:{}},f=[],m=!1,p={state:c,setOptions:function(S){var $=typeof S=="function"?S(c.options):S;v(),c.options=Object.assign({},i,c.options,$),c.scrollParents={reference:rn(l)?os(l):l.contextElement?os(l.contextElement):[],popper:os(a)};var L=mm(_m([].concat(s,c.options.modifiers)));return c.orderedModifiers=L.filter(function(C){return C.enabled}),y(),p.update()},forceUpdate:function(){if(!m){var S=c.elements,$=S.reference,L=S.popper;if(pl($,L)){c.rects={reference:hm($,ys(L),c.options.strategy==="fixed"),popper:Gi(L)},c.reset=!1,c.placement=c.options.placement,c.orderedModifiers.forEach(function(J){return c.modifiersData[J.name]=Object.assign({},J.data)});for(var C=0;C<c.orderedModifiers.length;C++){if(c.reset===!0){c.reset=!1,C=-1;continue}var V=c.orderedModifiers[C],K=V.fn,U=V.options,rt=U===void 0?{}:U,it=V.name;typeof K=="function"&&(c=K({state:c,options:rt,name:it,instance:p})||c)}}}},update:gm(function(){return new Promise(function(x){p.forceUpdate(),x(c)})}),destroy:function(){v(),m=!0}};if(!pl(l,a))return p;p.setOptions(u).then(function(x){!m&&u.onFirstUpdate&&u.onFirstUpdate(x)});function y(){c.orderedModifiers.forEach(function(x){var S=x.name,$=x.options,L=$===void 0?{}:$,C=x.effect;if(typeof C=="function"){var V=C({state:c,name:S,instance:p,options:L}),K=function(){};f.push(V||K)}})}function v(){f.forEach(function(x){return x()}),f=[]}return p}}var bm=Er(),vm=[Qi,eo,Xi,qi],Em=Er({defaultModifiers:vm}),ym=[Qi,eo,Xi,qi,Dc,Pc,Rc,Oc,xc],no=Er({defaultModifiers:ym});const Ic=Object.freeze(Object.defineProperty({__proto__:null,afterMain:_c,afterRead:pc,afterWrite:Ec,applyStyles:qi,arrow:Oc,auto:br,basePlacements:Vn,beforeMain:mc,beforeRead:dc,beforeWrite:bc,bottom:Ut,clippingParents:uc,computeStyles:Xi,createPopper:no,createPopperBase:bm,createPopperLite:Em,detectOverflow:Ln,end:xn,eventListeners:Qi,flip:Pc,hide:xc,left:Pt,main:gc,modifierPhases:yc,offset:Dc,placements:Ui,popper:mn,popperGenerator:Er,popperOffsets:eo,preventOverflow:Rc,read:hc,reference:fc,right:Yt,start:sn,top:$t,variationPlacements:gi,viewport:Ki,write:vc},Symbol.toStringTag,{value:"Module"}));/*!
   * Bootstrap v5.3.3 (https://getbootstrap.com/)
   * Copyright 2011-2024 The Bootstrap Authors (https://github.com/twbs/bootstrap/graphs/contributors)
   * Licensed under MIT (https://github.com/twbs/bootstrap/blob/main/LICENSE)
@@ -0,0 +1,34 @@
+"""
+Deferred work, run by ``python manage.py run_tasks``. See api.queue.
+"""
+from typing import Optional
+
+from django.core.mail import send_mail
+
+from . import matching, popularity
+from .queue import task
+
+
+@task(unique=True)
+def refresh_overlaps(*user_ids: int) -> None:
+    matching.refresh_overlaps(user_ids)
+
+
+@task(unique=True)
+def update_overlaps(user_id: int, hobby_ids: list[int]) -> None:
+    matching.update_overlaps(user_id, hobby_ids)
+
+
+@task(unique=True, concurrency=1)
+def rebuild_overlaps(batch_size: int = 1000) -> None:
+    matching.rebuild_overlaps(batch_size=batch_size)
+
+
+@task(unique=True, concurrency=1)
+def reconcile_hobby_counts(batch_size: int = 1000) -> None:
+    popularity.reconcile_user_counts(batch_size=batch_size)
+
+
+@task(queue='email', max_attempts=5, retry_delay=30.0, concurrency=2)
+def send_email(subject: str, message: str, recipients: list[str], from_email: Optional[str] = None) -> None:
+    send_mail(subject, message, from_email, recipients)
@@ -1,3 +1,1061 @@
-from django.test import TestCase
+import asyncio
+import importlib
+import json
+import os
+import random
+import re
+import threading
+import time
+import warnings
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Optional
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, identify_hasher, make_password
+
+from django.contrib.sessions.models import Session
+from django.core.cache import cache, caches
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F, Q, Sum
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from project import database
+from project.replicas import PIN_COOKIE, replica_pinning_middleware
+
+from . import counters, events
+from .benchmark import TestClientTarget, run_scenario, summarize
+from .bulk import import_users
+from .cache import catalogue_version, user_key
+from .checks import check_password_hashers
+from .filters import age_on, years_before
+from .hashers import at_least_default
+from .matching import UserHobby, asimilar_users, rebuild_overlaps, similar_users
+from .models import CatalogueVersion, CustomUser, Hobby, HobbyOverlap, PageView, Task
+from .pagination import encode_cursor
+from .popularity import reconcile_user_counts
+from .queue import Worker, task
+from .search import search_hobbies
+from .spa import StaticFilesMiddleware
+
+
+class SessionTests(TestCase):
+    def setUp(self) -> None:
+        self.user = CustomUser.objects.create_user(username='alice', email='alice@example.com', password='x')
+        self.client.force_login(self.user)
+
+    def test_session_deleted_by_another_worker_logs_out(self) -> None:
+        self.assertEqual(self.client.get('/api/profile/').status_code, 200)
+        # What a logout handled by another process leaves behind
+        Session.objects.all().delete()
+        self.assertEqual(self.client.get('/api/profile/').status_code, 302)
+
+    def test_deactivation_is_seen_at_once(self) -> None:
+        self.assertEqual(self.client.get('/api/profile/').status_code, 200)
+        CustomUser.objects.filter(id=self.user.id).update(is_active=False)
+        self.assertEqual(self.client.get('/api/profile/').status_code, 302)
+
+
+@override_settings(AUTH_USER_CACHE=True)
+class UserCacheTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = CustomUser.objects.create_user(username='dave', email='dave@example.com')
+        self.chess = Hobby.objects.create(name='Chess')
+        self.user.hobbies.add(self.chess)
+        self.client.force_login(self.user)
+
+    def hobbies(self) -> list[str]:
+        return [hobby['name'] for hobby in self.client.get('/api/hobbies/').json()]
+
+    def test_hobbies_cached_per_user(self) -> None:
+        self.assertEqual(self.hobbies(), ['Chess'])
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.hobbies(), ['Chess'])
+        self.assertFalse([query for query in queries if 'api_customuser_hobbies' in query['sql']])
+        self.assertFalse([query for query in queries if 'api_catalogueversion' in query['sql']])
+
+    def test_hobby_changes_invalidate(self) -> None:
+        self.assertEqual(self.hobbies(), ['Chess'])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.hobbies.add(Hobby.objects.create(name='Go'))
+        self.assertEqual(self.hobbies(), ['Chess', 'Go'])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.chess.name = 'Xiangqi'
+            self.chess.save()
+        self.assertEqual(self.hobbies(), ['Xiangqi', 'Go'])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.chess.delete()
+        self.assertEqual(self.hobbies(), ['Go'])
+
+    def test_profile_update_keeps_other_fields(self) -> None:
+        self.client.get('/api/profile/')
+        # Not seen by the cached user, as when made by another worker
+        CustomUser.objects.filter(id=self.user.id).update(is_staff=True)
+        response = self.client.post(
+            '/api/profile/', {'name': 'Dave', 'email': 'dave@example.com', 'date_of_birth': '1990-01-01'},
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 200)
+        user = CustomUser.objects.get(id=self.user.id)
+        self.assertEqual((user.name, user.is_staff), ('Dave', True))
+
+
+@override_settings(ROOT_URLCONF='project.urls_async')
+class AsyncRequestTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = CustomUser.objects.create_user(username='carol', email='carol@example.com')
+        self.user.hobbies.add(Hobby.objects.create(name='Chess'))
+
+    async def test_static_files_middleware_stays_async(self) -> None:
+        async def view(request: HttpRequest) -> HttpResponse:
+            return HttpResponse('view')
+
+        middleware = StaticFilesMiddleware(view)
+        self.assertTrue(iscoroutinefunction(middleware))
+        response = await middleware(RequestFactory().get('/api/profile/'))
+        self.assertEqual(response.content, b'view')
+
+    async def test_requests(self) -> None:
+        for user_cache in (False, True):
+            with self.subTest(user_cache=user_cache), self.settings(AUTH_USER_CACHE=user_cache):
+                await self.async_client.aforce_login(self.user)
+                for _ in range(2):
+                    response = await self.async_client.get('/api/profile/')
+                    self.assertEqual(response.status_code, 200)
+                    self.assertEqual(response.json()['username'], 'carol')
+                response = await self.async_client.get('/api/hobbies/')
+                self.assertEqual([hobby['name'] for hobby in response.json()], ['Chess'])
+                self.assertEqual(await cache.aget(user_key(self.user.pk)) is not None, user_cache)
+                await self.async_client.alogout()
+                self.assertEqual((await self.async_client.get('/api/profile/')).status_code, 302)
+
+
+class EventTests(TestCase):
+    def setUp(self) -> None:
+        self.broker = events.LocalBroker()
+        patcher = mock.patch.object(events, '_broker', self.broker)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_local_broker(self) -> None:
+        subscription = self.broker.subscribe(['a', 'b'])
+        self.assertEqual(self.broker.publish('a', 'first', {'n': 1}), 1)
+        self.assertEqual(self.broker.publish('c', 'missed', {}), 0)
+        # Publishing is safe from any thread
+        thread = threading.Thread(target=self.broker.publish, args=('b', 'second', {'n': 2}))
+        thread.start()
+        thread.join()
+        first, second = await subscription.get(1), await subscription.get(1)
+        self.assertEqual((first['type'], first['channel'], first['data']), ('first', 'a', {'n': 1}))
+        self.assertEqual((second['type'], second['channel']), ('second', 'b'))
+        self.assertGreater(second['id'], first['id'])
+        self.assertIsNone(await subscription.get(0.01))
+        subscription.discard('a')
+        self.assertEqual(self.broker.publish('a', 'missed', {}), 0)
+        subscription.close()
+        self.assertFalse(self.broker.has_subscribers())
+
+    @override_settings(EVENTS_QUEUE_SIZE=2)
+    async def test_overflow(self) -> None:
+        subscription = self.broker.subscribe(['a'])
+        for n in range(3):
+            self.broker.publish('a', 'change', {'n': n})
+        await asyncio.sleep(0)
+        event = await subscription.get(1)
+        self.assertEqual((event['type'], event['data']), ('overflow', {}))
+        self.assertIsNone(await subscription.get(0.01))
+        # The reader is back in step
+        self.broker.publish('a', 'change', {'n': 3})
+        self.assertEqual((await subscription.get(1))['data'], {'n': 3})
+        subscription.close()
+
+    @override_settings(EVENTS_HEARTBEAT_SECONDS=0.05)
+    async def test_stream(self) -> None:
+        stream = events.stream(1, [10])
+        self.assertEqual(await anext(stream), b'retry: 5000\n\n')
+        self.assertEqual(await anext(stream), b': keep-alive\n\n')
+        # The user's own changes come through their channel, not as matches
+        self.broker.publish(events.hobby_channel(10), 'match', {'user_id': 1, 'hobby_id': 10, 'change': 'added'})
+        self.broker.publish(events.hobby_channel(10), 'match', {'user_id': 2, 'hobby_id': 10, 'change': 'added'})
+        self.assertIn(b'"user_id": 2', await anext(stream))
+        self.broker.publish(events.user_channel(1), 'hobbies', {'hobby_ids': [11], 'change': 'added'})
+        self.assertTrue((await anext(stream)).startswith(b'id: '))
+        self.broker.publish(events.user_channel(1), 'hobbies', {'hobby_ids': [10], 'change': 'removed'})
+        self.assertIn(b'event: hobbies', await anext(stream))
+        self.assertEqual(self.broker.publish(events.hobby_channel(10), 'match', {}), 0)
+        self.assertEqual(self.broker.publish(events.hobby_channel(11), 'match', {
+            'user_id': 3, 'hobby_id': 11, 'change': 'added',
+        }), 1)
+        self.assertIn(b'event: match', await anext(stream))
+        await stream.aclose()
+        self.assertFalse(self.broker.has_subscribers())
+
+    def test_changes_are_published_on_commit(self) -> None:
+        user = CustomUser.objects.create_user(username='jill', email='jill@example.com')
+        hobby = Hobby.objects.create(name='Chess')
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        async def subscribe() -> events.Subscription:
+            return self.broker.subscribe([events.user_channel(user.id), events.hobby_channel(hobby.id)])
+
+        async def received() -> list[tuple[str, str, dict]]:
+            received = []
+            while (event := await subscription.get(0.01)) is not None:
+                received.append((event['channel'], event['type'], event['data']))
+            return received
+
+        subscription = loop.run_until_complete(subscribe())
+        with self.captureOnCommitCallbacks() as callbacks:
+            user.hobbies.add(hobby)
+        self.assertEqual(loop.run_until_complete(received()), [])
+        for callback in callbacks:
+            callback()
+        self.assertEqual(sorted(loop.run_until_complete(received())), [
+            (events.hobby_channel(hobby.id), 'match', {'user_id': user.id, 'hobby_id': hobby.id, 'change': 'added'}),
+            (events.user_channel(user.id), 'hobbies', {'hobby_ids': [hobby.id], 'change': 'added'}),
+        ])
+        subscription.close()
+
+    @override_settings(ROOT_URLCONF='project.urls_async')
+    async def test_view(self) -> None:
+        user = await CustomUser.objects.acreate(username='kim', email='kim@example.com')
+        hobby = await Hobby.objects.acreate(name='Chess')
+        await user.hobbies.aadd(hobby)
+        await self.async_client.aforce_login(user)
+        response = await self.async_client.get('/api/events/')
+        self.assertEqual((response['Content-Type'], response['Cache-Control']), ('text/event-stream', 'no-cache'))
+        content = aiter(response.streaming_content)
+        self.assertEqual(await anext(content), b'retry: 5000\n\n')
+        self.assertEqual(set(self.broker._subscriptions), {events.user_channel(user.id), events.hobby_channel(hobby.id)})
+        await content.aclose()
+
+
+class ReplicaRoutingTests(TestCase):
+    def setUp(self) -> None:
+        # The router only needs to see the alias, no query is sent to it
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            self.enterContext(override_settings(DATABASES={**settings.DATABASES, 'replica': {}}))
+
+    def view(self, request: HttpRequest) -> HttpResponse:
+        before = Hobby.objects.all().db
+        if request.method == 'POST':
+            Hobby.objects.create(name='Chess')
+        return JsonResponse({'before': before, 'after': Hobby.objects.all().db})
+
+    def get(self, **cookies: str) -> HttpResponse:
+        request = RequestFactory().get('/')
+        request.COOKIES.update(cookies)
+        return replica_pinning_middleware(self.view)(request)
+
+    def test_reads_go_to_the_replica(self) -> None:
+        response = self.get()
+        self.assertEqual(json.loads(response.content), {'before': 'replica', 'after': 'replica'})
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+        # Outside of a request everything stays on the primary
+        self.assertEqual(Hobby.objects.all().db, 'default')
+
+    def test_writes_pin_the_request_and_client(self) -> None:
+        response = replica_pinning_middleware(self.view)(RequestFactory().post('/'))
+        self.assertEqual(json.loads(response.content), {'before': 'default', 'after': 'default'})
+        self.assertEqual(response.cookies[PIN_COOKIE]['max-age'], settings.REPLICA_PIN_SECONDS)
+        self.assertEqual(json.loads(self.get(**{PIN_COOKIE: '1'}).content)['before'], 'default')
+
+    def test_write_during_a_get(self) -> None:
+        def view(request: HttpRequest) -> HttpResponse:
+            before = Hobby.objects.all().db
+            Hobby.objects.create(name='Chess')
+            return JsonResponse({'before': before, 'after': Hobby.objects.all().db})
+
+        response = replica_pinning_middleware(view)(RequestFactory().get('/'))
+        self.assertEqual(json.loads(response.content), {'before': 'replica', 'after': 'default'})
+        self.assertIn(PIN_COOKIE, response.cookies)
+
+    async def test_async_writes_in_threads_pin(self) -> None:
+        async def view(request: HttpRequest) -> HttpResponse:
+            await Hobby.objects.acreate(name='Chess')
+            return JsonResponse({'after': Hobby.objects.all().db})
+
+        response = await replica_pinning_middleware(view)(RequestFactory().get('/'))
+        self.assertEqual(json.loads(response.content), {'after': 'default'})
+        self.assertIn(PIN_COOKIE, response.cookies)
+
+    def test_replica_settings(self) -> None:
+        primary = settings.DATABASES['default']
+        with mock.patch.dict(os.environ, {'DATABASE_REPLICAS': 'replica', 'DATABASE_REPLICA_NAME': 'replica.sqlite3'}):
+            replicas = database.replicas(primary)
+        self.assertEqual(list(replicas), ['replica'])
+        self.assertEqual(replicas['replica']['NAME'], 'replica.sqlite3')
+        self.assertEqual(replicas['replica']['ENGINE'], primary['ENGINE'])
+        self.assertEqual(replicas['replica']['TEST'], {'MIRROR': 'default'})
+
+
+class HealthTests(TestCase):
+    def test_liveness_is_public(self) -> None:
+        self.assertEqual(self.client.get('/health').content, b'OK')
+
+    @override_settings(HEALTH_TOKEN='s3cret', HEALTH_ALLOWED_NETWORKS=['10.1.0.0/16'])
+    def test_pool_stats_need_staff_network_or_token(self) -> None:
+        def status(**extra: str) -> int:
+            return self.client.get('/health/db', **{'REMOTE_ADDR': '192.0.2.1', **extra}).status_code
+
+        self.assertEqual(status(), 403)
+        self.assertEqual(status(HTTP_AUTHORIZATION='Bearer wrong'), 403)
+        self.assertEqual(status(HTTP_AUTHORIZATION='Bearer s3cret'), 200)
+        self.assertEqual(status(REMOTE_ADDR='10.1.2.3'), 200)
+        self.client.force_login(CustomUser.objects.create_user(username='erin', email='erin@example.com'))
+        self.assertEqual(status(), 403)
+        CustomUser.objects.filter(username='erin').update(is_staff=True)
+        self.assertEqual(status(), 200)
+
+    def test_no_token_configured(self) -> None:
+        self.assertEqual(self.client.get('/health/db', HTTP_AUTHORIZATION='Bearer ').status_code, 403)
+
+
+class CatalogueCacheTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.client.force_login(CustomUser.objects.create_user(username='bob', email='bob@example.com'))
+        Hobby.objects.create(name='Chess')
+
+    def test_revalidation(self) -> None:
+        response = self.client.get('/api/all-hobbies/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self.client.get('/api/all-hobbies/', HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304
+        )
+        # As another worker would, without going through this process' cache
+        Hobby.objects.bulk_create([Hobby(name='Go')])
+        CatalogueVersion.objects.update(version=F('version') + 1)
+        response = self.client.get('/api/all-hobbies/', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([hobby['name'] for hobby in response.json()], ['Chess', 'Go'])
+
+    def test_version_bumped_on_commit(self) -> None:
+        version = catalogue_version()
+        with self.captureOnCommitCallbacks() as callbacks:
+            Hobby.objects.create(name='Go')
+            self.assertEqual(catalogue_version(), version)
+        for callback in callbacks:
+            callback()
+        self.assertGreater(catalogue_version(), version)
+
+    def test_page_key_ignores_other_parameters(self) -> None:
+        first = self.client.get('/api/all-hobbies/?limit=5&junk=1')
+        second = self.client.get('/api/all-hobbies/?junk=2&limit=5')
+        self.assertEqual(first['ETag'], second['ETag'])
+        self.assertNotEqual(first['ETag'], self.client.get('/api/all-hobbies/?limit=6')['ETag'])
+        self.assertEqual(self.client.get('/api/all-hobbies/?cursor=junk').status_code, 400)
+
+
+class PageViewTests(TestCase):
+    def setUp(self) -> None:
+        counters.flush()
+        self.addCleanup(counters.flush)
+
+    def test_views_are_counted(self) -> None:
+        self.client.get('/')
+        self.client.get('/')
+        self.client.force_login(CustomUser.objects.create_user(username='dave', email='dave@example.com'))
+        self.assertEqual(self.client.get('/api/page-views/').json(), {'key': 'homepage', 'count': 2})
+        counters.flush()
+        self.assertEqual(PageView.objects.filter(key='homepage').aggregate(total=Sum('count'))['total'], 2)
+        self.assertEqual(counters.total('homepage'), 2)
+
+    def test_overdue_views_are_flushed_by_the_request(self) -> None:
+        counters.increment('homepage')
+        self.assertFalse(PageView.objects.exists())
+        counters._flushed_at = time.monotonic() - 3 * settings.PAGEVIEW_FLUSH_INTERVAL
+        counters.increment('homepage')
+        self.assertEqual(PageView.objects.get().count, 2)
+
+    def test_site_totals_moved_to_homepage(self) -> None:
+        PageView.objects.bulk_create([
+            PageView(key='site', shard=0, count=5), PageView(key='site', shard=1, count=7),
+            PageView(key='homepage', shard=0, count=1), PageView(key='homepage', shard=3, count=2),
+        ])
+        importlib.import_module('api.migrations.0012_pageview_homepage').move_site_totals(apps, None)
+        self.assertEqual(
+            list(PageView.objects.order_by('key', 'shard').values_list('key', 'shard', 'count')),
+            [('homepage', 0, 13), ('homepage', 3, 2)],
+        )
+
+
+@override_settings(SHARED_CACHE=True)
+class SharedPageViewTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def pending(self) -> Optional[int]:
+        return cache.get(counters.pending_key('homepage'))
+
+    def flushed(self) -> int:
+        return PageView.objects.filter(key='homepage').aggregate(total=Sum('count'))['total']
+
+    def test_views_are_counted_in_the_cache(self) -> None:
+        for _ in range(3):
+            self.client.get('/')
+        self.assertEqual((self.pending(), self.flushed()), (3, 0))
+        self.assertFalse(counters._pending)
+        self.assertEqual(counters.total('homepage'), 3)
+        counters.flush()
+        self.assertEqual((self.pending(), self.flushed()), (0, 3))
+        counters.increment('homepage')
+        self.assertEqual(counters.total('homepage'), 4)
+
+    def test_views_of_a_killed_worker_are_flushed(self) -> None:
+        counters.increment('homepage', 5)
+        counters.increment('other', 2)
+        # Nothing left in the dead worker's memory, the next worker to flush
+        # finds the keys and their counts without it
+        counters._pending.clear()
+        counters.flush()
+        self.assertEqual(
+            dict(PageView.objects.values_list('key').annotate(total=Sum('count')).order_by()),
+            {'homepage': 5, 'other': 2},
+        )
+
+    def test_one_worker_flushes_at_a_time(self) -> None:
+        counters.increment('homepage', 5)
+        cache.add(counters.FLUSH_LOCK, 0)
+        counters.flush()
+        self.assertEqual((self.pending(), self.flushed()), (5, 0))
+        cache.delete(counters.FLUSH_LOCK)
+        counters.flush()
+        self.assertEqual((self.pending(), self.flushed()), (0, 5))
+
+    def test_failed_flush_keeps_views_pending(self) -> None:
+        counters.increment('homepage', 5)
+        with mock.patch.object(counters, '_write', side_effect=RuntimeError), self.assertLogs('api.counters', 'ERROR'):
+            counters.flush()
+        self.assertEqual((self.pending(), self.flushed()), (5, 0))
+        self.assertIsNone(cache.get(counters.FLUSH_LOCK))
+
+
+class HobbySearchTests(TestCase):
+    def test_hobbies_added_by_another_worker_are_found(self) -> None:
+        Hobby.objects.create(name='Rock Climbing')
+        self.assertEqual([hobby['name'] for hobby in search_hobbies('clim', 10)], ['Rock Climbing'])
+        Hobby.objects.bulk_create([Hobby(name='Climbing Gym')])
+        CatalogueVersion.objects.update(version=F('version') + 1)
+        self.assertEqual(
+            [hobby['name'] for hobby in search_hobbies('clim', 10)], ['Climbing Gym', 'Rock Climbing']
+        )
+
+
+class HobbyCreateTests(TestCase):
+    def setUp(self) -> None:
+        self.client.force_login(CustomUser.objects.create_user(username='ivy', email='ivy@example.com'))
+
+    def post(self, data: object) -> HttpResponse:
+        return self.client.post('/api/hobbies/create/', data, content_type='application/json')
+
+    def test_created_once(self) -> None:
+        response = self.post({'name': '  rock   climbing '})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['name'], 'Rock Climbing')
+        again = self.post({'name': 'ROCK CLIMBING'})
+        self.assertEqual(again.status_code, 200)
+        self.assertEqual(again.json(), response.json())
+        self.assertEqual(Hobby.objects.count(), 1)
+
+    def test_names(self) -> None:
+        chess = Hobby.objects.create(name='Chess')
+        response = self.post({'names': ['chess', ' Go ', 'go', 'Board  games']})
+        self.assertEqual(response.status_code, 201)
+        # In id order, the new hobbies in no particular order after Chess
+        self.assertEqual(response.json()[0], {'id': chess.id, 'name': 'Chess'})
+        self.assertEqual(sorted(hobby['name'] for hobby in response.json()[1:]), ['Board Games', 'Go'])
+        response = self.post({'names': ['GO', 'chess']})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([hobby['name'] for hobby in response.json()], ['Chess', 'Go'])
+        self.assertEqual(Hobby.objects.count(), 3)
+
+    def test_invalid(self) -> None:
+        for data in ({}, {'name': '  '}, {'names': []}, {'names': ['Chess', 1]}, {'names': 'Chess'}):
+            with self.subTest(data=data):
+                self.assertEqual(self.post(data).status_code, 400)
+
+    def test_names_unique_ignoring_case(self) -> None:
+        # Saved without normalizing, as rows from before it were
+        Hobby.objects.bulk_create([Hobby(name='rock climbing')])
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Hobby.objects.bulk_create([Hobby(name='Rock Climbing')])
+        hobbies, missing = Hobby.objects.resolve(['Rock climbing'])
+        self.assertEqual((list(hobbies), missing), (['Rock Climbing'], set()))
+        self.assertEqual(hobbies['Rock Climbing'].name, 'rock climbing')
+        self.assertEqual(self.post({'name': 'ROCK CLIMBING'}).status_code, 200)
+
+
+@override_settings(RATE_LIMITS={'login': '2/minute', 'login_ip': '4/minute', 'register': '1/minute'})
+class RateLimitTests(TestCase):
+    def setUp(self) -> None:
+        caches['ratelimit'].clear()
+
+    def login(self, username: str, address: str = '10.0.0.1', **headers: str) -> int:
+        data = {'username': username, 'password': 'wrong'}
+        return self.client.post('/login/', data, REMOTE_ADDR=address, **headers).status_code
+
+    def test_login_limited_per_username_and_address(self) -> None:
+        self.assertEqual([self.login('alice') for _ in range(3)], [200, 200, 429])
+        self.assertEqual(self.login('bob'), 200)
+        self.assertEqual(self.login('ALICE', '10.0.0.2'), 200)
+        response = self.client.post('/login/', {'username': 'Alice'}, REMOTE_ADDR='10.0.0.1')
+        self.assertEqual(response.status_code, 429)
+        self.assertTrue(int(response['Retry-After']) > 0)
+
+    def test_login_limited_per_address(self) -> None:
+        self.assertEqual([self.login(f'user{i}') for i in range(5)], [200, 200, 200, 200, 429])
+        self.assertEqual(self.login('user5', '10.0.0.2'), 200)
+
+    def test_buckets_survive_default_cache_churn(self) -> None:
+        self.assertEqual(self.client.post('/register/', REMOTE_ADDR='10.0.0.1').status_code, 200)
+        cache.clear()
+        self.assertEqual(self.client.post('/register/', REMOTE_ADDR='10.0.0.1').status_code, 429)
+
+    @override_settings(RATE_LIMIT_IP_HEADER='HTTP_X_FORWARDED_FOR')
+    def test_clients_behind_proxy(self) -> None:
+        def register(forwarded_for: str) -> int:
+            return self.client.post(
+                '/register/', REMOTE_ADDR='192.168.0.1', HTTP_X_FORWARDED_FOR=forwarded_for,
+            ).status_code
+
+        self.assertEqual(register('1.1.1.1'), 200)
+        self.assertEqual(register('9.9.9.9, 2.2.2.2'), 200)
+        self.assertEqual(register('1.1.1.1'), 429)
+
+
+# A fast hasher first, so that it is the default, the configured ones still verify
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher', *settings.PASSWORD_HASHERS])
+class ImportUsersTests(TestCase):
+    def test_passwords(self) -> None:
+        hashed = make_password('imported', hasher='pbkdf2_sha1')
+        counts = import_users([
+            {'username': 'plain', 'email': 'plain@example.com', 'password': 'secret', 'hobbies': ['Chess']},
+            {'username': 'hashed', 'email': 'hashed@example.com', 'password': hashed},
+            {'username': 'empty', 'email': 'empty@example.com', 'password': ''},
+            {'username': 'missing', 'email': 'missing@example.com'},
+        ], batch_size=2)
+        self.assertEqual(counts, {'users': 4, 'hobbies': 1, 'memberships': 1})
+        users = {user.username: user for user in CustomUser.objects.all()}
+        self.assertEqual(identify_hasher(users['plain'].password).algorithm, 'md5')
+        self.assertTrue(users['plain'].check_password('secret'))
+        self.assertEqual(users['hashed'].password, hashed)
+        self.assertTrue(users['hashed'].check_password('imported'))
+        self.assertFalse(users['empty'].has_usable_password())
+        self.assertFalse(users['missing'].has_usable_password())
+
+    def test_hasher(self) -> None:
+        import_users([{'username': 'plain', 'email': 'plain@example.com', 'password': 'secret'}],
+                     batch_size=10, hasher='pbkdf2_sha1')
+        password = CustomUser.objects.get().password
+        self.assertEqual(identify_hasher(password).algorithm, 'pbkdf2_sha1')
+        self.assertTrue(check_password('secret', password))
+
+
+class HasherSettingsTests(TestCase):
+    @override_settings(PBKDF2_ITERATIONS=1000, SCRYPT_WORK_FACTOR=None, ARGON2_TIME_COST=10)
+    def test_costs_below_defaults_are_raised(self) -> None:
+        self.assertEqual(at_least_default('PBKDF2_ITERATIONS', 870000), 870000)
+        self.assertEqual(at_least_default('SCRYPT_WORK_FACTOR', 16384), 16384)
+        self.assertEqual(at_least_default('ARGON2_TIME_COST', 2), 10)
+        self.assertEqual([warning.id for warning in check_password_hashers(None)], ['api.W003'])
+
+
+class UserListTests(TestCase):
+    def setUp(self) -> None:
+        self.viewer = CustomUser.objects.create_user(username='viewer', email='viewer@example.com')
+        self.client.force_login(self.viewer)
+        today = timezone.localdate()
+        CustomUser.objects.bulk_create([
+            CustomUser(username=f'user{i}', email=f'user{i}@example.com',
+                       date_of_birth=date(today.year - 20 - i % 15, 1 + i % 12, 1 + i % 28))
+            for i in range(40)
+        ])
+
+    def walk(self, query: str) -> list[dict]:
+        users, url = [], f'/api/users/?limit=7&{query}'
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            users.extend(response.json())
+            url = response.get('Link', '').partition('<')[2].partition('>')[0]
+        return users
+
+    def test_age_filtered_pages_follow_birth_date(self) -> None:
+        today = timezone.localdate()
+        for query, condition in (
+            ('min_age=25', Q(date_of_birth__lte=years_before(today, 25))),
+            ('max_age=27', Q(date_of_birth__gt=years_before(today, 28))),
+            ('min_age=22&max_age=30',
+             Q(date_of_birth__lte=years_before(today, 22), date_of_birth__gt=years_before(today, 31))),
+        ):
+            expected = list(
+                CustomUser.objects.filter(condition).order_by('date_of_birth', 'id').values_list('id', flat=True)
+            )
+            self.assertEqual([user['id'] for user in self.walk(query)], expected)
+
+    def test_unfiltered_pages_follow_id(self) -> None:
+        ids = [user['id'] for user in self.walk('')]
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(len(ids), 40)
+
+    def test_only_ages_are_shown(self) -> None:
+        response = self.client.get('/api/users/?min_age=22&max_age=30&limit=7')
+        self.assertTrue(all(22 <= user['age'] <= 30 for user in response.json()))
+        self.assertNotIn('date_of_birth', response.json()[0])
+        # Nor can the birth date of the last user be read off the cursor
+        cursor = response['Link'].partition('cursor=')[2].partition('>')[0]
+        self.assertEqual(cursor, encode_cursor([response.json()[-1]['id']]))
+
+    def test_age_on(self) -> None:
+        self.assertEqual(age_on(date(2021, 2, 28), date(2000, 2, 29)), 20)
+        self.assertEqual(age_on(date(2021, 3, 1), date(2000, 2, 29)), 21)
+        self.assertEqual(age_on(date(2020, 2, 29), date(2000, 2, 29)), 20)
+
+    def test_invalid_cursor(self) -> None:
+        self.assertEqual(self.client.get('/api/users/?min_age=20&cursor=junk').status_code, 400)
+        self.assertEqual(
+            self.client.get(f'/api/users/?min_age=20&cursor={encode_cursor([0])}').status_code, 400
+        )
+
+
+class PopularHobbiesTests(TestCase):
+    def setUp(self) -> None:
+        self.users = CustomUser.objects.bulk_create([
+            CustomUser(username=f'user{i}', email=f'user{i}@example.com') for i in range(4)
+        ])
+        self.hobbies = Hobby.objects.bulk_create([Hobby(name=f'Hobby {i}') for i in range(4)])
+        for i, user in enumerate(self.users):
+            user.hobbies.add(*self.hobbies[:i + 1])
+        self.client.force_login(self.users[0])
+
+    def counts(self) -> dict[int, int]:
+        return dict(Hobby.objects.values_list('id', 'user_count'))
+
+    def test_most_popular_first(self) -> None:
+        response = self.client.get('/api/hobbies/popular/?limit=3')
+        self.assertEqual(
+            [(hobby['id'], hobby['user_count']) for hobby in response.json()],
+            [(hobby.id, 4 - i) for i, hobby in enumerate(self.hobbies[:3])],
+        )
+        # Ties keep id order
+        self.hobbies[3].users.add(self.users[0], self.users[1])
+        response = self.client.get('/api/hobbies/popular')
+        self.assertEqual(
+            [(hobby['id'], hobby['user_count']) for hobby in response.json()],
+            [(self.hobbies[0].id, 4), (self.hobbies[1].id, 3), (self.hobbies[3].id, 3), (self.hobbies[2].id, 2)],
+        )
+
+    def test_counts_follow_changes(self) -> None:
+        self.users[3].hobbies.clear()
+        self.hobbies[0].users.remove(self.users[0])
+        self.users[1].delete()
+        self.assertEqual(self.counts(), {
+            self.hobbies[0].id: 1, self.hobbies[1].id: 1, self.hobbies[2].id: 1, self.hobbies[3].id: 0,
+        })
+
+    def test_reconcile(self) -> None:
+        expected = self.counts()
+        # Drift, as from changes that bypass the signals
+        Hobby.objects.filter(id=self.hobbies[0].id).update(user_count=10)
+        Hobby.objects.filter(id=self.hobbies[2].id).update(user_count=0)
+        UserHobby.objects.filter(hobby_id=self.hobbies[3].id).delete()
+        expected[self.hobbies[3].id] = 0
+        drifted = self.counts()
+        self.assertEqual(reconcile_user_counts(batch_size=2, dry_run=True), 3)
+        self.assertEqual(self.counts(), drifted)
+        self.assertEqual(reconcile_user_counts([self.hobbies[0].id]), 1)
+        self.assertEqual(reconcile_user_counts(batch_size=2), 2)
+        self.assertEqual(self.counts(), expected)
+        self.assertEqual(reconcile_user_counts(), 0)
+
+
+@override_settings(TASKS_EAGER=False)
+class BulkHobbiesTests(TestCase):
+    def setUp(self) -> None:
+        self.user = CustomUser.objects.create_user(username='gina', email='gina@example.com')
+        self.hobbies = Hobby.objects.bulk_create([Hobby(name=f'Hobby {i}') for i in range(5)])
+        self.ids = [hobby.id for hobby in self.hobbies]
+        self.user.hobbies.add(*self.hobbies[:2])
+        self.client.force_login(self.user)
+
+    def post(self, data: object) -> HttpResponse:
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post('/api/hobbies/bulk/', data, content_type='application/json')
+
+    def held(self) -> list[int]:
+        return sorted(self.user.hobbies.values_list('id', flat=True))
+
+    def test_desired_set(self) -> None:
+        response = self.post({'hobby_ids': self.ids[1:4]})
+        self.assertEqual(response.json(), {'added': self.ids[2:4], 'removed': self.ids[:1]})
+        self.assertEqual(self.held(), self.ids[1:4])
+        self.assertEqual(self.post({'hobby_ids': []}).json(), {'added': [], 'removed': self.ids[1:4]})
+        self.assertEqual(self.held(), [])
+
+    def test_add_and_remove(self) -> None:
+        response = self.post({'add': self.ids[2:4], 'remove': [self.ids[0], self.ids[4]]})
+        # Only hobbies the user had count as removed
+        self.assertEqual(response.json(), {'added': self.ids[2:4], 'removed': self.ids[:1]})
+        self.assertEqual(self.held(), self.ids[1:4])
+        # Adding wins over removing the same hobby
+        self.assertEqual(self.post({'add': self.ids[:1], 'remove': self.ids[:1]}).json(),
+                         {'added': self.ids[:1], 'removed': []})
+
+    def test_unknown_hobbies(self) -> None:
+        unknown = max(self.ids) + 1
+        response = self.post({'add': [self.ids[2], unknown]})
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json()['hobby_ids'], [unknown])
+        self.assertEqual(self.held(), self.ids[:2])
+
+    def test_malformed_bodies(self) -> None:
+        for body in ('not json', '[1, 2]', '{"hobby_ids": 3}', '{"add": [[1]]}', '{"add": ["1"]}',
+                     '{"add": [true]}', '{"hobby_ids": [1.5]}', '{"remove": [null]}'):
+            with self.subTest(body=body):
+                response = self.client.post('/api/hobbies/bulk/', body, content_type='application/json')
+                self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.held(), self.ids[:2])
+
+    def test_signals(self) -> None:
+        other = CustomUser.objects.create_user(username='hank', email='hank@example.com')
+        other.hobbies.add(*self.hobbies)
+        Task.objects.all().delete()
+        self.post({'hobby_ids': self.ids[1:3]})
+        self.assertEqual(
+            dict(Hobby.objects.filter(id__in=self.ids[:3]).values_list('id', 'user_count')),
+            {self.ids[0]: 1, self.ids[1]: 2, self.ids[2]: 2},
+        )
+        self.assertEqual(
+            sorted(Task.objects.values_list('name', 'args')),
+            [
+                ('api.tasks.update_overlaps', [self.user.id, self.ids[:1]]),
+                ('api.tasks.update_overlaps', [self.user.id, self.ids[2:3]]),
+            ],
+        )
+
+
+@override_settings(TASKS_EAGER=True, MATCHING_TOP_K=3)
+class OverlapTests(TestCase):
+    """
+    Random hobby changes, made every way the ORM allows, keep each user's
+    stored matches equal to a recount from the through table. Few users and
+    hobbies with small lists make ties and full lists common.
+    """
+
+    def setUp(self) -> None:
+        self.users = CustomUser.objects.bulk_create([
+            CustomUser(username=f'user{i}', email=f'user{i}@example.com') for i in range(8)
+        ])
+        self.hobbies = Hobby.objects.bulk_create([Hobby(name=f'Hobby {i}') for i in range(6)])
+
+    def expected(self) -> dict[int, list[tuple[int, int]]]:
+        holders = defaultdict(set)
+        for user_id, hobby_id in UserHobby.objects.values_list('customuser_id', 'hobby_id'):
+            holders[user_id].add(hobby_id)
+        matches = {}
+        for user_id, hobbies in holders.items():
+            ranked = sorted(
+                (-len(hobbies & others), other_id)
+                for other_id, others in holders.items()
+                if other_id != user_id and hobbies & others
+            )
+            if ranked:
+                matches[user_id] = [(other_id, -shared) for shared, other_id in ranked[:3]]
+        return matches
+
+    def stored(self) -> dict[int, list[tuple[int, int]]]:
+        matches = defaultdict(list)
+        for user_id, other_id, shared in HobbyOverlap.objects.order_by('user_id', '-shared', 'other_id').values_list(
+            'user_id', 'other_id', 'shared'
+        ):
+            matches[user_id].append((other_id, shared))
+        return dict(matches)
+
+    def change(self, rng: random.Random) -> str:
+        user, hobby = rng.choice(self.users), rng.choice(self.hobbies)
+        hobbies = rng.sample(self.hobbies, rng.randint(1, 3))
+        users = rng.sample(self.users, rng.randint(1, 3))
+        operation = rng.choice([
+            'add', 'add', 'remove', 'clear', 'set', 'reverse add', 'reverse remove', 'reverse clear',
+            'reverse set', 'delete hobby', 'delete user',
+        ])
+        if operation == 'add':
+            user.hobbies.add(*hobbies)
+        elif operation == 'remove':
+            user.hobbies.remove(*hobbies)
+        elif operation == 'clear':
+            user.hobbies.clear()
+        elif operation == 'set':
+            user.hobbies.set(hobbies)
+        elif operation == 'reverse add':
+            hobby.users.add(*users)
+        elif operation == 'reverse remove':
+            hobby.users.remove(*users)
+        elif operation == 'reverse clear':
+            hobby.users.clear()
+        elif operation == 'reverse set':
+            hobby.users.set(users)
+        elif operation == 'delete hobby':
+            self.hobbies.remove(hobby)
+            hobby.delete()
+            self.hobbies.append(Hobby.objects.create(name=f'Hobby {rng.random()}'))
+        else:
+            self.users.remove(user)
+            user.delete()
+            name = f'user{rng.random()}'
+            self.users.append(CustomUser.objects.create_user(username=name, email=f'{name}@example.com'))
+        return operation
+
+    def test_random_changes(self) -> None:
+        for seed in range(15):
+            rng = random.Random(seed)
+            for step in range(30):
+                with self.captureOnCommitCallbacks(execute=True):
+                    operation = self.change(rng)
+                self.assertEqual(self.stored(), self.expected(), f'seed {seed}, step {step}: {operation}')
+
+    def test_rebuild(self) -> None:
+        rng = random.Random(0)
+        UserHobby.objects.bulk_create([
+            UserHobby(customuser_id=user.id, hobby_id=hobby.id)
+            for user in self.users for hobby in rng.sample(self.hobbies, rng.randint(0, 4))
+        ])
+        rebuild_overlaps(batch_size=3)
+        self.assertEqual(self.stored(), self.expected())
+
+    def test_work_is_queued(self) -> None:
+        with self.settings(TASKS_EAGER=False), self.captureOnCommitCallbacks(execute=True):
+            self.users[0].hobbies.add(*self.hobbies)
+            self.hobbies[0].users.add(*self.users[1:3])
+        self.assertFalse(HobbyOverlap.objects.exists())
+        self.assertEqual(
+            sorted(Task.objects.values_list('name', 'args')),
+            [
+                ('api.tasks.update_overlaps', [self.users[0].id, sorted(hobby.id for hobby in self.hobbies)]),
+                ('api.tasks.update_overlaps', [self.users[1].id, [self.hobbies[0].id]]),
+                ('api.tasks.update_overlaps', [self.users[2].id, [self.hobbies[0].id]]),
+            ],
+        )
+
+    def test_age_filter_below_the_stored_matches(self) -> None:
+        today = timezone.localdate()
+        user, *others = self.users
+        CustomUser.objects.filter(id__in=[other.id for other in others]).update(date_of_birth=years_before(today, 20))
+        CustomUser.objects.filter(id=others[-1].id).update(date_of_birth=years_before(today, 70))
+        with self.captureOnCommitCallbacks(execute=True):
+            user.hobbies.add(*self.hobbies[:3])
+            for other in others[:-1]:
+                other.hobbies.add(*self.hobbies[:2])
+            others[-1].hobbies.add(self.hobbies[0])
+        self.assertNotIn(others[-1].id, HobbyOverlap.objects.filter(user=user).values_list('other_id', flat=True))
+        older, younger = Q(date_of_birth__lte=years_before(today, 60)), Q(date_of_birth__gt=years_before(today, 30))
+        for rank in (similar_users, async_to_sync(asimilar_users)):
+            self.assertEqual([(match['id'], match['shared']) for match in rank(user, 2, None, older)], [(others[-1].id, 1)])
+            self.assertEqual(len(rank(user, 10, None, younger)), 6)
+            self.assertEqual(len(rank(user, 10, None, Q())), 3)
+
+calls: list[str] = []
+
+
+@task(name='tests.record', retry_delay=10.0, max_attempts=2)
+def record(value: str) -> None:
+    calls.append(value)
+    if value == 'fail':
+        raise ValueError(value)
+
+
+@task(name='tests.single', concurrency=1)
+def single() -> None:
+    pass
+
+
+# Runs tasks on its own connections, which TestCase's transaction would hide
+@override_settings(TASKS_EAGER=False)
+class WorkerTests(TransactionTestCase):
+    def setUp(self) -> None:
+        calls.clear()
+        self.worker = Worker(['default'], lease=60.0)
+
+    def test_claim(self) -> None:
+        first = record.enqueue('a')
+        later = record.enqueue('b', delay=60)
+        second = record.enqueue('c')
+        self.assertEqual(self.worker.claim(10), [first.id, second.id])
+        self.assertEqual(self.worker.claim(10), [])
+        self.assertEqual(
+            list(Task.objects.order_by('id').values_list('status', 'attempts')),
+            [(Task.RUNNING, 1), (Task.PENDING, 0), (Task.RUNNING, 1)],
+        )
+        Task.objects.filter(id=later.id).update(run_at=timezone.now())
+        self.assertEqual(self.worker.claim(10), [later.id])
+
+    def test_success_deletes_the_task(self) -> None:
+        task_id = record.enqueue('a').id
+        self.worker.claim(1)
+        self.worker.execute(task_id)
+        self.assertEqual(calls, ['a'])
+        self.assertFalse(Task.objects.exists())
+
+    def test_retry_with_backoff(self) -> None:
+        task_id = record.enqueue('fail').id
+        self.worker.claim(1)
+        before = timezone.now()
+        with self.assertLogs('api.queue', 'ERROR'):
+            self.worker.execute(task_id)
+        failed = Task.objects.get()
+        self.assertEqual((failed.status, failed.attempts), (Task.PENDING, 1))
+        self.assertIn('ValueError', failed.last_error)
+        self.assertGreaterEqual(failed.run_at, before + timedelta(seconds=10))
+        self.assertEqual(self.worker.claim(1), [])
+
+        Task.objects.update(run_at=timezone.now())
+        self.assertEqual(self.worker.claim(1), [task_id])
+        with self.assertLogs('api.queue', 'ERROR'):
+            self.worker.execute(task_id)
+        failed = Task.objects.get()
+        self.assertEqual((failed.status, failed.attempts), (Task.FAILED, 2))
+        self.assertIsNotNone(failed.finished_at)
+        self.assertEqual(calls, ['fail', 'fail'])
+
+    def test_expired_leases_are_requeued(self) -> None:
+        retried, exhausted = record.enqueue('a'), record.enqueue('b')
+        self.worker.claim(2)
+        Task.objects.filter(id=exhausted.id).update(attempts=2)
+        Task.objects.update(locked_at=timezone.now() - timedelta(seconds=61))
+        self.worker.requeue_expired()
+        self.assertEqual(Task.objects.get(id=retried.id).status, Task.PENDING)
+        self.assertEqual(Task.objects.get(id=exhausted.id).status, Task.FAILED)
+        self.assertEqual(self.worker.claim(2), [retried.id])
+
+    def test_concurrency_cap(self) -> None:
+        ids = [single.enqueue().id for _ in range(3)]
+        other = record.enqueue('a').id
+        self.assertEqual(self.worker.claim(10), [ids[0], other])
+        self.assertEqual(self.worker.claim(10), [])
+        self.worker.execute(ids[0])
+        self.assertEqual(self.worker.claim(10), [ids[1]])
+
+    def test_run_in_burst(self) -> None:
+        for value in 'abc':
+            record.enqueue(value)
+        worker = Worker(['default'], concurrency=1, poll_interval=0.01)
+        self.assertEqual(worker.run(burst=True), 3)
+        self.assertEqual(sorted(calls), ['a', 'b', 'c'])
+        self.assertFalse(Task.objects.exists())
+
+
+@override_settings(RATE_LIMITS={}, TASKS_EAGER=False)
+class BenchmarkTests(TestCase):
+    def test_summarize_nothing(self) -> None:
+        self.assertEqual(summarize([], 0.0)['requests'], 0)
+
+    def test_hobbies_added_and_deleted_once(self) -> None:
+        user = CustomUser.objects.create_user(username='frank', email='frank@example.com', password='x')
+        hobbies = Hobby.objects.bulk_create([Hobby(name=f'Hobby {i}') for i in range(150)])
+        user.hobbies.add(*hobbies[:40])
+        results = run_scenario(TestClientTarget(), 'frank', 'x', 120, ['add_hobby', 'delete_hobby'])
+        self.assertEqual([results[name]['requests'] for name in ('add_hobby', 'delete_hobby')], [110, 110])
+        self.assertEqual([results[name]['errors'] for name in ('add_hobby', 'delete_hobby')], [0, 0])
+        self.assertEqual(set(user.hobbies.all()), set(hobbies[:40]))
+        results = run_scenario(TestClientTarget(), 'frank', 'x', 5, ['delete_hobby'])
+        self.assertEqual((results['delete_hobby']['requests'], results['delete_hobby']['errors']), (5, 0))
+        self.assertEqual(user.hobbies.count(), 40)
+
+
+# A table read from end to end, or rows sorted rather than read in index
+# order, in EXPLAIN output. SQLite also says SCAN for walking an index in
+# order, those lines go on with USING
+PLAN_PROBLEMS = {
+    'sqlite': re.compile(r'\bSCAN \w+(?! USING)(?:\s|$)|TEMP B-TREE FOR ORDER BY'),
+    'postgresql': re.compile(r'\bSeq Scan on \w+|\bSort\b'),
+}
+
+
+def explain(sql: str) -> str:
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            return '\n'.join(row[-1] for row in cursor.fetchall())
+        cursor.execute(f'EXPLAIN {sql}')
+        return '\n'.join(row[0] for row in cursor.fetchall())
+
+
+@skipUnless(connection.vendor in PLAN_PROBLEMS, 'Query plans are only checked on SQLite and PostgreSQL')
+class QueryPlanTests(TestCase):
+    """
+    Every query the main endpoints run finds its rows and their order through
+    an index. The queries are captured from real requests and explained.
+
+    Pages are requested with a cursor: the first page walks a primary key
+    from its start and stops at the limit, which SQLite reports as a SCAN.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        today = timezone.localdate()
+        hobbies = Hobby.objects.bulk_create([Hobby(name=f'Hobby {i}') for i in range(60)])
+        users = CustomUser.objects.bulk_create([
+            CustomUser(username=f'user{i}', email=f'user{i}@example.com',
+                       date_of_birth=date(today.year - 18 - i % 60, 1 + i % 12, 1 + i % 28))
+            for i in range(300)
+        ])
+        UserHobby.objects.bulk_create([
+            UserHobby(customuser_id=user.id, hobby_id=hobbies[(i * 7 + j * j) % len(hobbies)].id)
+            for i, user in enumerate(users)
+            for j in range(1 + i % 6)
+        ], ignore_conflicts=True)
+        reconcile_user_counts()
+        rebuild_overlaps()
+        cls.user = users[0]
+        cls.hobbies = hobbies
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.client.force_login(self.user)
+
+    def assertIndexed(self, url: str, method: str = 'get', data: Optional[dict] = None) -> None:
+        with CaptureQueriesContext(connection) as queries:
+            response = getattr(self.client, method)(url, data)
+        self.assertLess(response.status_code, 400, url)
+        selects = [query['sql'] for query in queries if query['sql'].startswith('SELECT')]
+        self.assertTrue(selects, url)
+        for sql in selects:
+            plan = explain(sql)
+            self.assertIsNone(PLAN_PROBLEMS[connection.vendor].search(plan), f'{url}\n{sql}\n{plan}')
+
+    def test_hobbies(self) -> None:
+        self.assertIndexed(f'/api/all-hobbies/?cursor={encode_cursor([self.hobbies[29].id])}')
+        self.assertIndexed('/api/hobbies/')
+        self.assertIndexed('/api/hobbies/popular/')
+
+    def test_similar_users(self) -> None:
+        self.assertIndexed('/api/similar-users/')
+        self.assertIndexed(f'/api/similar-users/?cursor={encode_cursor([1, self.user.id + 10])}')
+
+    def test_users(self) -> None:
+        self.assertIndexed(f'/api/users/?cursor={encode_cursor([self.user.id + 150])}')
+
+    def test_users_by_age(self) -> None:
+        cursor = encode_cursor([self.user.id + 150])
+        for query in ('min_age=30', 'max_age=40', 'min_age=30&max_age=30', 'min_age=18&max_age=80'):
+            self.assertIndexed(f'/api/users/?{query}')
+            self.assertIndexed(f'/api/users/?{query}&cursor={cursor}')
+
+    @skipUnless(connection.vendor == 'postgresql', 'Case-insensitive lookups are only indexed on PostgreSQL')
+    @override_settings(HOBBY_SEARCH_INDEX_LIMIT=0, RATE_LIMITS={})
+    def test_case_insensitive_lookups(self) -> None:
+        self.assertIndexed('/api/hobbies/search/?q=hob')
+        self.client.logout()
+        self.assertIndexed('/register/', 'post', {'username': 'USER1', 'email': 'User1@example.com'})
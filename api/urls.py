@@ -13,27 +13,37 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
-from django.conf import settings
-from django.contrib import admin
-from django.urls import include, path
-from django.http import HttpResponse
+from django.urls import path
 from django.contrib.auth.decorators import login_required
 from . import views
 
+# The JSON API on its own, also served by the lean project.urls_api
+api_urlpatterns = [
+    path('api/profile/', views.profile, name='profile'),
+    path('api/profile', views.profile, name='profile'),
+    path('api/update-password', views.update_password, name='update_password'),
+    
+    path('api/hobbies/', views.user_hobbies, name="userhobbies"),
+    path('api/hobbies/<int:hobby_id>/', views.delete_hobby, name="delete_hobby"),
+    path('api/hobbies/add/', views.add_hobby, name="add_hobby"),
+    path('api/hobbies/bulk/', views.bulk_hobbies, name="bulk_hobbies"),
+    path('api/hobbies/create/', views.create_hobby, name="create_hobby"),
+    path('api/hobbies/search', views.hobby_search, name="hobby_search"),
+    path('api/hobbies/search/', views.hobby_search, name="hobby_search"),
+    path('api/hobbies/popular', views.popular_hobbies, name="popular_hobbies"),
+    path('api/hobbies/popular/', views.popular_hobbies, name="popular_hobbies"),
+    path('api/all-hobbies/', views.all_hobbies, name="all_hobbies"),
+    path('api/all-hobbies/export/', views.export_hobbies, name="export_hobbies"),
+    path('api/users/', views.users, name="users"),
+    path('api/page-views/', views.page_views, name="page_views"),
+    path('api/similar-users/', views.similar_users, name="similar_users"),
+]
+
 urlpatterns = [
     path('', views.homepage, name=""),
     path('login/', views.login, name="login"),
     path('register/', views.register, name="register"),
     path('logout', views.logout_view, name='logout'),
     path('dashboard', login_required(views.main_spa), name="dashboard"),
-
-    path('api/profile/', login_required(views.profile), name='profile'),
-    path('api/profile', login_required(views.profile), name='profile'),
-    path('api/update-password', login_required(views.update_password), name='update_password'),
-    
-    path('api/hobbies/', login_required(views.user_hobbies), name="userhobbies"),
-    path('api/hobbies/<int:hobby_id>/', login_required(views.delete_hobby), name="delete_hobby"),
-    path('api/hobbies/add/', login_required(views.add_hobby), name="add_hobby"),
-    path('api/hobbies/create/', login_required(views.create_hobby), name="create_hobby"),
-    path('api/all-hobbies/', login_required(views.all_hobbies), name="all_hobbies"),
-]
\ No newline at end of file
+    *api_urlpatterns,
+]
@@ -1,24 +1,49 @@
 from django.http import HttpResponse, HttpRequest, JsonResponse
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
 from django.contrib.auth.models import auth
-from django.contrib.auth import authenticate, update_session_auth_hash, logout
-from .forms import CreateUserForm, LoginForm
-from .models import Hobby
-from django.contrib.auth.password_validation import validate_password
+from django.contrib.auth import update_session_auth_hash, logout
+from .models import CustomUser, Hobby
+from . import counters
+from .cache import catalogue_key, catalogue_version, get_or_compute, user_hobby_rows
+from .filters import age_filter, age_on
+from .pagination import (
+    InvalidCursor, decode_cursor, encode_cursor, get_limit, paginate, paginate_by_date, paginate_rows, paginated_response,
+)
+from .popularity import popular_hobbies as most_popular_hobbies
+from .ratelimit import ip_key, login_key, rate_limit
+from .responses import FastJsonResponse, streaming_json_response
 from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
 import json
 from datetime import datetime
+from typing import Optional
+
+# Forms, the SPA shell, hobby search, matching and password validation are
+# imported inside the views that use them, so API workers (see
+# project.settings_api) start without loading them
+
+
+HOBBY_PAGE_SIZE = 100
+HOBBY_SEARCH_SIZE = 10
+POPULAR_HOBBIES_SIZE = 10
 
 
 def main_spa(request: HttpRequest) -> HttpResponse:
-    return render(request, 'api/spa/index.html', {})
+    from . import spa
+
+    counters.increment('dashboard')
+    return HttpResponse(spa.shell())
 
 
 def homepage(request: HttpRequest) -> HttpResponse:
     return render(request, 'api/homepage.html')
 
 def homepage(request: HttpRequest) -> HttpResponse:
+    counters.increment('homepage')
     if request.user.is_authenticated:
         return redirect('dashboard') 
     return render(request, 'api/homepage.html')
@@ -28,7 +53,10 @@ def logout_view(request: HttpRequest) -> HttpResponse:
     return redirect('')
 
 
+@rate_limit('register', json=False)
 def register(request: HttpRequest) -> HttpResponse:
+    from .forms import CreateUserForm
+
     form = CreateUserForm()
     if request.method == "POST":
         form = CreateUserForm(request.POST)
@@ -39,17 +67,20 @@ def register(request: HttpRequest) -> HttpResponse:
     return render(request, 'api/register.html', context=context)
 
 
+# Per username so one client cannot lock out everybody else, and per client
+# IP with a higher limit so that cycling through usernames does not get round it
+@rate_limit('login_ip', json=False, key=ip_key)
+@rate_limit('login', json=False, key=login_key)
 def login(request: HttpRequest) -> HttpResponse:
+    from .forms import LoginForm
+
     form = LoginForm()
     if request.method == 'POST':
         form = LoginForm(request, data=request.POST)
+        # is_valid() already authenticates, so the password is hashed once
         if form.is_valid():
-            username = request.POST.get('username')
-            password = request.POST.get('password')
-            user = authenticate(request, username=username, password=password)
-            if user is not None:
-                auth.login(request, user)
-                return redirect("dashboard")
+            auth.login(request, form.get_user())
+            return redirect("dashboard")
     context = {'loginform': form}
     return render(request, 'api/login.html', context=context)
 
@@ -74,14 +105,18 @@ def profile(request: HttpRequest) -> JsonResponse:
             user.email = data.get('email', user.email)
             date_of_birth = data.get('date_of_birth')
             user.date_of_birth = datetime.strptime(date_of_birth, '%Y-%m-%d').date()
-            user.save()
+            # Only what was edited, ``user`` may come from the cache and be stale otherwise
+            user.save(update_fields=['name', 'email', 'date_of_birth'])
             return JsonResponse({'message': 'Profile updated successfully'})
         except Exception as e:
             return JsonResponse({'error': str(e)}, status=400)
 
 
 @login_required
+@rate_limit('update_password')
 def update_password(request: HttpRequest) -> JsonResponse:
+    from django.contrib.auth.password_validation import validate_password
+
     if request.method == 'POST':
         data = json.loads(request.body)
         current_password = data.get('current_password')
@@ -96,7 +131,7 @@ def update_password(request: HttpRequest) -> JsonResponse:
             return JsonResponse({'error': e.messages}, status=400)
 
         user.set_password(new_password)
-        user.save()
+        user.save(update_fields=['password'])
         update_session_auth_hash(request, user)
 
         return JsonResponse({'message': 'Password updated successfully.'})
@@ -106,23 +141,90 @@ def update_password(request: HttpRequest) -> JsonResponse:
 @login_required
 def user_hobbies(request: HttpRequest) -> JsonResponse:
     if request.method == 'GET':
-        user = request.user
-        hobbies = user.hobbies.all()
+        try:
+            hobbies, cursor = paginate_rows(request, user_hobby_rows(request.user), default=HOBBY_PAGE_SIZE)
+        except InvalidCursor as e:
+            return JsonResponse({'error': str(e)}, status=400)
         hobbies_data = [
-            {"id": hobby.id, "name": hobby.name} for hobby in hobbies
+            {"id": hobby_id, "name": name} for hobby_id, name in hobbies
         ]
-        return JsonResponse(hobbies_data, safe=False)
+        return paginated_response(request, hobbies_data, cursor)
     return JsonResponse({'error': 'Invalid request method'}, status=405)  
 
 
+def hobby_page_key(request: HttpRequest, version: int) -> str:
+    """
+    Cache key, and ETag, of the all-hobbies page ``request`` asks for.
+
+    Built from the decoded cursor and limit only, so other query parameters
+    cannot fill the cache with copies of the same page. Raises
+    ``InvalidCursor`` for a cursor that was not handed out.
+    """
+    after = decode_cursor(request.GET.get('cursor'))
+    limit = get_limit(request, default=HOBBY_PAGE_SIZE)
+    return catalogue_key(version, 'page', after[0] if after else 0, limit)
+
+
+def all_hobbies_etag(request: HttpRequest) -> Optional[str]:
+    # One ETag per catalogue version and page, so a revalidation is answered
+    # with 304 after a single primary key lookup. The view reuses the key
+    try:
+        request._hobby_page_key = hobby_page_key(request, catalogue_version())
+    except InvalidCursor:
+        return None
+    return request._hobby_page_key
+
+
 @login_required
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=all_hobbies_etag)
 def all_hobbies(request: HttpRequest) -> JsonResponse:
     if request.method == 'GET':
-        hobbies = Hobby.objects.all()
-        hobbies_data = [
-            {"id": hobby.id, "name": hobby.name} for hobby in hobbies
-        ]
-        return JsonResponse(hobbies_data, safe=False)
+        def compute_page() -> tuple[list[dict], Optional[str]]:
+            hobbies, cursor = paginate(request, Hobby.objects.all(), 'id', 'name', default=HOBBY_PAGE_SIZE)
+            hobbies_data = [
+                {"id": hobby_id, "name": name} for hobby_id, name in hobbies
+            ]
+            return hobbies_data, cursor
+
+        try:
+            key = getattr(request, '_hobby_page_key', None) or hobby_page_key(request, catalogue_version())
+            # Requests missing the same page at once share a single query
+            page = get_or_compute(key, compute_page)
+        except InvalidCursor as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        return paginated_response(request, *page)
+    return JsonResponse({'error': 'Invalid request method'}, status=405)
+
+
+@login_required
+def export_hobbies(request: HttpRequest) -> HttpResponse:
+    # The whole catalogue in one streamed response, for clients that need all
+    # of it and would otherwise walk every page of all_hobbies
+    if request.method == 'GET':
+        rows = Hobby.objects.order_by('id').values_list('id', 'name').iterator(chunk_size=2000)
+        return streaming_json_response(('id', 'name'), rows)
+    return JsonResponse({'error': 'Invalid request method'}, status=405)
+
+
+@login_required
+def hobby_search(request: HttpRequest) -> JsonResponse:
+    from .search import search_hobbies
+
+    if request.method == 'GET':
+        query = request.GET.get('q', '').strip()
+        if not query:
+            return JsonResponse([], safe=False)
+        limit = get_limit(request, default=HOBBY_SEARCH_SIZE)
+        return FastJsonResponse(search_hobbies(query, limit), safe=False)
+    return JsonResponse({'error': 'Invalid request method'}, status=405)
+
+
+@login_required
+def popular_hobbies(request: HttpRequest) -> JsonResponse:
+    if request.method == 'GET':
+        limit = get_limit(request, default=POPULAR_HOBBIES_SIZE)
+        return FastJsonResponse(most_popular_hobbies(limit), safe=False)
     return JsonResponse({'error': 'Invalid request method'}, status=405)
 
 
@@ -139,13 +241,22 @@ def delete_hobby(request: HttpRequest, hobby_id: int) -> JsonResponse:
 
 
 @login_required
+@rate_limit('create_hobby')
 def create_hobby(request: HttpRequest) -> JsonResponse:
     if request.method == "POST":
         data = json.loads(request.body)
         name = data.get("name")
-        if name:
-            hobby = Hobby.objects.create(name=name)
-            return JsonResponse({"id": hobby.id, "name": hobby.name}, status=201)
+        names = data.get("names")
+        if isinstance(name, str) and name.strip():
+            hobbies, missing = Hobby.objects.resolve([name])
+            hobby = next(iter(hobbies.values()))
+            return JsonResponse({"id": hobby.id, "name": hobby.name}, status=201 if missing else 200)
+        if isinstance(names, list) and names and all(isinstance(name, str) for name in names):
+            hobbies, missing = Hobby.objects.resolve(names)
+            hobbies_data = [
+                {"id": hobby.id, "name": hobby.name} for hobby in sorted(hobbies.values(), key=lambda h: h.id)
+            ]
+            return JsonResponse(hobbies_data, safe=False, status=201 if missing else 200)
         return JsonResponse({"error": "Invalid data"}, status=400)
     return JsonResponse({"error": "Invalid method"}, status=405)
 
@@ -160,4 +271,99 @@ def add_hobby(request: HttpRequest) -> JsonResponse:
             request.user.hobbies.add(hobby)
             return JsonResponse({"message": "Hobby added successfully"}, status=200)
         return JsonResponse({"error": "Hobby ID is required"}, status=400)
-    return JsonResponse({"error": "Invalid method"}, status=405)
\ No newline at end of file
+    return JsonResponse({"error": "Invalid method"}, status=405)
+
+
+@login_required
+def similar_users(request: HttpRequest) -> JsonResponse:
+    from .matching import similar_users as rank_similar_users
+
+    if request.method == 'GET':
+        try:
+            after = decode_cursor(request.GET.get('cursor'), size=2)
+            condition = age_filter(request)
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        limit = get_limit(request)
+        users_data = rank_similar_users(request.user, limit, tuple(after) if after else None, condition)
+        cursor = None
+        if len(users_data) == limit:
+            cursor = encode_cursor([users_data[-1]['shared'], users_data[-1]['id']])
+        return paginated_response(request, users_data, cursor)
+    return JsonResponse({'error': 'Invalid request method'}, status=405)
+
+
+@login_required
+def users(request: HttpRequest) -> JsonResponse:
+    if request.method == 'GET':
+        try:
+            condition = age_filter(request)
+            queryset = CustomUser.objects.filter(condition, is_active=True).exclude(id=request.user.id)
+            if condition:
+                # Walk the birth date range in the order of its (date_of_birth, id) index
+                rows, cursor = paginate_by_date(request, queryset, 'id', 'date_of_birth', 'username', 'name')
+            else:
+                rows, cursor = paginate(request, queryset, 'id', 'date_of_birth', 'username', 'name')
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        # Only the age, other users' birth dates are not theirs to see
+        today = timezone.localdate()
+        users_data = [
+            {
+                'id': user_id,
+                'username': username,
+                'name': name,
+                'age': age_on(today, date_of_birth) if date_of_birth else None,
+            }
+            for user_id, date_of_birth, username, name in rows
+        ]
+        return paginated_response(request, users_data, cursor)
+    return JsonResponse({'error': 'Invalid request method'}, status=405)
+
+
+@login_required
+def bulk_hobbies(request: HttpRequest) -> JsonResponse:
+    """
+    Change several of the user's hobbies at once.
+
+    Accepts either ``{"hobby_ids": [...]}`` with the complete desired set, or
+    ``{"add": [...], "remove": [...]}``. All ids are validated with a single
+    query and the difference is applied with one insert and one delete on the
+    through table, inside one transaction.
+    """
+    if request.method == "POST":
+        try:
+            data = json.loads(request.body)
+            desired = data.get("hobby_ids")
+            add = set(data.get("add", []) if desired is None else desired)
+            remove = set(data.get("remove", []))
+        except (ValueError, AttributeError, TypeError):
+            return JsonResponse({"error": "Invalid data"}, status=400)
+        # bool is an int subclass, but true is no hobby id
+        if not all(type(hobby_id) is int for hobby_id in add | remove):
+            return JsonResponse({"error": "Hobby IDs must be integers"}, status=400)
+        missing = add - set(Hobby.objects.filter(id__in=add).values_list("id", flat=True))
+        if missing:
+            return JsonResponse({"error": "Hobby not found", "hobby_ids": sorted(missing)}, status=404)
+
+        user = request.user
+        with transaction.atomic():
+            current = set(user.hobbies.values_list("id", flat=True))
+            if desired is not None:
+                remove = current - add
+            added = add - current
+            removed = (remove - add) & current
+            if added:
+                user.hobbies.add(*added)
+            if removed:
+                user.hobbies.remove(*removed)
+        return JsonResponse({"added": sorted(added), "removed": sorted(removed)}, status=200)
+    return JsonResponse({"error": "Invalid method"}, status=405)
+
+
+@login_required
+def page_views(request: HttpRequest) -> JsonResponse:
+    if request.method == 'GET':
+        key = request.GET.get('key', 'homepage')
+        return JsonResponse({'key': key, 'count': counters.total(key)})
+    return JsonResponse({'error': 'Invalid request method'}, status=405)
\ No newline at end of file
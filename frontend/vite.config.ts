@@ -10,6 +10,8 @@ export default defineConfig(({ mode }) => ({
             : "/static/api/spa/",
     build: {
         emptyOutDir: true,
+        // Read by api/spa.py to link the hashed entry files
+        manifest: "manifest.json",
         outDir: "../api/static/api/spa",
     },
     plugins: [vue()],
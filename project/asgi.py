@@ -12,5 +12,9 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'project.settings')
+os.environ.setdefault('DJANGO_ROOT_URLCONF', 'project.urls_async')
+# Async views reach the database from whichever thread runs their sync code,
+# persistent connections would pile up in threads no request closes them in
+os.environ.setdefault('DATABASE_CONN_MAX_AGE', '0')
 
 application = get_asgi_application()
@@ -1,15 +1,41 @@
 import os
+from pathlib import Path
 
-from django.conf import settings
+
+# Same as settings.BASE_DIR, which is not importable while settings load
+BASE_DIR = Path(__file__).resolve().parent.parent
 
 
 engines = {
     'sqlite': 'django.db.backends.sqlite3',
-    'postgresql': 'django.db.backends.postgresql_psycopg2',
+    'postgresql': 'django.db.backends.postgresql',
     'mysql': 'django.db.backends.mysql',
 }
 
 
+def env_bool(name, default=False):
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def env_number(name, default, cast=int):
+    value = os.getenv(name)
+    return cast(value) if value not in (None, '') else default
+
+
+def pool_options():
+    # Passed to psycopg_pool.ConnectionPool, requires psycopg 3 with the pool extra
+    return {
+        'min_size': env_number('DATABASE_POOL_MIN_SIZE', 2),
+        'max_size': env_number('DATABASE_POOL_MAX_SIZE', 10),
+        'timeout': env_number('DATABASE_POOL_TIMEOUT', 10.0, float),
+        'max_idle': env_number('DATABASE_POOL_MAX_IDLE', 600.0, float),
+        'max_lifetime': env_number('DATABASE_POOL_MAX_LIFETIME', 3600.0, float),
+    }
+
+
 def config():
     service_name = os.getenv('DATABASE_SERVICE_NAME', '').upper().replace('-', '_')
     if service_name:
@@ -18,12 +44,73 @@ def config():
         engine = engines['sqlite']
     name = os.getenv('DATABASE_NAME')
     if not name and engine == engines['sqlite']:
-        name = os.path.join(settings.BASE_DIR, 'db.sqlite3')
-    return {
+        name = os.path.join(BASE_DIR, 'db.sqlite3')
+    database = {
         'ENGINE': engine,
         'NAME': name,
         'USER': os.getenv('DATABASE_USER'),
         'PASSWORD': os.getenv('DATABASE_PASSWORD'),
         'HOST': os.getenv('{}_SERVICE_HOST'.format(service_name)),
         'PORT': os.getenv('{}_SERVICE_PORT'.format(service_name)),
+        # Keep connections open between requests and check them before reuse
+        # instead of reconnecting on every request. Off under ASGI, see asgi.py
+        'CONN_MAX_AGE': env_number('DATABASE_CONN_MAX_AGE', 60),
+        'CONN_HEALTH_CHECKS': env_bool('DATABASE_CONN_HEALTH_CHECKS', True),
+        'OPTIONS': {},
     }
+    if engine == engines['sqlite']:
+        # SQLite has one writer at a time. Transactions take the write lock
+        # when they begin, rather than failing with "database is locked" when
+        # a read turns into a write, and wait up to the timeout for it, so
+        # the request and task threads queue up instead of erroring out
+        database['OPTIONS'].update({
+            'transaction_mode': 'IMMEDIATE',
+            'timeout': env_number('DATABASE_SQLITE_TIMEOUT', 20, float),
+        })
+    if engine == engines['postgresql'] and env_bool('DATABASE_POOL'):
+        # A pool replaces persistent connections, Django refuses both at once
+        database['CONN_MAX_AGE'] = 0
+        database['OPTIONS']['pool'] = pool_options()
+    return database
+
+
+def replicas(primary):
+    """
+    Read replica aliases listed in ``DATABASE_REPLICAS``, e.g. "replica1,replica2".
+
+    Each replica copies the primary's settings and overrides them with
+    ``DATABASE_<ALIAS>_NAME``, ``_HOST``, ``_PORT``, ``_USER`` and ``_PASSWORD``,
+    so two local SQLite files only need the NAME of the second one.
+    """
+    aliases = [alias.strip() for alias in os.getenv('DATABASE_REPLICAS', '').split(',') if alias.strip()]
+    databases = {}
+    for alias in aliases:
+        prefix = 'DATABASE_{}_'.format(alias.upper().replace('-', '_'))
+        database = dict(primary, OPTIONS=dict(primary['OPTIONS']))
+        for key in ('NAME', 'HOST', 'PORT', 'USER', 'PASSWORD'):
+            if os.getenv(prefix + key) is not None:
+                database[key] = os.getenv(prefix + key)
+        # Tests run against the primary only
+        database['TEST'] = {'MIRROR': 'default'}
+        databases[alias] = database
+    return databases
+
+
+def pool_stats(alias='default'):
+    """
+    Statistics of the connection pool behind ``alias``, or None without one.
+
+    ``requests_wait_ms`` is the total time requests spent waiting for a free
+    connection, so its growth rate divided by ``requests_num`` gives the
+    average pool wait per checkout.
+    """
+    from django.db import connections
+
+    pool = getattr(connections[alias], 'pool', None)
+    if pool is None:
+        return None
+    stats = pool.get_stats()
+    stats['requests_wait_ms_avg'] = (
+        stats.get('requests_wait_ms', 0) / stats['requests_num'] if stats.get('requests_num') else 0.0
+    )
+    return stats
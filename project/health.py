@@ -0,0 +1,47 @@
+"""
+Health checks, routed by every URL configuration.
+
+``/health`` only says that the process is up and is open to everyone.
+``/health/db`` shows the connection pool statistics, which tell a lot about
+the load on the site, so it only answers staff users, clients in
+``HEALTH_ALLOWED_NETWORKS`` and requests with an ``Authorization: Bearer``
+header carrying ``HEALTH_TOKEN``.
+"""
+import ipaddress
+
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
+from django.utils.crypto import constant_time_compare
+
+from api.ratelimit import client_ip
+from . import database
+
+
+def health(request):
+    return HttpResponse("OK")
+
+
+def health_db(request):
+    if not may_see_stats(request):
+        return JsonResponse({'error': 'Forbidden'}, status=403)
+    return JsonResponse({'pool': database.pool_stats()})
+
+
+def may_see_stats(request):
+    token = getattr(settings, 'HEALTH_TOKEN', '')
+    scheme, _, value = request.headers.get('Authorization', '').partition(' ')
+    if token and scheme.lower() == 'bearer' and constant_time_compare(value.strip(), token):
+        return True
+    networks = getattr(settings, 'HEALTH_ALLOWED_NETWORKS', [])
+    if networks:
+        try:
+            # The address the trusted proxy saw when RATE_LIMIT_IP_HEADER is set
+            address = ipaddress.ip_address(client_ip(request))
+        except ValueError:
+            address = None
+        if address is not None and any(
+            address in ipaddress.ip_network(network, strict=False) for network in networks
+        ):
+            return True
+    user = getattr(request, 'user', None)
+    return user is not None and user.is_authenticated and user.is_staff
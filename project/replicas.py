@@ -0,0 +1,91 @@
+"""
+Send reads to read replicas and writes to the primary.
+
+A request is pinned to the primary as soon as it writes, and the
+``replica_pinning_middleware`` keeps the same client pinned for
+``REPLICA_PIN_SECONDS`` afterwards, so users always read their own writes
+even while the replicas are catching up. Outside of a request, e.g. in
+management commands, everything goes to the primary.
+"""
+import random
+from contextvars import ContextVar
+from typing import Optional
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.utils.decorators import sync_and_async_middleware
+
+
+PIN_COOKIE = 'db_primary'
+
+
+class RoutingState:
+    __slots__ = ('pinned', 'wrote')
+
+    def __init__(self, pinned: bool) -> None:
+        self.pinned = pinned
+        self.wrote = False
+
+
+# Holds a mutable object rather than a flag, so that writes made in a
+# sync_to_async thread are seen by the request that started them
+_state: ContextVar[Optional[RoutingState]] = ContextVar('db_routing', default=None)
+
+
+def replica_aliases() -> list[str]:
+    return [alias for alias in settings.DATABASES if alias != 'default']
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        aliases = replica_aliases()
+        if state is None or state.pinned or not aliases:
+            return 'default'
+        return random.choice(aliases)
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.pinned = state.wrote = True
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == 'default'
+
+
+def _begin(request) -> RoutingState:
+    return RoutingState(pinned=request.method not in ('GET', 'HEAD', 'OPTIONS')
+                        or PIN_COOKIE in request.COOKIES)
+
+
+def _finish(state: RoutingState, response):
+    if state.wrote and replica_aliases():
+        response.set_cookie(PIN_COOKIE, '1', max_age=settings.REPLICA_PIN_SECONDS,
+                            httponly=True, samesite='Lax')
+    return response
+
+
+@sync_and_async_middleware
+def replica_pinning_middleware(get_response):
+    if iscoroutinefunction(get_response):
+        async def middleware(request):
+            state = _begin(request)
+            token = _state.set(state)
+            try:
+                return _finish(state, await get_response(request))
+            finally:
+                _state.reset(token)
+    else:
+        def middleware(request):
+            state = _begin(request)
+            token = _state.set(state)
+            try:
+                return _finish(state, get_response(request))
+            finally:
+                _state.reset(token)
+    return middleware
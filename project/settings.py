@@ -15,6 +15,8 @@ import os
 
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
 AUTH_USER_MODEL = 'api.CustomUser'
 
 
@@ -56,19 +58,29 @@ MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    # Static files are answered before sessions and authentication run
+    'api.spa.StaticFilesMiddleware',
+    'project.replicas.replica_pinning_middleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'api.middleware.CachedAuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
 ]
 
+# Opt-in per-request query and timing metrics, see api.middleware
+if os.getenv('REQUEST_METRICS', '').lower() in ('1', 'true', 'yes', 'on'):
+    MIDDLEWARE.insert(0, 'api.middleware.RequestMetricsMiddleware')
+
+REQUEST_METRICS_QUERY_BUDGET = int(os.getenv('REQUEST_METRICS_QUERY_BUDGET', '20'))
+REQUEST_METRICS_TIME_BUDGET_MS = float(os.getenv('REQUEST_METRICS_TIME_BUDGET_MS', '200'))
+
 CORS_ALLOW_ALL_ORIGINS = True
 
 
 
-ROOT_URLCONF = 'project.urls'
+# The ASGI entry point switches this to project.urls_async
+ROOT_URLCONF = os.getenv('DJANGO_ROOT_URLCONF', 'project.urls')
 
 TEMPLATES = [
     {
@@ -96,6 +108,122 @@ WSGI_APPLICATION = 'project.wsgi.application'
 DATABASES = {
     'default': database.config()
 }
+DATABASES.update(database.replicas(DATABASES['default']))
+
+DATABASE_ROUTERS = ['project.replicas.PrimaryReplicaRouter']
+
+# How long a user keeps reading from the primary after writing something
+REPLICA_PIN_SECONDS = int(os.getenv('DATABASE_REPLICA_PIN_SECONDS', '5'))
+
+# Besides staff users, /health/db shows the pool statistics to clients in
+# these networks, comma separated e.g. 10.0.0.0/8, and to requests with an
+# "Authorization: Bearer <HEALTH_TOKEN>" header
+HEALTH_ALLOWED_NETWORKS = [
+    network.strip() for network in os.getenv('HEALTH_ALLOWED_NETWORKS', '').split(',') if network.strip()
+]
+HEALTH_TOKEN = os.getenv('HEALTH_TOKEN', '')
+
+
+# Cache
+# https://docs.djangoproject.com/en/stable/topics/cache/
+# Local memory by default, any other backend can be plugged in through the
+# environment, e.g. django.core.cache.backends.redis.RedisCache
+
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', ''),
+        'TIMEOUT': int(os.getenv('CACHE_TIMEOUT', '300')),
+    }
+}
+
+# Local memory and dummy caches are private to each process, so anything
+# that has to look the same to every worker must not be kept in them
+PROCESS_LOCAL_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+SHARED_CACHE = CACHES['default']['BACKEND'] not in PROCESS_LOCAL_CACHES
+
+# With a shared cache, sessions are read from the cache and only fall back to
+# the database on a miss, and the authenticated user and their hobbies are
+# cached for AUTH_USER_CACHE_TIMEOUT seconds, invalidated as soon as they
+# change. Otherwise every worker would keep its own copy, so a logout or
+# password change would go unnoticed by the others
+SESSION_ENGINE = os.getenv(
+    'SESSION_ENGINE',
+    'django.contrib.sessions.backends.cached_db' if SHARED_CACHE else 'django.contrib.sessions.backends.db',
+)
+AUTH_USER_CACHE = os.getenv('AUTH_USER_CACHE', str(SHARED_CACHE)).lower() in ('1', 'true', 'yes', 'on')
+AUTH_USER_CACHE_TIMEOUT = int(os.getenv('AUTH_USER_CACHE_TIMEOUT', '60'))
+
+if not SHARED_CACHE:
+    if SESSION_ENGINE in ('django.contrib.sessions.backends.cache', 'django.contrib.sessions.backends.cached_db'):
+        raise ImproperlyConfigured(
+            f'SESSION_ENGINE={SESSION_ENGINE} needs a cache shared by all workers, not '
+            f'{CACHES["default"]["BACKEND"]}, set CACHE_BACKEND'
+        )
+    if AUTH_USER_CACHE:
+        raise ImproperlyConfigured(
+            f'AUTH_USER_CACHE needs a cache shared by all workers, not '
+            f'{CACHES["default"]["BACKEND"]}, set CACHE_BACKEND'
+        )
+
+
+# Token bucket rate limits per user, or per client IP when anonymous, see
+# api.ratelimit. Each is "<requests>/<second|minute|hour|day>", empty turns
+# one off. Logins are limited per username and client IP, so that one
+# client cannot lock out everybody else, and with login_ip per client IP
+# alone, so that trying a new username every time does not get round it.
+# Behind a reverse proxy REMOTE_ADDR is the proxy, RATE_LIMIT_IP_HEADER has
+# to name the META key of the header it sets, e.g. HTTP_X_FORWARDED_FOR
+RATE_LIMITS = {
+    'login': os.getenv('RATE_LIMIT_LOGIN', '10/minute'),
+    'login_ip': os.getenv('RATE_LIMIT_LOGIN_IP', '20/minute'),
+    'register': os.getenv('RATE_LIMIT_REGISTER', '5/minute'),
+    'update_password': os.getenv('RATE_LIMIT_UPDATE_PASSWORD', '5/minute'),
+    'create_hobby': os.getenv('RATE_LIMIT_CREATE_HOBBY', '30/minute'),
+}
+RATE_LIMIT_IP_HEADER = os.getenv('RATE_LIMIT_IP_HEADER', '')
+
+# Buckets have a cache of their own, so that other entries cannot push them
+# out. Like the default cache it has to be shared for the limits to apply
+# across workers rather than per worker
+CACHES['ratelimit'] = {
+    'BACKEND': os.getenv('RATE_LIMIT_CACHE_BACKEND', CACHES['default']['BACKEND']),
+    'LOCATION': os.getenv('RATE_LIMIT_CACHE_LOCATION', CACHES['default']['LOCATION']),
+    'KEY_PREFIX': 'ratelimit',
+}
+if CACHES['ratelimit']['BACKEND'] in PROCESS_LOCAL_CACHES:
+    # Local memory caches with the same LOCATION share their entries
+    CACHES['ratelimit']['LOCATION'] = 'ratelimit'
+    CACHES['ratelimit']['OPTIONS'] = {'MAX_ENTRIES': int(os.getenv('RATE_LIMIT_CACHE_ENTRIES', '100000'))}
+
+
+# Page view counters are buffered in memory, or in the cache when it is shared,
+# and flushed into this many shard rows every PAGEVIEW_FLUSH_INTERVAL seconds,
+# or once PAGEVIEW_FLUSH_COUNT views are pending
+
+PAGEVIEW_SHARDS = int(os.getenv('PAGEVIEW_SHARDS', '8'))
+PAGEVIEW_FLUSH_INTERVAL = float(os.getenv('PAGEVIEW_FLUSH_INTERVAL', '5'))
+PAGEVIEW_FLUSH_COUNT = int(os.getenv('PAGEVIEW_FLUSH_COUNT', '100'))
+
+# Background tasks, see api.queue. Run a worker with `python manage.py run_tasks`,
+# or set TASKS_EAGER to run every task inline where it is enqueued. That is the
+# default with DEBUG so that a development server works without a worker
+TASKS_EAGER = os.getenv('TASKS_EAGER', str(DEBUG)).lower() in ('1', 'true', 'yes', 'on')
+TASKS_CONCURRENCY = int(os.getenv('TASKS_CONCURRENCY', '4'))
+TASKS_LEASE_SECONDS = float(os.getenv('TASKS_LEASE_SECONDS', '300'))
+
+# Matches kept per user for /api/similar-users/, see api.matching. They are
+# brought up to date by the task queue after someone's hobbies change
+MATCHING_TOP_K = int(os.getenv('MATCHING_TOP_K', '100'))
+
+# Server-sent events at /api/events/ (ASGI only), see api.events. The default
+# broker only reaches clients connected to the same process
+EVENTS_BROKER = os.getenv('EVENTS_BROKER', 'api.events.LocalBroker')
+EVENTS_HEARTBEAT_SECONDS = float(os.getenv('EVENTS_HEARTBEAT_SECONDS', '15'))
+EVENTS_QUEUE_SIZE = int(os.getenv('EVENTS_QUEUE_SIZE', '100'))
 
 
 # Password validation
@@ -117,6 +245,37 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Password hashing
+# https://docs.djangoproject.com/en/stable/topics/auth/passwords/
+#
+# New passwords use PASSWORD_HASHER ("pbkdf2", "scrypt" or "argon2"), the
+# others stay listed so existing hashes still verify and are upgraded on login
+
+PASSWORD_HASHER = os.getenv('PASSWORD_HASHER', 'pbkdf2')
+
+_password_hashers = {
+    'pbkdf2': 'api.hashers.PBKDF2PasswordHasher',
+    'scrypt': 'api.hashers.ScryptPasswordHasher',
+    'argon2': 'api.hashers.Argon2PasswordHasher',
+}
+
+PASSWORD_HASHERS = [_password_hashers[PASSWORD_HASHER]] + [
+    hasher for name, hasher in _password_hashers.items() if name != PASSWORD_HASHER
+] + [
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+]
+
+# Costs of the hashers in api.hashers, values below Django's defaults are raised to them
+PBKDF2_ITERATIONS = int(os.getenv('PBKDF2_ITERATIONS', '0')) or None
+SCRYPT_WORK_FACTOR = int(os.getenv('SCRYPT_WORK_FACTOR', '0')) or None
+SCRYPT_BLOCK_SIZE = int(os.getenv('SCRYPT_BLOCK_SIZE', '0')) or None
+SCRYPT_PARALLELISM = int(os.getenv('SCRYPT_PARALLELISM', '0')) or None
+ARGON2_TIME_COST = int(os.getenv('ARGON2_TIME_COST', '0')) or None
+ARGON2_MEMORY_COST = int(os.getenv('ARGON2_MEMORY_COST', '0')) or None
+ARGON2_PARALLELISM = int(os.getenv('ARGON2_PARALLELISM', '0')) or None
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/stable/topics/i18n/
 
@@ -140,7 +299,20 @@ STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+# Fingerprinted copies with gzip and, when the Brotli package is installed,
+# brotli variants are written by collectstatic and served by WhiteNoise
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+
+# Fall back to the unhashed name for files missing from the manifest, e.g.
+# before collectstatic has run
+WHITENOISE_MANIFEST_STRICT = False
 
 INTERNAL_IPS = ['127.0.0.1']
 
@@ -0,0 +1,37 @@
+"""
+Lean settings for workers that only serve the JSON API.
+
+Used through ``project.wsgi_api``, e.g. ``gunicorn project.wsgi_api``, behind
+a proxy that sends ``/api/`` and ``/health`` there and everything else to the
+regular workers. The admin, messages, staticfiles and CORS apps are not
+loaded, no template engine is configured, and only the middleware the API
+views rely on (sessions, CSRF, authentication and replica pinning) runs.
+"""
+from .settings import *  # noqa: F401,F403
+from .settings import INSTALLED_APPS, MIDDLEWARE
+
+
+INSTALLED_APPS = [
+    app for app in INSTALLED_APPS
+    if app not in (
+        'django.contrib.admin',
+        'django.contrib.messages',
+        'django.contrib.staticfiles',
+        'corsheaders',
+    )
+]
+
+MIDDLEWARE = [
+    middleware for middleware in MIDDLEWARE
+    if middleware not in (
+        'corsheaders.middleware.CorsMiddleware',
+        'django.middleware.common.CommonMiddleware',
+        'api.spa.StaticFilesMiddleware',
+        'django.contrib.messages.middleware.MessageMiddleware',
+        'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    )
+]
+
+TEMPLATES = []
+
+ROOT_URLCONF = 'project.urls_api'
@@ -16,11 +16,12 @@ Including another URLconf
 from django.conf import settings
 from django.contrib import admin
 from django.urls import include, path
-from django.http import HttpResponse
+from . import health
 
 
 urlpatterns = [
     path('', include('api.urls')),
-    path('health', lambda request: HttpResponse("OK")),
+    path('health', health.health),
+    path('health/db', health.health_db),
     path('admin/', admin.site.urls),
 ]
@@ -0,0 +1,17 @@
+"""
+Root URL configuration of the lean API profile, see ``project.settings_api``.
+
+Only the JSON API and the health checks are routed, so neither the admin nor
+the HTML pages are imported.
+"""
+from django.urls import path
+
+from api.urls import api_urlpatterns
+from . import health
+
+
+urlpatterns = [
+    *api_urlpatterns,
+    path('health', health.health),
+    path('health/db', health.health_db),
+]
@@ -0,0 +1,15 @@
+"""
+Root URL configuration used by the ASGI application.
+
+The async JSON API views take precedence, everything else falls through to
+the regular ``project.urls`` patterns.
+"""
+from django.urls import include, path
+
+from . import urls
+
+
+urlpatterns = [
+    path('', include('api.async_urls')),
+    *urls.urlpatterns,
+]
@@ -0,0 +1,13 @@
+"""
+WSGI config for workers that only serve the JSON API.
+
+Same as ``project.wsgi`` with the lean ``project.settings_api`` settings.
+"""
+
+import os
+
+from django.core.wsgi import get_wsgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'project.settings_api')
+
+application = get_wsgi_application()